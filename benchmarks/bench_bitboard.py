@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Compare bitboard queries with cell by cell scans on mid-game boards."""
+
+import random
+import timeit
+
+from minesweeper.logic.engine import bitCount
+from minesweeper.logic.field import Field
+from minesweeper.util.minepoint import Mask, Flag, Value
+
+
+def midGame(width, height, percent, seed):
+    """Return field with some regions opened and some bombs flagged."""
+    field = Field(width, height, percent, "hexagon", seed=seed)
+    rnd = random.Random(seed)
+    bombs = list(field.bombIndices())
+    for index in rnd.sample(bombs, len(bombs) // 4):
+        field.toggleFlag(field.point(index))
+    empty = [index for index, raw in enumerate(field.cells) if raw == 0]
+    for index in rnd.sample(empty, min(len(empty), 20)):
+        field.reveal(field.point(index))
+    return field
+
+
+def scanWin(field):
+    """Win check over every cell."""
+    for index in range(field.size):
+        cell = field.cellAt(index)
+        if cell == Flag.sure and cell != Value.bomb:
+            return False
+        if cell != Mask.opened and cell != Flag.sure and cell != Value.barrier:
+            return False
+    return True
+
+
+def bitWin(field):
+    """Win check with bitboards."""
+    if field.flaggedBits & ~field.bombsBits:
+        return False
+    return field.openedBits | field.flaggedBits | field.barriersBits == field.allBits
+
+
+def scanFrontier(field):
+    """Not flagged bombs next to opened cells, cell by cell."""
+    found = []
+    for index in field.bombIndices():
+        if field.cellAt(index) == Flag.sure:
+            continue
+        if any(field.cellAt(near) == Mask.opened for near in field.neighborsOf(index)):
+            found.append(index)
+    return found
+
+
+def bitFrontier(field):
+    """Not flagged bombs next to opened cells with bitboards."""
+    return field.bombsBits & ~field.flaggedBits & field.adjacent(field.openedBits)
+
+
+def scanCount(field):
+    """Count flagged cells, cell by cell."""
+    return sum(field.cellAt(index) == Flag.sure for index in range(field.size))
+
+
+def bitFlagged(field):
+    """Count flagged cells with bitboard."""
+    return bitCount(field.flaggedBits)
+
+
+def main():
+    """Run benchmark."""
+    cases = [("win", scanWin, bitWin), ("frontier", scanFrontier, bitFrontier),
+             ("flagged", scanCount, bitFlagged)]
+    for width, height, percent in [(30, 16, 0.2), (200, 200, 0.15), (1000, 1000, 0.1)]:
+        field = midGame(width, height, percent, seed=1)
+        number = max(1, 100000 // field.size)
+        print(f"{width}x{height}, {percent:.0%} bombs")
+        for name, scan, bits in cases:
+            scanTime = timeit.timeit(lambda: scan(field), number=number) / number
+            # first bitboard query after a change builds bitboards from cells
+            field.setRaw(0, field.getRaw(0))
+            coldTime = timeit.timeit(lambda: bits(field), number=1)
+            warmTime = timeit.timeit(lambda: bits(field), number=number) / number
+            print(f"  {name:<9} scan {scanTime * 1000:8.3f} ms  "
+                  f"bits cold {coldTime * 1000:8.3f} ms  warm {warmTime * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Compare field cells codec with raw bytes and zlib on mid-game boards."""
+
+import random
+import timeit
+import zlib
+
+from minesweeper.logic import codec
+from minesweeper.logic.field import Field
+
+
+def midGame(width, height, percent, seed):
+    """Return field with some regions opened and some bombs flagged."""
+    field = Field(width, height, percent, seed=seed)
+    rnd = random.Random(seed)
+    bombs = list(field.bombIndices())
+    for index in rnd.sample(bombs, len(bombs) // 4):
+        field.toggleFlag(field.point(index))
+    empty = [index for index, raw in enumerate(field.cells) if raw == 0]
+    for index in rnd.sample(empty, min(len(empty), 20)):
+        field.reveal(field.point(index))
+    return field
+
+
+def bench(name, encode, decode, number=20):
+    """Print size and timings of codec."""
+    data = encode()
+    encTime = timeit.timeit(encode, number=number) / number
+    decTime = timeit.timeit(lambda: decode(data), number=number) / number
+    print(f"  {name:<8} {len(data):>9} bytes  "
+          f"encode {encTime * 1000:7.2f} ms  decode {decTime * 1000:7.2f} ms")
+
+
+def main():
+    """Run benchmark."""
+    for width, height, percent in [(30, 16, 0.2), (200, 200, 0.15), (1000, 1000, 0.1)]:
+        field = midGame(width, height, percent, seed=1)
+        cells = bytes(field.cells)
+        print(f"{width}x{height}, {percent:.0%} bombs")
+        bench("raw", lambda: cells, bytearray)
+        bench("zlib", lambda: zlib.compress(cells), zlib.decompress)
+        bench("rle", lambda: codec.encode(cells), codec.decode)
+        bench("rlefield", lambda: codec.encodeField(field),
+              lambda data: codec.decodeField(data, width, height))
+
+        field.toggleFlag(field.point(next(field.bombIndices())))
+        after = bytes(field.cells)
+        bench("delta", lambda: codec.encodeDelta(cells, after),
+              lambda delta: codec.applyDelta(bytearray(cells), delta))
+        bench("zlibdiff", lambda: zlib.compress(bytes(a ^ b for a, b in zip(cells, after))),
+              zlib.decompress, number=3)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Time handling of held move keys on boards of different size."""
+
+import contextlib
+import io
+import random
+import timeit
+
+from minesweeper.cli.game import Game
+from minesweeper.cli.screen import Screen
+from minesweeper.logic.field import Field
+
+
+def main(batch=40, number=200):
+    """Run benchmark."""
+    screen = Screen()
+    for width, height in ((30, 20), (100, 100), (300, 300)):
+        rnd = random.Random(5)
+        game = Game(Field(width, height, 0.15, seed=5))
+        bursts = [[rnd.choice("wasd")] * batch for _ in range(number)]
+        with contextlib.redirect_stdout(io.StringIO()):
+            screen.buffer(80, 24).clear()
+            game.draw()
+            screen.present()
+
+            def oneByOne():
+                for key in bursts[rnd.randrange(number)]:
+                    game.keyAction(key)
+                    game.draw()
+                    screen.present()
+
+            def batched():
+                game.keyActions(bursts[rnd.randrange(number)])
+                game.draw()
+                screen.present()
+
+            single = timeit.timeit(oneByOne, number=number) / number
+            folded = timeit.timeit(batched, number=number) / number
+            screen.unbuffer()
+        board = f"{width}x{height}"
+        print(f"{board:<8} {batch} keys: one by one {single * 1000:7.3f} ms,"
+              f" batched {folded * 1000:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
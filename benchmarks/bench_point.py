@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Compare Point with its previous dict based implementation."""
+
+import timeit
+
+from minesweeper.util.point import Point, PointPool
+
+
+class LegacyPoint:
+    """Previous Point implementation, only parts used in benchmark."""
+
+    @staticmethod
+    def __convert(val):
+        return val if isinstance(val, LegacyPoint) else LegacyPoint(val)
+
+    def __init__(self, val, y=None):
+        if y is None:
+            if isinstance(val, LegacyPoint):
+                self.x, self.y = val.x, val.y
+            elif isinstance(val, tuple) or isinstance(val, list):
+                self.x, self.y = int(val[0]), int(val[1])
+            else:
+                self.x, self.y = int(val), int(val)
+        else:
+            self.x, self.y = int(val), int(y)
+
+    def __add__(self, oth):
+        val = LegacyPoint.__convert(oth)
+        return LegacyPoint(self.x + val.x, self.y + val.y)
+
+    def __eq__(self, oth):
+        val = LegacyPoint.__convert(oth)
+        return self.x == val.x and self.y == val.y
+
+    def __hash__(self):
+        return hash(f'({self.x},{self.y})')
+
+
+def measure(case, number, repeat=7):
+    """Return best of repeated timings of case in microseconds, so noise is not counted."""
+    return min(timeit.repeat(case, number=number, repeat=repeat)) / number * 1e6
+
+
+def cases(cls):
+    """Return common Point operations for class."""
+    a, b = cls(3, 4), cls(-1, 1)
+    points = {cls(x, y) for x in range(30) for y in range(30)}
+    return {
+        "construct": lambda: cls(3, 4),
+        "hash": lambda: hash(a),
+        "add": lambda: a + b,
+        "equal": lambda: a == b,
+        "in set": lambda: a in points,
+    }
+
+
+def bench(number=100000, rounds=7):
+    """
+    Return timings of Point operations before and after in microseconds.
+
+    Both classes are timed in turns, so slow periods of machine affect them alike
+    """
+    before, after = cases(LegacyPoint), cases(Point)
+    best = {name: [float("inf"), float("inf")] for name in before}
+    for _ in range(rounds):
+        for name, timings in best.items():
+            timings[0] = min(timings[0], measure(before[name], number, 1))
+            timings[1] = min(timings[1], measure(after[name], number, 1))
+    return best
+
+
+def benchPool(number=200000):
+    """Return timings of lookups with fresh and pooled points in microseconds."""
+    pool = PointPool(900)
+    board = {pool.get(x, y): None for x in range(30) for y in range(30)}
+    fresh, pooled = Point(3, 4), pool.get(3, 4)
+    cases = {
+        "fresh get": lambda: board[Point(3, 4)],
+        "pooled get": lambda: board[pool.get(3, 4)],
+        "fresh key": lambda: board[fresh],
+        "pooled key": lambda: board[pooled],
+    }
+    return {name: measure(case, number) for name, case in cases.items()}, pool.hitRate
+
+
+def main():
+    """Run benchmark."""
+    print(f"{'operation':<10} {'before':>10} {'after':>10}")
+    for name, (before, after) in bench().items():
+        print(f"{name:<10} {before:>8.3f}us {after:>8.3f}us  x{before / after:.1f}")
+    timings, hitRate = benchPool()
+    print()
+    for name, timing in timings.items():
+        print(f"{name:<10} {timing:>8.3f}us")
+    print(f"pool hit rate {hitRate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Time first reveal of big empty region on rectangular fields."""
+
+import timeit
+
+from minesweeper.logic.field import Field
+
+
+def reveal(width, height, percent, seed=1):
+    """Return seconds and amount of cells of reveal from empty cell in the middle."""
+    field = Field(width, height, percent, seed=seed)
+    start = next(
+        index for index in range(field.size // 2, field.size) if field.getRaw(index) == 0
+    )
+    begin = timeit.default_timer()
+    revealed = field.reveal(field.point(start))
+    return timeit.default_timer() - begin, len(revealed)
+
+
+def main():
+    """Run benchmark."""
+    for width, height, percent in [
+        (30, 16, 0.1), (1000, 1000, 0.05), (2000, 2000, 0.05), (2000, 2000, 0),
+    ]:
+        timing, opened = reveal(width, height, percent)
+        print(f"{width}x{height}, {percent:.0%} bombs: "
+              f"{opened:>8} cells in {timing * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
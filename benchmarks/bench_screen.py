@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Compare terminal bytes written by direct and frame buffered cli drawing."""
+
+import contextlib
+import io
+import random
+
+from blessed import Terminal
+
+import minesweeper.cli.screen as screenModule
+from minesweeper.cli.game import Game
+from minesweeper.cli.screen import Screen
+from minesweeper.logic.field import Field
+
+
+def play(buffered, moves=200):
+    """Return average amount of characters written per key press."""
+    random.seed(3)
+    field = Field(30, 20, 0.15)
+    game = Game(field)
+    screen = Screen()
+    stream = io.StringIO()
+    with contextlib.redirect_stdout(stream):
+        if buffered:
+            screen.buffer(80, 24)
+        screen.clear()
+        game.draw()
+        screen.present()
+        start = stream.tell()
+        for _ in range(moves):
+            game.keyAction(random.choice("wasdf"))
+            game.draw()
+            screen.present()
+        if buffered:
+            Screen.frame = None
+    return (stream.tell() - start) / moves
+
+
+def main():
+    """Run benchmark."""
+    screenModule.term = Terminal(kind="xterm-256color", force_styling=True)
+    for name, buffered in (("direct", False), ("buffered", True)):
+        print(f"{name:<9} {play(buffered):8.1f} characters per key press")
+
+
+if __name__ == "__main__":
+    main()
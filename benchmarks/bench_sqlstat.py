@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Time SQLite statistic inserts and leaderboard queries on many players."""
+
+import os
+import random
+import tempfile
+import timeit
+
+from minesweeper.logic.sqlstat import SqlStat
+
+
+def main(users=300, games=500):
+    """Run benchmark."""
+    rnd = random.Random(1)
+    with tempfile.TemporaryDirectory() as folder:
+        stat = SqlStat(os.path.join(folder, "stat.sqlite3"), syncEvery=256)
+        start = timeit.default_timer()
+        for user in range(users):
+            stat.assignFile(f"user{user}")
+            for _ in range(games):
+                stat["size"] = rnd.choice([8, 10, 12, 14, 16, 18, 20, 22])
+                stat["difficulty"] = rnd.choice([0.1, 0.15, 0.2, 0.25])
+                stat["gametime"], stat["win"] = rnd.uniform(5, 600), rnd.random() < 0.4
+                stat.saveStatistic()
+        stat.sync()
+        insert = timeit.default_timer() - start
+        print(f"insert {users * games} games: {insert * 1000:.0f} ms")
+
+        number = 20
+        cases = {
+            "leaderboard board": lambda: stat.leaderboard(12, 0.2),
+            "leaderboard all": lambda: stat.leaderboard(),
+            "user aggregate": lambda: stat.aggregate(12, 0.2),
+            "user quantiles": lambda: stat.quantiles(size=12, difficulty=0.2),
+        }
+        for name, case in cases.items():
+            timing = timeit.timeit(case, number=number) / number
+            print(f"{name:<18} {timing * 1000:8.2f} ms")
+        stat.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,15 @@ def task_test():
            }
 
 
+def task_bench():
+    """Run benchmarks."""
+    return {
+            'actions': [f'python3 -m benchmarks.{path[11:-3]}'
+                        for path in sorted(glob.glob('benchmarks/bench_*.py'))],
+            'verbosity': 2,
+           }
+
+
 def task_pot():
     """Re-create .pot ."""
     return {
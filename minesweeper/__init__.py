@@ -1,4 +1,5 @@
 """Contains main function of the game."""
+import asyncio
 import sys
 from minesweeper.gui.app import App as GUIAPP
 from minesweeper.cli.menu import startmenu
@@ -7,7 +8,7 @@ from minesweeper.cli.menu import startmenu
 def main(mode='gui'):
     """Run the game."""
     if mode == 'cli':
-        startmenu()
+        asyncio.run(startmenu())
     elif mode == 'gui':
         GUIAPP().mainloop()
     else:
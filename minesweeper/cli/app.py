@@ -1,5 +1,7 @@
 """CLI app."""
+import asyncio
 from .game import Game
+from .runtime import Runtime
 from .screen import Screen
 from .color import Color
 from minesweeper.logic.field import Field
@@ -15,10 +17,27 @@ class App:
 
     def mainloop(self):
         """Loop game until it's completed."""
+        asyncio.run(self.run())
+
+    async def run(self):
+        """Play game in running event loop until it's completed."""
         field = Field(30, 20, 0.15)
         term = Terminal()
         screen = Screen()
         game = Game(field)
+        runtime = Runtime(term)
+
+        def onKeys(keys):
+            stop = "q" in keys
+            if stop:
+                keys = keys[:keys.index("q")]
+            game.keyActions(keys)
+            if stop or game.status != "active":
+                runtime.stop()
+
+        def render(full):
+            game.draw()
+            screen.present()
 
         # username = 'Gamer1'
         # tempname = input(f'Input another name if you are not {username}: ')
@@ -30,18 +49,12 @@ class App:
         # stat.readStatistic()
 
         with term.cbreak(), term.hidden_cursor():
-            screen.clear()
-            game.draw()
+            screen.buffer().clear()
             # starttime = time.time()
-            key = ""
-
-            while key != "q" and game.status == "active":
-                key = term.inkey(timeout=3)
-                if not key:
-                    continue
-
-                game.keyAction(key)
-                game.draw()
+            # live game timer
+            runtime.every(1, runtime.invalidate)
+            await runtime.run(onKeys, render, batch=True)
+            screen.unbuffer()
 
             # stat['win'] = game.status == 'win'
 
@@ -21,63 +21,79 @@ DefaultColors = {
 
 
 class Color:
-    """Color class to handle terminal color with escape sequence."""
+    """
+    Color class to handle terminal color with escape sequence.
 
-    def __init__(self, fg=None, bg=None):
+    Colors are interned: equal fg and bg give the same object,
+    its escape sequence is built once
+    """
+
+    __slots__ = ("__fg", "__bg", "__escape")
+    __cache = {}
+
+    def __new__(cls, fg=None, bg=None):
         """
-        Create new terminal color.
+        Create new terminal color or return existing one.
 
         fg/bg can be string - one of default colors
         fg/bg can be int - represents 0-256 ascii colorid
         fg/bg can be None - in this case fg/bg is not set
         bg also can be bool - then provided color becomes background only.
         """
-        if isinstance(fg, str):
-            if fg not in DefaultColors:
-                raise ValueError(f'Unknown default color: "{fg}"')
-            self.__fg = DefaultColors[fg]
-        elif isinstance(fg, int) or fg is None:
-            self.__fg = fg
-        else:
-            raise TypeError(f"Unknown type for Color foreground: {type(fg)}")
-
-        if isinstance(bg, str):
-            if bg not in DefaultColors:
-                raise ValueError(f'Unknown default color: "{bg}"')
-            self.__bg = DefaultColors[bg]
-        elif isinstance(bg, bool):
-            self.__fg, self.__bg = None, self.__fg
-        elif isinstance(bg, int) or bg is None:
-            self.__bg = bg
+        key = (fg, bg, type(bg) is bool)
+        try:
+            return cls.__cache[key]
+        except (KeyError, TypeError):
+            pass
+        fg, bg = cls.__colorId(fg, "foreground"), bg
+        if isinstance(bg, bool):
+            fg, bg = None, fg
         else:
-            raise TypeError(f"Unknown type for Color background: {type(bg)}")
+            bg = cls.__colorId(bg, "background")
+        color = cls.__cache.get((fg, bg, False))
+        if color is None:
+            color = object.__new__(cls)
+            color.__fg, color.__bg = fg, bg
+            color.__escape = color.__wrap()
+            cls.__cache[fg, bg, False] = color
+        cls.__cache[key] = color
+        return color
+
+    @staticmethod
+    def __colorId(color, part):
+        """Return colorid of default color name, int or None."""
+        if isinstance(color, str):
+            if color not in DefaultColors:
+                raise ValueError(f'Unknown default color: "{color}"')
+            return DefaultColors[color]
+        if isinstance(color, int) or color is None:
+            return color
+        raise TypeError(f"Unknown type for Color {part}: {type(color)}")
 
     def __wrap(self):
         """Wrap colorid with escape sequence."""
         fgw = f"38;5;{self.__fg}" if self.__fg is not None else None
         bgw = f"48;5;{self.__bg}" if self.__bg is not None else None
         if fgw is not None and bgw is not None:
-            return f"[{fgw};{bgw}m"
+            return f"\x1b[{fgw};{bgw}m"
         elif fgw is not None:
-            return f"[{fgw}m"
+            return f"\x1b[{fgw}m"
         elif bgw is not None:
-            return f"[{bgw}m"
+            return f"\x1b[{bgw}m"
         return ""
 
     def __str__(self):
         """To use color as terminal color."""
-        res = self.__wrap()
-        return "\x1b" + res if res else res
+        return self.__escape
 
     def __repr__(self):
         """Print color to console without actually applying it."""
-        res = self.__wrap()
-        return "\\x1b" + res if res else "<No color>"
+        return self.__escape.replace("\x1b", "\\x1b") or "<No color>"
 
     def __add__(self, oth):
         """Fill unused fg/bg in each color if possible, second color overwrites first."""
         if isinstance(oth, str):
-            return str(self) + oth
+            return self.__escape + oth
         if not isinstance(oth, Color):
             raise TypeError(f"Cannot combine color and {type(oth)}")
         fg = oth.__fg if oth.__fg is not None else self.__fg
@@ -87,7 +103,7 @@ class Color:
     def __radd__(self, oth):
         """Fill unused fg/bg in each color if possible, first color overwrites second."""
         if isinstance(oth, str):
-            return oth + str(self)
+            return oth + self.__escape
         if not isinstance(oth, Color):
             raise TypeError(f"Cannot combine color and {type(oth)}")
         fg = self.__fg if self.__fg is not None else oth.__fg
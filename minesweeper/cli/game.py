@@ -1,8 +1,11 @@
 """CLI version of game interface."""
+import time
 from .screen import Screen, Color
 from .box import Box
-from minesweeper.util.minepoint import Flag, Mask, Value
-from minesweeper.util.point import Point
+from minesweeper.util.minepoint import (
+    Mask, MinePoint, BOMBTABLE, CHARTABLE, CLOSEDTABLE, GUESSTABLE, NUMBERTABLE, SURETABLE,
+)
+from minesweeper.util.point import Point, PointPool
 
 
 VALUECOLORS = [0, 38, 73, 40, 136, 172, 202, 161, 124, 9]
@@ -15,17 +18,47 @@ KEYS = {
     "mark": "f",
     "cheats": "x",
 }
+MOVES = {
+    KEYS["up"]: (0, -1),
+    KEYS["down"]: (0, 1),
+    KEYS["left"]: (-1, 0),
+    KEYS["right"]: (1, 0),
+}
 screen = Screen()
 
 
+def cellStyle(raw):
+    """Return draw character and color of packed cell byte."""
+    char = CHARTABLE[raw]
+    if CLOSEDTABLE[raw]:
+        if GUESSTABLE[raw]:
+            return char, Color("yellow", "grey")
+        if SURETABLE[raw]:
+            return char, Color("banana", "grey")
+        return char, Color.bg.grey
+    if BOMBTABLE[raw]:
+        return char, Color.red
+    if NUMBERTABLE[raw]:
+        return char, Color(VALUECOLORS[raw & MinePoint.VALUE])
+    return char, Color.white
+
+
+# draw character and color for every packed cell byte
+CELLSTYLES = tuple(cellStyle(raw) for raw in range(256))
+# draw character and color escape for every packed cell byte
+RENDERTABLE = tuple((char, str(color)) for char, color in CELLSTYLES)
+
+
 class Game:
     """Game class."""
 
     def __init__(self, field):
         """Create game."""
         self.field = field
+        self.points = PointPool(field.size)
+        self.field.pool = self.points
         self.oldPos = None
-        self.pos = Point.random([field.width, field.height])
+        self.pos = self.points.get(Point.random([field.width, field.height]))
         self.cursor = Color(239, bg=True)
         self.stat = field.statistic()
         self.status = "active"
@@ -34,6 +67,7 @@ class Game:
         self.fullredraw = True
         self.barsHeight = 2
         self.cheats = False
+        self.started = time.monotonic()
 
     def draw(self):
         """Draw game attributes."""
@@ -45,6 +79,7 @@ class Game:
             if self.redraw:
                 self.redraw = False
                 self.drawField([1, self.barsHeight + 1])
+            self.drawChanges([1, self.barsHeight + 1])
             self.drawInfoBars()
             self.drawCursor([1, self.barsHeight + 1])
         elif self.status == "lose":
@@ -58,83 +93,98 @@ class Game:
             ).whip()
 
     def drawCursor(self, offset):
-        """Draw cursor in current position."""
+        """Draw cursor in current position, remove it from previously drawn one."""
         offset = Point(offset)
+        if self.oldPos is not None and self.oldPos != self.pos:
+            char, color = self.cellInfo(self.oldPos)
+            screen.drawPixel(self.oldPos + offset, char, color)
         char, color = self.cellInfo(self.pos)
-        if self.cheats and self.field[self.pos] == Value.bomb:
+        if self.cheats and BOMBTABLE[self.field.getRaw(self.field.index(self.pos))]:
             char = "*"
         screen.drawPixel(self.pos + offset, char, color + self.cursor)
-        if self.oldPos is not None:
-            char, color = self.cellInfo(self.oldPos)
-            screen.drawPixel(self.oldPos + offset, char, color)
+        # several moves can happen between draws
+        self.oldPos = self.pos
+
+    def drawCells(self, offset, indices=None):
+        """Draw cells by flat indices, all cells if None."""
+        offset = Point(offset)
+        cells = self.field.cells
+        xs, ys = self.field.coords(indices)
+        if indices is None:
+            indices = range(self.field.size)
+        for index, x, y in zip(indices, xs, ys):
+            screen.putPixel(x + offset.x, y + offset.y, *RENDERTABLE[cells[index]])
 
     def drawField(self, offset):
         """Draw field at current state."""
-        offset = Point(offset)
-        for x, y in self.field:
-            char, color = self.cellInfo(x, y)
-            screen.drawPixel(x + offset.x, y + offset.y, char, color)
+        self.field.drainChanges()
+        self.drawCells(offset)
+
+    def drawChanges(self, offset):
+        """Draw only cells changed since previous draw."""
+        self.drawCells(offset, self.field.drainChanges())
 
     def drawInfoBars(self):
         """Draw info bars."""
         stat = self.stat
         cheats = " [CHEATS]" if self.cheats else ""
-        screen[1, 0].print(f"Cells: {stat['cellsTotal']}/{self.field.size}").whip()
+        elapsed = int(time.monotonic() - self.started)
+        screen[1, 0].print(
+            f"Cells: {stat['cellsTotal']}/{self.field.size}  Time: {elapsed}"
+        ).whip()
         screen[1, 1].print(
             f"Bombs{cheats}: {stat['bombsMarked']}/{self.field.bombs}"
         ).whip()
 
     def cellInfo(self, x, y=None):
         """Get cell draw character and color used."""
-        if y is None:
-            cell = self.field[Point(x)]
-        else:
-            cell = self.field[Point(x, y)]
-
-        if cell == Mask.closed:
-            if cell == Flag.noflag:
-                return " ", Color.bg.grey
-            elif cell == Flag.guess:
-                return "G", Color("yellow", "grey")
-            elif cell == Flag.sure:
-                return "F", Color("banana", "grey")
-        else:
-            if cell == Value.bomb:
-                return "*", Color.red
-            elif cell == Value.empty:
-                return " ", Color.white
-            else:
-                return str(cell), Color(VALUECOLORS[cell.value])
+        x, y = Point(x, y)
+        return CELLSTYLES[self.field.getRaw(y * self.field.width + x)]
 
     def move(self, direct):
         """Move cursor at certain direction."""
         if self.field.inBounds(self.pos + direct):
-            self.oldPos = Point(self.pos.x, self.pos.y)
-            self.pos += direct
+            self.pos = self.points.get(self.pos + direct)
+
+    def keyActions(self, keys):
+        """
+        React to batch of key presses in order.
+
+        Consecutive moves are folded into one cursor move, keys after
+        the game is over are ignored
+        """
+        x, y = self.pos
+        width, height = self.field.width, self.field.height
+        for key in keys:
+            step = MOVES.get(key)
+            if step is not None:
+                # moves out of field are skipped one by one
+                x = min(max(x + step[0], 0), width - 1)
+                y = min(max(y + step[1], 0), height - 1)
+                continue
+            self.pos = self.points.get(x, y)
+            self.keyAction(key)
+            if self.status != "active":
+                return
+        self.pos = self.points.get(x, y)
 
     def keyAction(self, key):
         """React to key press."""
-        if key == KEYS["up"]:
-            self.move(Point(0, -1))
-        elif key == KEYS["down"]:
-            self.move(Point(0, 1))
-        elif key == KEYS["left"]:
-            self.move(Point(-1, 0))
-        elif key == KEYS["right"]:
-            self.move(Point(1, 0))
+        if key in MOVES:
+            self.move(Point(MOVES[key]))
         elif key == KEYS["cheats"]:
             self.cheats = not self.cheats
         else:
+            raw = self.field.getRaw(self.field.index(self.pos))
             if key == KEYS["mark"]:
-                if self.field[self.pos] == Mask.closed:
+                if CLOSEDTABLE[raw]:
                     self.field.cycleFlag(self.pos)
             elif key == KEYS["open"]:
-                if self.field[self.pos] != Flag.sure:
-                    if self.field[self.pos] == Value.bomb:
+                if not SURETABLE[raw]:
+                    if BOMBTABLE[raw]:
                         self.status = "lose"
                     else:
                         self.field.reveal(self.pos)
-            self.redraw = True
             self.checkWin()
 
     def updateStat(self):
@@ -158,9 +208,7 @@ class Game:
         offset = Point(offset)
         screen[0, 0, Color.red].print("You have lost!").whip()
 
-        for x, y in self.field:
-            if self.field[x, y] == Value.bomb:
-                self.field[x, y] = Mask.opened
-                char, color = self.cellInfo(x, y)
-                screen.drawPixel(x + offset.x, y + offset.y, char, color)
+        bombs = self.field.indices(BOMBTABLE)
+        self.field.setMany(bombs, Mask.opened)
+        self.drawCells(offset, bombs)
         screen[offset + self.field.size]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Menus for cli minesweeper."""
 from .screen import Screen, Color
+from .runtime import Runtime
 from blessed import Terminal
 from .app import App as CLIAPP
 from .box import Box
@@ -42,16 +43,16 @@ class Menu:
         self.field = field
 
     def drawCursor(self, offset):
-        """Draw cursor in current position."""
+        """Draw cursor in current position, remove it from previously drawn one."""
         offset = Point(offset)
-        screen.drawPixel(self.pos + offset, ">", Color.white)
-        if self.oldPos is not None:
+        if self.oldPos is not None and self.oldPos != self.pos:
             screen.drawPixel(self.oldPos + offset, " ", Color.white)
+        screen.drawPixel(self.pos + offset, ">", Color.white)
+        self.oldPos = Point(self.pos.x, self.pos.y)
 
     def move(self, direct):
         """Move cursor at certain direction."""
         if self.pos.y + direct.y >= 0 and self.pos.y + direct.y < self.item_numb:
-            self.oldPos = Point(self.pos.x, self.pos.y)
             self.pos += direct
 
 
@@ -62,21 +63,24 @@ class Startmenu(Menu):
         """Inheritance from Menu."""
         Menu.__init__(self, item_numb, items, field)
 
+    async def play(self):
+        """Play game and exit."""
+        await CLIAPP().run()
+        exit()
+
     def keyAction(self, key):
-        """React to key press."""
+        """React to key press, return coroutine of opened screen if any."""
         if key == KEYS["up"]:
             self.move(Point(0, -1))
         elif key == KEYS["down"]:
             self.move(Point(0, 1))
         elif key == KEYS["open"]:
             if self.pos.y == 0:
-                CLIAPP().mainloop()
-                exit()
+                return self.play()
             # elif self.pos.y == 1:
-                # statmenu()
+                # return statmenu()
             elif self.pos.y == 2:
-                settingsmenu()
-                pass
+                return settingsmenu()
             elif self.pos.y == 3:
                 screen.setCursor(0, 0)
                 screen.clear()
@@ -101,10 +105,10 @@ class Statmenu(Menu):
         Menu.__init__(self, item_numb, items, field)
 
     def keyAction(self, key):
-        """React to key press."""
+        """React to key press, return coroutine of opened screen if any."""
         if key == KEYS["open"]:
             screen.clear()
-            startmenu()
+            return startmenu()
 
     def draw(self):
         """Draw menu."""
@@ -124,7 +128,7 @@ class Settingsmenu(Menu):
         Menu.__init__(self, item_numb, items, field)
 
     def keyAction(self, key):
-        """React to key press."""
+        """React to key press, return coroutine of opened screen if any."""
         if key == KEYS["up"]:
             self.move(Point(0, -1))
         elif key == KEYS["down"]:
@@ -132,7 +136,7 @@ class Settingsmenu(Menu):
         elif key == KEYS["open"]:
             if self.pos.y == 6:
                 screen.clear()
-                startmenu()
+                return startmenu()
 
     def draw(self):
         """Draw menu."""
@@ -145,24 +149,28 @@ class Settingsmenu(Menu):
             screen[2, 1 + j, Color.white].print(i)
 
 
-def runmenu(namemenu):
+async def runmenu(namemenu):
     """Run abstract menu."""
     term = Terminal()
-    with term.cbreak(), term.hidden_cursor():
-        screen.clear()
+    runtime = Runtime(term)
+
+    def onKey(key):
+        if key == "q":
+            runtime.stop()
+            return None
+        return namemenu.keyAction(key)
+
+    def render(full):
+        if full:
+            screen.clear()
         namemenu.draw()
-        key = ""
-
-        while key != "q":
-            key = term.inkey(timeout=3)
-            if not key:
-                continue
-            namemenu.keyAction(key)
-            namemenu.draw()
+
+    with term.cbreak(), term.hidden_cursor():
+        await runtime.run(onKey, render)
         screen.clear()
 
 
-def settingsmenu():
+async def settingsmenu():
     """Run settings menu."""
     settingsmenu_items = [
         "Language",
@@ -177,20 +185,20 @@ def settingsmenu():
     settingsmenu = Settingsmenu(
         len(settingsmenu_items), settingsmenu_items, settingsfield
     )
-    runmenu(settingsmenu)
+    await runmenu(settingsmenu)
 
 
-def statmenu():
+async def statmenu():
     """Run statmenu menu."""
     statmenu_items = ["Exit"]
     statfield = Field(MENU_WIDTH, len(statmenu_items) + OFFSET_STAT, 0.15)
     statmenu = Statmenu(len(statmenu_items), statmenu_items, statfield)
-    runmenu(statmenu)
+    await runmenu(statmenu)
 
 
-def startmenu():
+async def startmenu():
     """Run startmenu menu."""
     startmenu_items = ["Game", "Statistics", "Settings", "Exit"]
     startfield = Field(MENU_WIDTH, len(startmenu_items) + OFFSET_START, 0.15)
     startmenu = Startmenu(len(startmenu_items), startmenu_items, startfield)
-    runmenu(startmenu)
+    await runmenu(startmenu)
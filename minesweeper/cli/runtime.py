@@ -0,0 +1,168 @@
+"""
+Asyncio runtime for cli screens.
+
+Keys are read from terminal without blocking event loop, all keys pressed
+since previous frame are handled together and screen is redrawn not more
+often than fps times per second, so held keys do not queue up redraws.
+Background tasks run concurrently with input and rendering
+"""
+
+import asyncio
+import inspect
+import sys
+
+
+class Runtime:
+    """Event loop of one cli screen."""
+
+    def __init__(self, term=None, fps=30):
+        """Create runtime reading keys of blessed terminal, keys are only fed if term is None."""
+        self.term = term
+        self.period = 1 / fps
+        self.keys = asyncio.Queue()
+        self.tasks = set()
+        self.__dirty = asyncio.Event()
+        self.__stopped = asyncio.Event()
+        self.__full = True
+        self.__paused = False
+        self.__reading = None
+        self.__exit = None
+
+    def feed(self, key):
+        """Add pressed key to input queue."""
+        self.keys.put_nowait(key)
+
+    def invalidate(self, full=False):
+        """Request redraw on next frame, full one if full is True."""
+        self.__full = self.__full or full
+        self.__dirty.set()
+
+    def stop(self):
+        """Stop runtime after current key."""
+        self.__stopped.set()
+
+    @property
+    def stopped(self):
+        """Whether runtime is stopped."""
+        return self.__stopped.is_set()
+
+    def spawn(self, coro):
+        """Run coroutine as background task, it is cancelled when runtime stops."""
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def every(self, seconds, func):
+        """Call func every seconds in background."""
+        async def repeat():
+            while True:
+                await asyncio.sleep(seconds)
+                func()
+        return self.spawn(repeat())
+
+    def __readKeys(self):
+        """Move all keys available in terminal to input queue."""
+        key = self.term.inkey(timeout=0)
+        while key:
+            self.feed(key)
+            key = self.term.inkey(timeout=0)
+
+    async def __pollKeys(self):
+        """Read keys in executor thread when stdin cannot be watched by event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            key = await loop.run_in_executor(None, self.term.inkey, self.period)
+            if key:
+                self.feed(key)
+
+    def __startReading(self):
+        """Start reading keys of terminal."""
+        if self.term is None:
+            return
+        try:
+            if not sys.stdin.isatty():
+                raise OSError("stdin is not a terminal")
+            asyncio.get_running_loop().add_reader(sys.stdin.fileno(), self.__readKeys)
+            self.__reading = True
+        except (NotImplementedError, OSError, ValueError):
+            self.__reading = self.spawn(self.__pollKeys())
+
+    def __stopReading(self):
+        """Stop reading keys, so nested runtime can read them."""
+        if self.__reading is True:
+            asyncio.get_running_loop().remove_reader(sys.stdin.fileno())
+        elif self.__reading is not None:
+            self.__reading.cancel()
+        self.__reading = None
+
+    async def __input(self, onKey, batch):
+        """Handle keys, all keys pressed since previous frame are handled before redraw."""
+        try:
+            await self.__handleKeys(onKey, batch)
+        except SystemExit as exc:
+            # exit is raised again by run, outside of background task
+            self.__exit = exc
+            self.stop()
+
+    async def __handleKeys(self, onKey, batch):
+        """Pass keys or batches of keys to onKey until stopped."""
+        while True:
+            keys = [await self.keys.get()]
+            while not self.keys.empty():
+                keys.append(self.keys.get_nowait())
+            for key in [keys] if batch else keys:
+                result = onKey(key)
+                if inspect.isawaitable(result):
+                    # nested screen owns terminal until it is done
+                    self.__paused = True
+                    self.__stopReading()
+                    try:
+                        await result
+                    finally:
+                        self.__paused = False
+                        self.__startReading()
+                    self.invalidate(full=True)
+                if self.stopped:
+                    return
+            self.invalidate()
+
+    async def __render(self, draw):
+        """Redraw invalidated screen not more often than fps times per second."""
+        while True:
+            await self.__dirty.wait()
+            self.__dirty.clear()
+            if self.__paused:
+                continue
+            full, self.__full = self.__full, False
+            draw(full)
+            await asyncio.sleep(self.period)
+
+    async def run(self, onKey, draw, *, batch=False):
+        """
+        Run until stopped.
+
+        onKey(key) is called for every key, or onKey(keys) with list of all keys
+        pressed since previous call if batch is True. It can return awaitable which is
+        awaited before next key. draw(full) redraws screen, full is True on first
+        frame and after awaited key result. Screen is drawn once more after stop.
+        SystemExit raised by onKey stops runtime and is raised again
+        """
+        self.__startReading()
+        self.invalidate(full=True)
+        tasks = {self.spawn(self.__input(onKey, batch)), self.spawn(self.__render(draw))}
+        stopped = asyncio.ensure_future(self.__stopped.wait())
+        try:
+            await asyncio.wait({stopped, *tasks}, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task.done():
+                    task.result()
+        finally:
+            stopped.cancel()
+            self.__stopReading()
+            for task in list(self.tasks):
+                task.cancel()
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+        if self.__exit is not None:
+            raise self.__exit
+        draw(self.__full)
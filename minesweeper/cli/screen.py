@@ -1,4 +1,7 @@
 """Move, print, color your terminal screen."""
+import sys
+from itertools import compress
+from operator import ne
 from blessed import Terminal
 from .color import Color
 from minesweeper.util.point import Point
@@ -7,28 +10,130 @@ from minesweeper.util.point import Point
 term = Terminal()
 
 
+class FrameBuffer:
+    """
+    Double buffered grid of terminal cells.
+
+    Every cell is (glyph, color escape) pair. Drawing changes back frame only,
+    present writes cells which differ from previous frame with one write call
+    """
+
+    BLANK = (" ", "")
+
+    def __init__(self, width, height):
+        """Create blank frame buffer of width x height cells."""
+        self.width, self.height = int(width), int(height)
+        self.reset()
+
+    def reset(self):
+        """Blank both frames, terminal is supposed to be cleared."""
+        self.back = [self.BLANK] * (self.width * self.height)
+        self.front = list(self.back)
+
+    def invalidate(self):
+        """Forget previous frame, so next present redraws every cell."""
+        self.front = [None] * len(self.back)
+
+    def put(self, x, y, string, color=""):
+        """Put string with color escape at (x, y), parts out of frame are cut."""
+        if not 0 <= y < self.height:
+            return
+        start, stop = max(x, 0), min(x + len(string), self.width)
+        if start < stop:
+            row = y * self.width
+            self.back[row + start:row + stop] = [
+                (glyph, color) for glyph in string[start - x:stop - x]
+            ]
+
+    def __getitem__(self, xy):
+        """Return (glyph, color escape) of back frame cell at (x, y)."""
+        x, y = xy
+        return self.back[y * self.width + x]
+
+    def render(self):
+        """
+        Return escape string which turns previous frame into current one.
+
+        Cursor is moved only if changed cell does not follow previous one,
+        color is changed only when it differs from previous changed cell
+        """
+        back, front, width = self.back, self.front, self.width
+        out, cursor, current = [], None, None
+        for index in compress(range(len(back)), map(ne, back, front)):
+            glyph, color = front[index] = back[index]
+            if index != cursor:
+                y, x = divmod(index, width)
+                out.append(f"\x1b[{y + 1};{x + 1}H")
+            if color != current:
+                out.append(Color.reset + color)
+                current = color
+            out.append(glyph)
+            # terminal does not wrap cursor to next line after last column
+            cursor = index + 1 if (index + 1) % width else None
+        if current:
+            out.append(Color.reset)
+        return "".join(out)
+
+    def present(self, stream=None):
+        """Write changes since previous frame to stream, stdout by default, return its length."""
+        text = self.render()
+        if text:
+            stream = sys.stdout if stream is None else stream
+            stream.write(text)
+            stream.flush()
+        return len(text)
+
+
 class Screen:
     """
     Wrap around blessed Terminal.
 
     Commands can be chained togethe, yet result is the same
     Example: scr.setColor(Color.red).print('Hello').setColor(Color.blue).print(' world!')
+
+    When frame buffer is set with buffer, all screens draw into it,
+    and terminal is updated by present only
     """
 
+    frame = None
+
     def __init__(self):
         """Create screen."""
         self.cursor = Point(0, 0)
         self.color = Color.white
+        self.__paint = ""
+
+    def buffer(self, width=None, height=None):
+        """Draw into frame buffer shared by all screens, terminal size by default."""
+        width = term.width if width is None else width
+        height = term.height if height is None else height
+        Screen.frame = FrameBuffer(width, height)
+        return self
+
+    def unbuffer(self):
+        """Present last frame and draw directly to terminal again."""
+        self.present()
+        Screen.frame = None
+        return self
+
+    def present(self):
+        """Write frame buffer changes to terminal, return amount of written characters."""
+        return Screen.frame.present() if Screen.frame is not None else 0
 
     def clear(self):
         """Clear screen."""
         print(term.clear())
+        if Screen.frame is not None:
+            Screen.frame.reset()
 
     def print(self, *args, sep=" "):
         """Print something at screen."""
         string = sep.join(map(str, args))
         self.__printLen = len(string)
-        print(string)
+        if Screen.frame is not None:
+            Screen.frame.put(self.cursor.x, self.cursor.y, string, self.__paint)
+        else:
+            print(string)
         return self
 
     def whip(self):
@@ -48,7 +153,8 @@ class Screen:
                 self.cursor.y = int(y)
         except TypeError:
             raise TypeError("Coordinates must be integer")
-        print(term.move_xy(self.cursor.x, self.cursor.y), end="")
+        if Screen.frame is None:
+            print(term.move_xy(self.cursor.x, self.cursor.y), end="")
         return self
 
     def setColor(self, color, bg=None):
@@ -63,7 +169,11 @@ class Screen:
             raise ValueError(
                 f"Color is suppose to be str or Color type, not {type(color)}"
             )
-        print(color, end="")
+        if Screen.frame is not None:
+            # escapes add up until reset, just as in terminal
+            self.__paint = "" if color is Color.reset else self.__paint + str(color)
+        else:
+            print(color, end="")
         return self
 
     def drawPixel(self, x, y, pixel=None, color=None):
@@ -78,6 +188,14 @@ class Screen:
         self.setColor(Color.reset)
         return self
 
+    def putPixel(self, x, y, pixel, escape=""):
+        """Draw pixel at integer (x, y) with precomputed color escape, cursor is not changed."""
+        if Screen.frame is not None:
+            Screen.frame.put(x, y, pixel, escape)
+        else:
+            print(term.move_xy(x, y) + escape + pixel + Color.reset, end="")
+        return self
+
     def __call__(self, color, bg=None):
         """Set color."""
         self.setColor(color, bg)
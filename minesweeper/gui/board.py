@@ -1,7 +1,9 @@
 """Module that draws the game board."""
 
 import tkinter as tk
-from minesweeper.util import loadImage, Coord, Point, dotdict
+from minesweeper.util import loadImage, Point, dotdict
+from minesweeper.util.point import PointPool
+from minesweeper.util.vector import Vector
 from math import sqrt
 from .hexagon import Hexagon, COEF
 from .colors import COLORS
@@ -30,7 +32,7 @@ class Board:
         # if size < 8:
         # raise ValueError('Only sizes 8 and more allowed')
 
-        self.topleft = Coord(10, 10)
+        self.topleft = Vector(10, 10)
         self.cols, self.rows = size + 2, size
 
         self.hexLength, woh = Hexagon.getMaxLengthByGeom(
@@ -44,13 +46,15 @@ class Board:
 
         hexWidth, _ = Hexagon.getDimensions(self.hexLength)
         actualWidth = (self.cols - 2) * hexWidth
-        self.topleft.x = (self.width - actualWidth) / 2
+        self.topleft = Vector((self.width - actualWidth) / 2, self.topleft.y)
 
         self.resources = {}
         for resName, resPath in RESOURCES.items():
             self.resources[resName] = loadImage(resPath, SCALE_FACTOR * self.hexLength)
+        # board is small, so every cell point stays canonical
+        self.points = PointPool(self.rows * self.cols)
         self.board = {
-            Point(row, col): dict() for row, col in Point.range([self.rows, self.cols])
+            self.points.get(row, col): dict() for row, col in Point.range([self.rows, self.cols])
         }
         self.__createBoard()
 
@@ -68,8 +72,10 @@ class Board:
         self.app = None
 
     def __createBoard(self):
+        stepX, stepY = self.hexLength * sqrt(3), self.hexLength * 1.5
+        left, top = self.topleft
         for col in range(self.cols):
-            offset = 0 if col % 2 else self.hexLength * sqrt(3) / 2
+            offset = 0 if col % 2 else stepX / 2
 
             if col == 0:
                 x = x_offset = self.rows
@@ -94,8 +100,8 @@ class Board:
                 if row < x_offset or row >= rx_offset:
                     self.board[Point(row, col)] = None
                     continue  # do not create hexagon if it out of field
-                hexX = row * self.hexLength * sqrt(3) + offset + self.topleft.x
-                hexY = col * self.hexLength * 1.5 + self.topleft.y
+                hexX = row * stepX + offset + left
+                hexY = col * stepY + top
                 self.board[Point(row, col)]["hex"] = Hexagon(
                     self.app.canvas,
                     hexX,
@@ -142,7 +148,7 @@ class Board:
 
     def toggleFlag(self, pos):
         """Toggle flag."""
-        pos = Point(pos)
+        pos = self.points.get(pos)
         if pos not in self.board or self.board[pos] is None:
             return
 
@@ -166,7 +172,7 @@ class Board:
 
     def openCell(self, point, color, text=None):
         """Open given cell."""
-        point = Point(point)
+        point = self.points.get(point)
         if point not in self.board:
             return False
         cell = self.board[point]
@@ -3,13 +3,16 @@
 import tkinter as tk
 from tkinter import messagebox
 from minesweeper.util.point import Point
-from minesweeper.util.coord import Coord
+from minesweeper.util.vector import Vector
 from .board import Board
 from minesweeper.logic.field import Field
+from minesweeper.logic.engine import bitCount, bitIndices
 from .colors import COLORS
-from minesweeper.util.minepoint import Value, Mask, Flag
+from minesweeper.util.minepoint import (
+    Value, Mask, Flag, BARRIERTABLE, BOMBTABLE, CHARTABLE, EMPTYTABLE, OPENEDTABLE, SURETABLE,
+)
 from . import styles
-from random import shuffle
+from random import shuffle, choice
 from minesweeper.translation import _
 
 
@@ -149,10 +152,11 @@ class Game:
         self.field = Field(
             self.board.rows, self.board.cols, self.difficulty, kind="hexagon"
         )
+        self.field.pool = self.board.points
         self.board.draw()
         self.updateField()
         self.updateBoard()
-        self.helps = int(len(self.field.bombsPos) * (1 - self.difficulty) / 2)
+        self.helps = int(bitCount(self.field.bombsBits) * (1 - self.difficulty) / 2)
         if self.helps == 0:
             self.ctrls.disableHelp()
         self.updateStat()
@@ -174,57 +178,51 @@ class Game:
 
     def updateField(self):
         """Set barrier around playble area and remove impossible bombs."""
-        cells = []
-        for pos, cell in self.board.board.items():
-            if cell is None:
-                self.field[pos] = Value.barrier
-            else:
-                cells.append(pos)
-        shuffle(cells)
+        self.field.setMany(
+            [self.field.index(pos) for pos, cell in self.board.board.items() if cell is None],
+            Value.barrier,
+        )
 
-        bombs = list(self.field.bombsPos)
+        bombs = list(self.field.bombIndices())
         shuffle(bombs)
-        for crd in bombs:  # self.field:
-            if self.field[crd] != Value.bomb:
+        for index in bombs:
+            if self.field.cellAt(index) != Value.bomb:
                 continue
             curBombStack = 0
-            for bias in self.field.pattern(crd):
-                curCrd = crd + bias
-                if curCrd == crd:
-                    continue
-                if self.field[curCrd] == Value.bomb:
+            for near in self.field.neighborsOf(index):
+                cell = self.field.cellAt(near)
+                if cell == Value.bomb:
                     curBombStack += 2
-                elif self.field[curCrd] == Value.barrier:
+                elif cell == Value.barrier:
                     curBombStack += 1
                 if curBombStack >= self.maxBombStack:
-                    self.field[crd] = Value.empty
+                    self.field.setAt(index, Value.empty)
                     break
 
         self.field.recalculate()
-        self.barriers = 0
-        for crd in self.field:
-            self.barriers += self.field[crd] == Value.barrier
+        self.barriers = len(self.field.indices(BARRIERTABLE))
 
     def updateBoard(self):
-        """Draw opened cell of the board."""
-        for x, y in self.field:
-            if self.field[x, y] == Mask.opened:
-                text = None
-                if self.field[x, y] == Value.barrier:
-                    color = COLORS["main"]
-                elif self.field[x, y] == Value.bomb:
-                    color, text = COLORS["cells.bomb"], "BOMB"
-                elif self.field[x, y] == Value.empty:
-                    color = COLORS["cells.empty"]
-                else:
-                    text = str(self.field[x, y].value)
-                    color = COLORS["cells"][text]
-                self.board.openCell(Point(x, y), color, text)
+        """Draw cells of the board opened since previous update."""
+        field = self.field
+        opened = [index for index in field.drainChanges() if OPENEDTABLE[field.getRaw(index)]]
+        for index, x, y in zip(opened, *field.coords(opened)):
+            raw = field.getRaw(index)
+            text = None
+            if BARRIERTABLE[raw]:
+                color = COLORS["main"]
+            elif BOMBTABLE[raw]:
+                color, text = COLORS["cells.bomb"], "BOMB"
+            elif EMPTYTABLE[raw]:
+                color = COLORS["cells.empty"]
+            else:
+                text = CHARTABLE[raw]
+                color = COLORS["cells"][text]
+            self.board.openCell(Point(x, y), color, text)
 
     def completeGame(self):
         """Disable board and display message."""
-        for i, pos in enumerate(self.field):
-            self.field[pos] = Mask.opened
+        self.field.setMany(None, Mask.opened)
         self.updateBoard()
 
         if self.status == "lose":
@@ -254,17 +252,16 @@ class Game:
 
     def checkWin(self):
         """Check if player completed game."""
-        if self.marked != self.markedRight:
+        stat = self.field.statistic()
+        if stat["bombsMarked"] != stat["bombsGuessed"]:
             return False
-        if self.opened + self.marked == self.field.size - self.barriers:
-            return True
-        return False
+        return stat["cellsOpened"] + stat["bombsMarked"] + self.barriers == self.field.size
 
     def updateStat(self):
         """Update amount of left to open cells."""
         stat = {
             _("Cell left"): self.field.size - self.barriers - self.opened - self.marked,
-            _("Bombs left"): len(self.field.bombsPos) - self.marked,
+            _("Bombs left"): bitCount(self.field.bombsBits) - self.marked,
             _("Helps"): max(0, self.helps),
         }
         self.canvas.itemconfigure(
@@ -273,20 +270,13 @@ class Game:
 
     def helpPlayer(self, event):
         """Provide player with some help."""
-        bombs, found, fallback = list(self.field.bombsPos), False, None
-        shuffle(bombs)
-        for pos in bombs:
-            if self.field[pos] != Flag.sure:
-                fallback = pos
-                for bias in self.field.pattern(pos):
-                    curPos = pos + bias
-                    if self.field[curPos] == Mask.opened:
-                        found = True
-                        break
-                if found:
-                    break
-        if not found and fallback is not None:
-            pos = fallback
+        field = self.field
+        bombs = field.bombsBits & ~field.bits(SURETABLE)
+        if not bombs:
+            return
+        # prefer bombs next to opened cells
+        near = bombs & field.adjacent(field.openedBits)
+        pos = field.point(choice(list(bitIndices(near or bombs))))
         if self.field[pos] != Flag.sure:
             self.helps -= 1
             self.toggleFlag(pos)
@@ -313,7 +303,7 @@ class Game:
         if self.status != "game":
             return
 
-        pos = Coord(event.x, event.y, dtype=float)
+        pos = Vector(event.x, event.y)
         pos = self.board.findClicked(pos)
 
         if pos is None or self.field[pos] == Mask.opened:
@@ -325,7 +315,7 @@ class Game:
         if self.status != "game":
             return
 
-        pos = Coord(event.x, event.y, dtype=float)
+        pos = Vector(event.x, event.y)
         pos = self.board.findClicked(pos)
         if pos is None or self.field[pos] == Flag.sure:
             return
@@ -1,6 +1,6 @@
 """Single gui hexagon."""
-from math import sin, cos, tan, radians, sqrt
-from minesweeper.util import Coord
+from math import sin, cos, tan, radians
+from minesweeper.util.vector import Vector
 
 
 ANGLE = 60
@@ -8,6 +8,21 @@ SIDES = 6
 COEF = tan(radians(ANGLE))
 
 
+def unitPolygon():
+    """Return flat vertices of hexagon with unit side, starting at (0, 0)."""
+    offset, rotation = -1, 30
+    x = y = 0
+    coords = []
+    for i in range(SIDES):
+        coords += [x, y]
+        x += cos(radians(ANGLE * (i + offset) + rotation))
+        y += sin(radians(ANGLE * (i + offset) + rotation))
+    return coords
+
+
+UNITPOLYGON = unitPolygon()
+
+
 class Hexagon:
     """Draw hexagon."""
 
@@ -32,12 +47,9 @@ class Hexagon:
         # self.height = COEF * self.length / sqrt(COEF**2 + 1)
         self.height = 2 * self.length
         self.width = COEF * self.height / 2
-        self.topleft = Coord(x, y + self.height / 4, dtype=float)
-        # whH = Coord(self.width / 2, -self.height / 2, dtype=float)
-        whH = Coord(self.width / 2, -self.height / 4, dtype=float)
-        # self.center = self.topleft + whH
-        self.center = Coord(x, y, dtype=float) + whH
-        self.origin = Coord(x, y, dtype=float)
+        self.topleft = Vector(x, y + self.height / 4)
+        self.center = Vector(x + self.width / 2, y - self.height / 4)
+        self.origin = Vector(x, y)
 
         self.hovered = False
         self.hover = hover
@@ -58,22 +70,13 @@ class Hexagon:
         self.canvas = None
 
     def __calculate(self):
-        startX, startY = self.origin
-        startY -= self.height / 2
-        offset, rotation = -1, 30
-        self.coords = []
-
-        for i in range(SIDES):
-            endX = startX + self.length * cos(radians(ANGLE * (i + offset) + rotation))
-            endY = startY + self.length * sin(radians(ANGLE * (i + offset) + rotation))
-            self.coords.append(startX)
-            self.coords.append(startY)
-            startX, startY = endX, endY
+        self.coords = Vector.scaleTranslate(
+            UNITPOLYGON, self.length, self.origin.x, self.origin.y - self.height / 2
+        )
 
     def distance(self, x, y=None):
         """Calculate distance from x, y to hexagon."""
-        diff = Coord(x, y, dtype=float) - self.center
-        return sqrt(diff.x**2 + diff.y**2)
+        return self.center.distance(Vector(x, y))
 
     def changeFill(self, color):
         """Fill hexagon differently."""
@@ -0,0 +1,168 @@
+"""
+Compact codec for packed field cells.
+
+Full snapshot is run-length encoded: each record starts with varint header,
+even header 2n is a run of n copies of the following byte,
+odd header 2n + 1 is n literal bytes that follow.
+Delta against previous snapshot is a list of changed spans:
+varint gap from previous span end, varint span length and new bytes.
+Stream frames start with one byte tag: KEYFRAME or DELTAFRAME.
+Field snapshot drops bombs around values before encoding, as they are
+restored from bombs positions
+"""
+
+import re
+from minesweeper.logic.engine import KEEPTABLE, countBombs, translate
+from minesweeper.logic.field import patternBiases
+
+# runs shorter than this are cheaper to keep in literals
+RUN = re.compile(rb"(.)\1{3,}", re.DOTALL)
+CHANGED = re.compile(rb"[^\x00]+")
+KEYFRAME = b"K"
+DELTAFRAME = b"D"
+
+
+def writeVarint(out, value):
+    """Append unsigned LEB128 varint to bytearray."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def readVarint(data, pos):
+    """Read unsigned LEB128 varint, return value and next position."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode(cells):
+    """Run-length encode cells."""
+    out = bytearray()
+    literal = 0
+    for run in RUN.finditer(cells):
+        start, end = run.span()
+        if start > literal:
+            writeVarint(out, (start - literal) << 1 | 1)
+            out += cells[literal:start]
+        writeVarint(out, (end - start) << 1)
+        out.append(cells[start])
+        literal = end
+    if len(cells) > literal:
+        writeVarint(out, (len(cells) - literal) << 1 | 1)
+        out += cells[literal:]
+    return bytes(out)
+
+
+def decode(data):
+    """Decode run-length encoded cells."""
+    cells = bytearray()
+    pos = 0
+    while pos < len(data):
+        header, pos = readVarint(data, pos)
+        length = header >> 1
+        if header & 1:
+            cells += data[pos:pos + length]
+            pos += length
+        else:
+            cells += bytes(data[pos:pos + 1]) * length
+            pos += 1
+    return cells
+
+
+def encodeField(field):
+    """Run-length encode field cells without bombs around values."""
+    return encode(translate(field.cells, KEEPTABLE))
+
+
+def decodeField(data, width, height, kind="normal"):
+    """Decode cells of encodeField and restore bombs around values."""
+    cells = decode(data)
+    if len(cells) != width * height:
+        raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+    countBombs(cells, width, height, patternBiases(kind))
+    return cells
+
+
+def encodeDelta(old, new):
+    """Encode spans of new cells that differ from old ones."""
+    if len(old) != len(new):
+        raise ValueError("Cannot encode delta of cells with different size")
+    size = len(new)
+    diff = (int.from_bytes(old, "little") ^ int.from_bytes(new, "little")).to_bytes(size, "little")
+    out = bytearray()
+    last = 0
+    for span in CHANGED.finditer(diff):
+        start, end = span.span()
+        writeVarint(out, start - last)
+        writeVarint(out, end - start)
+        out += new[start:end]
+        last = end
+    return bytes(out)
+
+
+def applyDelta(cells, delta):
+    """Apply delta to cells in place."""
+    pos = last = 0
+    while pos < len(delta):
+        gap, pos = readVarint(delta, pos)
+        length, pos = readVarint(delta, pos)
+        start = last + gap
+        cells[start:start + length] = delta[pos:pos + length]
+        pos += length
+        last = start + length
+    return cells
+
+
+class StreamEncoder:
+    """
+    Encode sequence of cells states into frames.
+
+    First frame and every keyEvery-th one are full snapshots,
+    others are deltas against previous state
+    """
+
+    def __init__(self, keyEvery=64):
+        """Create encoder with key frame interval."""
+        self.keyEvery = keyEvery
+        self.__previous = None
+        self.__frames = 0
+
+    def encode(self, cells):
+        """Return frame for the next cells state."""
+        previous = self.__previous
+        keyframe = previous is None or len(previous) != len(cells)
+        if keyframe or self.__frames % self.keyEvery == 0:
+            frame = KEYFRAME + encode(cells)
+        else:
+            frame = DELTAFRAME + encodeDelta(previous, cells)
+        self.__previous = bytes(cells)
+        self.__frames += 1
+        return frame
+
+
+class StreamDecoder:
+    """Restore cells states from frames of StreamEncoder."""
+
+    def __init__(self):
+        """Create decoder, first frame should be a key frame."""
+        self.cells = None
+
+    def decode(self, frame):
+        """Apply next frame, return current cells."""
+        tag, body = frame[:1], frame[1:]
+        if tag == KEYFRAME:
+            self.cells = decode(body)
+        elif tag == DELTAFRAME:
+            if self.cells is None:
+                raise ValueError("Delta frame before key frame")
+            applyDelta(self.cells, body)
+        else:
+            raise ValueError(f"Unknown frame tag {tag!r}")
+        return self.cells
@@ -0,0 +1,360 @@
+"""
+Fast kernels over packed field cells.
+
+Kernels work with bytearray of packed MinePoint bytes stored row by row
+and with pattern biases split by row parity: (evenBiases, oddBiases)
+NumPy is used when it is installed, otherwise pure Python fallback is used
+"""
+
+import re
+import sys
+from array import array
+from functools import lru_cache
+from itertools import compress
+from minesweeper.util.minepoint import (  # noqa: F401
+    MinePoint, Value, Mask, Flag, BOMBTABLE, BARRIERTABLE, OPENEDTABLE, SURETABLE,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def isBombOrBarrier(raw):
+    """Return if packed byte holds a bomb or a barrier."""
+    return raw & MinePoint.VALUE in (Value.bomb, Value.barrier)
+
+
+# packed byte with cleared value, bombs and barriers are kept as is
+KEEPTABLE = bytes(raw if isBombOrBarrier(raw) else raw & ~MinePoint.VALUE for raw in range(256))
+# 1 for not opened cells marked with sure flag
+MARKEDTABLE = bytes(int(not OPENEDTABLE[raw] and SURETABLE[raw]) for raw in range(256))
+# 1 for not opened bombs marked with sure flag
+GUESSEDTABLE = bytes(MARKEDTABLE[raw] & BOMBTABLE[raw] for raw in range(256))
+# packed byte with value replaced by bomb
+FILLTABLE = bytes(raw | Value.bomb for raw in range(256))
+# value bits mask for cells which value should be recalculated
+FREETABLE = bytes(0 if isBombOrBarrier(raw) else MinePoint.VALUE for raw in range(256))
+# 1 for 0xFF bytes of big integer masks
+BITMASKTABLE = bytes(int(raw == 0xFF) for raw in range(256))
+
+
+def translate(cells, table):
+    """Return cells translated by table, cells may be any bytes-like object."""
+    if isinstance(cells, (bytes, bytearray)):
+        return cells.translate(table)
+    return bytes(cells).translate(table)
+
+
+@lru_cache(maxsize=None)
+def applyTable(value):
+    """Return table that sets Value, Mask or Flag in any packed byte."""
+    return bytes(MinePoint.apply(raw, value) for raw in range(256))
+
+
+def findAll(cells, table):
+    """Return array of indices of cells which packed byte is marked with 1 in table."""
+    return array("i", compress(range(len(cells)), translate(cells, table)))
+
+
+def sampleIndices(rnd, size, count):
+    """
+    Return count distinct random indices below size.
+
+    Sparse choices are left to random.sample, dense ones are drawn with
+    partial Fisher-Yates shuffle over virtual range(size), so cost is O(count)
+    """
+    if count * 4 <= size:
+        return rnd.sample(range(size), count)
+    swapped, result = {}, []
+    for index in range(count):
+        pick = rnd.randrange(index, size)
+        result.append(swapped.get(pick, pick))
+        swapped[pick] = swapped.get(index, index)
+    return result
+
+
+def placeBombs(cells, rnd, count):
+    """
+    Put count bombs on random cells.
+
+    For boards denser than a half all cells are filled with bombs first
+    and free cells are sampled instead, so cost is O(min(bombs, free cells))
+    """
+    if count * 2 <= len(cells):
+        for index in sampleIndices(rnd, len(cells), count):
+            cells[index] = (cells[index] & ~MinePoint.VALUE) | Value.bomb
+    else:
+        cells[:] = cells.translate(FILLTABLE)
+        for index in sampleIndices(rnd, len(cells), len(cells) - count):
+            cells[index] &= ~MinePoint.VALUE
+
+
+def countBombs(cells, width, height, biases):
+    """
+    Set value of every cell except bombs and barriers to the number of bombs around.
+
+    Cells may hold several boards of the same size stacked one after another
+    """
+    if numpy is not None:
+        numpyCountBombs(cells, width, height, biases)
+    elif len(cells) <= width * height:
+        pythonCountBombs(cells, width, height, biases)
+    else:
+        pythonCountBombsMany(cells, width, height, biases)
+
+
+def numpyCountBombs(cells, width, height, biases):
+    """Count bombs around with sums of shifted slices of the bomb grids."""
+    grid = numpy.frombuffer(cells, dtype=numpy.uint8).reshape(-1, height, width)
+    values = grid & MinePoint.VALUE
+    padded = numpy.pad((values == Value.bomb).astype(numpy.uint8), ((0, 0), (1, 1), (1, 1)))
+    counts = numpy.zeros(grid.shape, dtype=numpy.uint8)
+    for parity, parityBiases in enumerate(biases):
+        for dx, dy in parityBiases:
+            shifted = padded[:, 1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+            counts[:, parity::2] += shifted[:, parity::2]
+    free = (values != Value.bomb) & (values != Value.barrier)
+    grid[free] = (grid[free] & (MinePoint.MASK | MinePoint.FLAG)) | counts[free]
+
+
+def pythonCountBombsMany(cells, width, height, biases):
+    """
+    Count bombs around for stacked boards in one pass.
+
+    Boards are copied to one tall board with empty rows between them,
+    gap keeps every board starting at even row
+    """
+    size = width * height
+    gap = width * (1 if height % 2 else 2)
+    tall = bytearray((size + gap) * (len(cells) // size))
+    for board, start in enumerate(range(0, len(cells), size)):
+        offset = board * (size + gap)
+        tall[offset:offset + size] = cells[start:start + size]
+    pythonCountBombs(tall, width, len(tall) // width, biases)
+    for board, start in enumerate(range(0, len(cells), size)):
+        offset = board * (size + gap)
+        cells[start:start + size] = tall[offset:offset + size]
+
+
+@lru_cache(maxsize=32)
+def biasMask(width, height, dx, parity):
+    """
+    Return big integer mask for bias.
+
+    Mask has 0xFF byte for each cell which neighbor at dx is in field row
+    and which row has given parity, None parity means any row
+    """
+    row = bytes(0xFF if 0 <= x + dx < width else 0 for x in range(width))
+    if parity is None:
+        rows = row * height
+    else:
+        pair = row + bytes(width) if parity == 0 else bytes(width) + row
+        rows = (pair * (height // 2 + 1))[:width * height]
+    return int.from_bytes(rows, "little")
+
+
+def pythonCountBombs(cells, width, height, biases):
+    """
+    Count bombs around with big integer shifted sums.
+
+    Each cell is one byte of a big integer, so adding shifted copies of
+    the bomb integer counts all neighbors at once without carry
+    """
+    bombs = int.from_bytes(cells.translate(BOMBTABLE), "little")
+    even, odd = biases
+    parities = [(None, even)] if even == odd else [(0, even), (1, odd)]
+    counts = 0
+    for parity, parityBiases in parities:
+        for dx, dy in parityBiases:
+            offset = 8 * (dy * width + dx)
+            shifted = bombs >> offset if offset > 0 else bombs << -offset
+            counts += shifted & biasMask(width, height, dx, parity)
+    keep = int.from_bytes(cells.translate(KEEPTABLE), "little")
+    free = int.from_bytes(cells.translate(FREETABLE), "little")
+    cells[:] = (keep | (counts & free)).to_bytes(len(cells), "little")
+
+
+@lru_cache(maxsize=16)
+def digitsTable(table):
+    """Return table that translates packed bytes to ASCII 0/1 digits of 0/1 table."""
+    return bytes(0x30 + table[raw] for raw in range(256))
+
+
+def bitboard(cells, table):
+    """
+    Return bitboard of cells marked with 1 in table.
+
+    Bitboard is big integer which bit i is set for cell with flat index i
+    """
+    digits = translate(cells, digitsTable(table))[::-1]
+    return int(digits, 2) if digits else 0
+
+
+@lru_cache(maxsize=32)
+def bitMask(width, height, dx, parity):
+    """Return bitboard version of biasMask."""
+    rows = biasMask(width, height, dx, parity).to_bytes(width * height, "little")
+    return bitboard(rows, BITMASKTABLE)
+
+
+def spreadBits(bits, width, height, biases):
+    """Return bitboard of cells which have at least one neighbor in bits."""
+    even, odd = biases
+    parities = [(None, even)] if even == odd else [(0, even), (1, odd)]
+    result = 0
+    for parity, parityBiases in parities:
+        for dx, dy in parityBiases:
+            offset = dy * width + dx
+            shifted = bits >> offset if offset > 0 else bits << -offset
+            result |= shifted & bitMask(width, height, dx, parity)
+    return result
+
+
+def bitCount(bits):
+    """Return amount of set bits."""
+    if hasattr(bits, "bit_count"):
+        return bits.bit_count()
+    return bin(bits).count("1")
+
+
+def bitIndices(bits):
+    """Iterate over indices of set bits in increasing order."""
+    digits = bin(bits)[:1:-1]
+    index = digits.find("1")
+    while index != -1:
+        yield index
+        index = digits.find("1", index + 1)
+
+
+OPENED = Mask.opened << MinePoint.MSHIFT
+# closed not flagged empty cells
+EMPTYRUN = re.compile(rb"\x00+")
+# cells marked with 1 in 0/1 mask
+MARKRUN = re.compile(rb"\x01+")
+NONEMPTY = re.compile(rb"[^\x00]")
+# 1 for closed not flagged numbered cells
+CLOSEDNUMBERTABLE = bytes(int(Value.one <= raw <= Value.eight) for raw in range(256))
+# amount of indices built at once by indexRange
+INDEXCHUNK = 1 << 14
+# 1 for revealSquare marks of opened empty cells
+EMPTYMARKTABLE = bytes(int(raw == 2) for raw in range(256))
+# 1 for revealSquare marks of opened empty cells and cells around them in row
+BORDERMARKTABLE = bytes(int(raw != 0) for raw in range(256))
+
+
+def indexRange(first, last):
+    """
+    Return array of indices from first below last.
+
+    Chunk of indices is built as lanes of big integer, doubling amount of
+    lanes with one addition, then chunk is copied with increasing offsets.
+    It is several times faster than array of range
+    """
+    result = array("i")
+    bits = 8 * result.itemsize
+    count = max(last - first, 0)
+    lanes, ones, size = first, 1, 1
+    while size < min(count, INDEXCHUNK):
+        lanes |= (lanes + size * ones) << bits * size
+        ones |= ones << bits * size
+        size *= 2
+    for offset in range(0, count, size):
+        result.frombytes((lanes + offset * ones).to_bytes(size * result.itemsize, sys.byteorder))
+    del result[count:]
+    return result
+
+
+def revealSquare(cells, width, height, start):
+    """
+    Reveal cells around already opened start cell of rectangular field.
+
+    Closed not flagged empty cells are flooded span by span. Spans are marked
+    with 2 in bytes mask and one cell around them in their rows with 1. Then
+    mask is spread to rows above and below with big integer shifts and numbered
+    cells under it are opened at once.
+    Return array of revealed indices, start is not included
+    """
+    size = len(cells)
+    mark = bytearray(size)
+    ones, twos, opened = bytes([1]) * width, bytes([2]) * width, bytes([OPENED]) * width
+    spans = [(start, start + 1)]
+    low, high = start, start + 1
+    # sides of other spans are not empty, so their own row is not scanned
+    shifts = (-width, 0, width)
+
+    while spans:
+        left, right = spans.pop()
+        row = left - left % width
+        lo = left - 1 if left > row else left
+        hi = right + 1 if right < row + width else right
+        mark[lo:hi] = ones[:hi - lo]
+        mark[left:right] = twos[:right - left]
+        if lo < low:
+            low = lo
+        if hi > high:
+            high = hi
+        for shift in shifts:
+            near = row + shift
+            if not 0 <= near < size:
+                continue
+            end = hi + shift
+            found = EMPTYRUN.search(cells, lo + shift, end)
+            while found:
+                # run may go on beyond scanned segment
+                left, right = found.span()
+                if right == end and right < near + width and not cells[right]:
+                    found = NONEMPTY.search(cells, right, near + width)
+                    right = found.start() if found else near + width
+                if left > near and not cells[left - 1]:
+                    left = near + len(cells[near:left].rstrip(b"\x00"))
+                cells[left:right] = opened[:right - left]
+                spans.append((left, right))
+                found = EMPTYRUN.search(cells, right, end)
+        shifts = (-width, width)
+    mark[start] = 1
+
+    first, last = max(low - width, 0), min(high + width, size)
+    window = mark[first:last]
+    marks = int.from_bytes(window.translate(BORDERMARKTABLE), "little")
+    marks |= marks << 8 * width | marks >> 8 * width
+    numbers = marks & int.from_bytes(cells[first:last].translate(CLOSEDNUMBERTABLE), "little")
+    if numbers:
+        raised = int.from_bytes(cells[first:last], "little") | numbers * OPENED
+        cells[first:last] = raised.to_bytes(last - first, "little")
+    # runs of revealed cells are copied from indices of window, so they are sorted
+    marks = numbers | int.from_bytes(window.translate(EMPTYMARKTABLE), "little")
+    indices = indexRange(first, last)
+    revealed = array("i")
+    for found in MARKRUN.finditer(marks.to_bytes(last - first, "little")):
+        revealed += indices[found.start():found.end()]
+    return revealed
+
+
+def revealTable(cells, neighbors, stride, start):
+    """
+    Reveal cells around already opened start cell using neighbor table.
+
+    Neighbor table holds stride flat indices for each cell, -1 for absent neighbors.
+    Return array of revealed indices, start is not included
+    """
+    revealed = array("i")
+    stack = [start]
+    while stack:
+        index = stack.pop() * stride
+        for near in neighbors[index:index + stride]:
+            if near < 0:
+                continue
+            raw = cells[near]
+            # closed and not flagged cell has zero mask and flag bits
+            if raw & (MinePoint.MASK | MinePoint.FLAG):
+                continue
+            if raw == Value.empty:
+                cells[near] = OPENED
+                revealed.append(near)
+                stack.append(near)
+            elif raw != Value.bomb and raw != Value.barrier:
+                cells[near] = raw | OPENED
+                revealed.append(near)
+    return revealed
@@ -1,7 +1,22 @@
 """Module for the Field class."""
 
+import mmap
+import random
+import struct
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, compress, repeat
 from minesweeper.util.point import Point
-from minesweeper.util.minepoint import MinePoint, Value, Mask, Flag
+from minesweeper.util.minepoint import (
+    MinePoint, MinePointView, Mask, Flag, BARRIERTABLE, BOMBTABLE, NOFLAGTABLE, OPENEDTABLE,
+)
+from minesweeper.logic.engine import (
+    MARKEDTABLE, GUESSEDTABLE,
+    applyTable, bitboard, bitCount, countBombs, findAll, indexRange, placeBombs, revealSquare,
+    revealTable, spreadBits, translate,
+)
 
 
 def NoramlPattern(point):
@@ -40,32 +55,402 @@ def HexagonPatter(point):
         ]
 
 
+PATTERNS = {
+    "normal": NoramlPattern,
+    "hexagon": HexagonPatter,
+}
+
+
+@lru_cache(maxsize=None)
+def patternBiases(kind):
+    """Return pattern biases as (dx, dy) tuples for even and odd rows."""
+    if kind not in PATTERNS:
+        raise ValueError("Unkown kind of field pattern")
+    return tuple(
+        tuple((bias.x, bias.y) for bias in PATTERNS[kind](Point(0, parity)))
+        for parity in (0, 1)
+    )
+
+
+# biggest amount of cells of field which neighbor table is cached
+SHAREDTABLECELLS = 1 << 16
+
+
+def neighborStride(kind):
+    """Return amount of neighbor table entries for each cell."""
+    return len(patternBiases(kind)[0])
+
+
+def neighborTable(kind, width, height):
+    """
+    Return neighbor table for field of given kind and size.
+
+    Table is flat array with neighborStride(kind) entries for each cell:
+    flat indices of neighbors in pattern order, -1 for out of bound ones.
+    Tables of fields up to SHAREDTABLECELLS cells are cached and shared
+    between fields of the same kind and size, bigger ones are built each time
+    """
+    if width * height <= SHAREDTABLECELLS:
+        return sharedNeighborTable(kind, width, height)
+    return buildNeighborTable(kind, width, height)
+
+
+@lru_cache(maxsize=16)
+def sharedNeighborTable(kind, width, height):
+    """Return cached neighbor table of small field."""
+    return buildNeighborTable(kind, width, height)
+
+
+def buildNeighborTable(kind, width, height):
+    """Build neighbor table with one strided slice copy for each row and bias."""
+    biases = patternBiases(kind)
+    stride = len(biases[0])
+    indices = array("i", range(width * height))
+    table = array("i", [-1]) * (len(indices) * stride)
+    for y in range(height):
+        for column, (dx, dy) in enumerate(biases[y % 2]):
+            lo, hi = y * width + max(0, -dx), y * width + min(width, width - dx)
+            if not 0 <= y + dy < height or lo >= hi:
+                continue
+            shift = dy * width + dx
+            table[lo * stride + column:hi * stride:stride] = indices[lo + shift:hi + shift]
+    return table
+
+
+# flag that cycleFlag sets after current one
+NEXTFLAG = {Flag.noflag: Flag.sure, Flag.sure: Flag.guess, Flag.guess: Flag.noflag}
+
+# magic, version, kind, width, height, seed, bombs
+SNAPSHOT = struct.Struct("<4sBBxxIIQI")
+SNAPSHOTMAGIC = b"MSWF"
+SNAPSHOTVERSION = 1
+SNAPSHOTKINDS = ("normal", "hexagon")
+
+
+def generateBatch(width, height, bombsPercent, kind, seeds):
+    """Return packed cells of boards with given seeds stacked one after another."""
+    size = width * height
+    bombs = round(size * bombsPercent)
+    cells = bytearray(size * len(seeds))
+    for start, seed in zip(range(0, len(cells), size), seeds):
+        board = bytearray(size)
+        placeBombs(board, random.Random(seed), bombs)
+        cells[start:start + size] = board
+    countBombs(cells, width, height, patternBiases(kind))
+    return cells
+
+
 class Field:
     """Logic for minesweeper minefield."""
 
     OUTOFBOUND = -1
 
-    def __init__(self, width, height, bombsPercent, kind="normal"):
-        """Initialize field with size and bombs. Randomly fill it."""
-        if kind == "normal":
-            self.pattern = NoramlPattern
-        elif kind == "hexagon":
-            self.pattern = HexagonPatter
-        else:
-            raise ValueError("Unkown kind of field pattern")
+    def __init__(self, width, height, bombsPercent, kind="normal", seed=None, *, debug=False):
+        """
+        Initialize field with size and bombs. Randomly fill it.
 
-        self.size = width * height
-        self.width, self.height = width, height
+        Same seed gives the same field, random one is used if seed is None
+        In debug mode statistic counters are checked against full field scan
+        Set pool attribute to PointPool to get canonical points from point
+        """
+        self.__setup(width, height, kind, seed, debug)
         self.bombs = round(self.size * bombsPercent)
-        self.__field = [[MinePoint() for _ in range(width)] for _ in range(height)]
-        self.bombsPos = set()
+        self.__cells = bytearray(self.size)
         self.__randomizeBombs()
         self.__calcFieldBombs()
+        self.__resetCounters()
+
+    def __setup(self, width, height, kind, seed, debug):
+        """Set field attributes."""
+        if kind not in PATTERNS:
+            raise ValueError("Unkown kind of field pattern")
+        self.kind = kind
+        self.pattern = PATTERNS[kind]
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.random = random.Random(self.seed)
+        self.size = width * height
+        self.width, self.height = width, height
+        self.debug = debug
+        self.pool = None
+        self.__neighbors = None
+        self.__bits = {}
+        # 1 for cells changed since previous drainChanges call
+        self.__dirty = bytearray(self.size)
+
+    @classmethod
+    def fromCells(cls, width, height, cells, kind="normal", seed=None, *, debug=False):
+        """
+        Create field over given packed cells.
+
+        Cells are used as is without copying, read-only cells give read-only field
+        """
+        field = cls.__new__(cls)
+        field.__setup(width, height, kind, seed, debug)
+        if len(cells) != field.size:
+            raise ValueError(f"Expected {field.size} cells, got {len(cells)}")
+        field.bombs = translate(cells, BOMBTABLE).count(1)
+        field.__cells = cells
+        field.__resetCounters()
+        return field
+
+    @staticmethod
+    def generateMany(count, width, height, bombsPercent, kind="normal", seed=None, *,
+                     batchSize=64, workers=None):
+        """
+        Generate count boards batch by batch.
+
+        Yield (seeds, cells) for each batch, where cells hold packed cells
+        of boards stacked one after another, use Field.fromCells to play them.
+        Boards seeds are drawn from seed, so same seed gives same boards,
+        board with some seed is the same as Field created with it.
+        Batches are generated in given amount of worker processes if provided
+        """
+        if kind not in PATTERNS:
+            raise ValueError("Unkown kind of field pattern")
+        rnd = random.Random(seed)
+        batches = (
+            [rnd.getrandbits(64) for _ in range(min(batchSize, count - start))]
+            for start in range(0, count, batchSize)
+        )
+        if not workers:
+            for seeds in batches:
+                yield seeds, generateBatch(width, height, bombsPercent, kind, seeds)
+            return
+
+        with ProcessPoolExecutor(workers) as executor:
+            pending = deque()
+            for seeds in batches:
+                pending.append((seeds, executor.submit(
+                    generateBatch, width, height, bombsPercent, kind, seeds
+                )))
+                if len(pending) > 2 * workers:
+                    seeds, future = pending.popleft()
+                    yield seeds, future.result()
+            while pending:
+                seeds, future = pending.popleft()
+                yield seeds, future.result()
+
+    @property
+    def cells(self):
+        """Packed MinePoint bytes of the field, row by row."""
+        return self.__cells
+
+    @property
+    def bombsPos(self):
+        """Set of coordinates with bombs."""
+        return {self.point(index) for index in self.bombIndices()}
+
+    def bombIndices(self):
+        """Iterate over flat indices of cells with bombs."""
+        marks = translate(self.__cells, BOMBTABLE)
+        index = marks.find(1)
+        while index != -1:
+            yield index
+            index = marks.find(1, index + 1)
+
+    def index(self, x, y=None):
+        """Return flat index of the coordinate."""
+        x, y = Point(x, y)
+        return y * self.width + x
+
+    def point(self, index):
+        """Return coordinate of the flat index, canonical one if field has PointPool."""
+        if self.pool is not None:
+            return self.pool.get(index % self.width, index // self.width)
+        return Point(index % self.width, index // self.width)
+
+    @property
+    def neighbors(self):
+        """Neighbor table of the field, see neighborTable."""
+        if self.__neighbors is None:
+            self.__neighbors = neighborTable(self.kind, self.width, self.height)
+        return self.__neighbors
+
+    def neighborsOf(self, index):
+        """Return list of flat indices of in-bound neighbors of flat index."""
+        stride = neighborStride(self.kind)
+        start = index * stride
+        return [near for near in self.neighbors[start:start + stride] if near >= 0]
+
+    def cellAt(self, index):
+        """Return field minepoint by flat index."""
+        return MinePointView(self, index)
+
+    def setAt(self, index, value):
+        """Set minepoint value by flat index."""
+        self.setRaw(index, MinePoint.apply(self.__cells[index], value))
+
+    def getRaw(self, index):
+        """Return packed byte of cell by flat index."""
+        return self.__cells[index]
+
+    def setRaw(self, index, data):
+        """Set packed byte of cell by flat index."""
+        old = self.__cells[index]
+        if old == data:
+            return
+        self.__count(old, data)
+        self.__cells[index] = data
+        # cached bitboards are kept, bit of the cell flips only if table marks change
+        bits = self.__bits
+        for table in bits:
+            if table[old] != table[data]:
+                bits[table] ^= 1 << index
+        self.__dirty[index] = 1
+
+    def bits(self, table):
+        """
+        Return bitboard of cells marked with 1 in 256 entries table.
+
+        Bit i is set for cell with flat index i. Bitboards are cached,
+        they follow single cell changes and are dropped on bulk ones
+        """
+        bits = self.__bits.get(table)
+        if bits is None:
+            bits = self.__bits[table] = bitboard(self.__cells, table)
+        return bits
+
+    @property
+    def allBits(self):
+        """Bitboard of all cells."""
+        return (1 << self.size) - 1
+
+    @property
+    def bombsBits(self):
+        """Bitboard of bombs."""
+        return self.bits(BOMBTABLE)
+
+    @property
+    def barriersBits(self):
+        """Bitboard of barriers."""
+        return self.bits(BARRIERTABLE)
+
+    @property
+    def openedBits(self):
+        """Bitboard of opened cells."""
+        return self.bits(OPENEDTABLE)
+
+    @property
+    def flaggedBits(self):
+        """Bitboard of not opened cells with sure flag."""
+        return self.bits(MARKEDTABLE)
+
+    def adjacent(self, bits):
+        """Return bitboard of cells which have at least one neighbor in bits."""
+        return spreadBits(bits, self.width, self.height, patternBiases(self.kind))
+
+    def frontier(self):
+        """Return bitboard of opened cells next to closed not barrier ones."""
+        closed = self.allBits & ~(self.openedBits | self.barriersBits)
+        return self.openedBits & self.adjacent(closed)
+
+    def indices(self, table=None):
+        """
+        Return array of flat indices of all cells, row by row.
+
+        If 256 entries table is given, only cells which packed byte
+        is marked with 1 in it are included, see tables in engine module
+        """
+        if table is None:
+            return indexRange(0, self.size)
+        return findAll(self.__cells, table)
+
+    def coords(self, indices=None):
+        """Return x and y arrays of flat indices, of all cells if None."""
+        width = self.width
+        if indices is None:
+            return (
+                array("i", range(width)) * self.height,
+                array("i", chain.from_iterable(repeat(y, width) for y in range(self.height))),
+            )
+        return (
+            array("i", [index % width for index in indices]),
+            array("i", [index // width for index in indices]),
+        )
+
+    def indicesOf(self, xs, ys):
+        """Return array of flat indices of x and y arrays."""
+        if len(xs) != len(ys):
+            raise ValueError("Expected x and y arrays of the same length")
+        outX = xs and (min(xs) < 0 or max(xs) >= self.width)
+        outY = ys and (min(ys) < 0 or max(ys) >= self.height)
+        if outX or outY:
+            raise ValueError("Coords are out of bounds")
+        width = self.width
+        return array("i", [y * width + x for x, y in zip(xs, ys)])
+
+    def getMany(self, indices):
+        """Return packed bytes of cells by flat indices."""
+        return bytes(map(self.__cells.__getitem__, indices))
+
+    def setMany(self, indices, value):
+        """Set Value, Mask or Flag of cells by flat indices, of all cells if None."""
+        table = applyTable(value)
+        cells = self.__cells
+        if indices is None:
+            cells[:] = cells.translate(table)
+            self.__markAllChanged()
+        else:
+            dirty = self.__dirty
+            for index in indices:
+                cells[index] = table[cells[index]]
+                dirty[index] = 1
+        self.__resetCounters()
+
+    def drainChanges(self):
+        """
+        Return sorted array of flat indices of cells changed since previous call.
+
+        Changes are forgotten, so each change is returned once. Use it to
+        redraw only changed cells. Changes are kept in one byte per cell bitmap,
+        so memory does not grow with amount of changes
+        """
+        dirty = self.__dirty
+        count = dirty.count(1)
+        if not count:
+            return array("i")
+        self.__dirty = bytearray(self.size)
+        if count * 16 >= len(dirty):
+            return array("i", compress(range(len(dirty)), dirty))
+        changes = array("i")
+        index = dirty.find(1)
+        while index != -1:
+            changes.append(index)
+            index = dirty.find(1, index + 1)
+        return changes
+
+    def __markAllChanged(self):
+        """Mark all cells as changed."""
+        self.__dirty = bytearray(b"\x01") * self.size
+
+    def __count(self, old, new):
+        """Update statistic counters for cell changed from old to new packed byte."""
+        self.__opened += OPENEDTABLE[new] - OPENEDTABLE[old]
+        self.__marked += MARKEDTABLE[new] - MARKEDTABLE[old]
+        self.__guessed += GUESSEDTABLE[new] - GUESSEDTABLE[old]
+
+    def __scanCounters(self):
+        """Count opened cells, marked and guessed bombs with bitboards built from scratch."""
+        opened, flagged, bombs = (
+            bitboard(self.__cells, table) for table in (OPENEDTABLE, MARKEDTABLE, BOMBTABLE)
+        )
+        return bitCount(opened), bitCount(flagged), bitCount(flagged & bombs)
+
+    def __resetCounters(self):
+        self.__bits.clear()
+        self.__opened, self.__marked, self.__guessed = self.__scanCounters()
 
     def __isOutOfBounds(self, x, y=None):
         x, y = Point(x, y)
         return x < 0 or y < 0 or x >= self.width or y >= self.height
 
+    def __checkedIndex(self, x, y=None):
+        """Return flat index of the coordinate, raise ValueError if out of bounds."""
+        x, y = Point(x, y)
+        if self.__isOutOfBounds(x, y):
+            raise ValueError(f"Coords {(x, y)} are out of bounds")
+        return y * self.width + x
+
     def inBounds(self, x, y=None):
         """Return if point is in field bounds."""
         return not self.__isOutOfBounds(x, y)
@@ -75,40 +460,19 @@ class Field:
         x, y = Point(coords)
         if self.__isOutOfBounds(x, y):
             return Field.OUTOFBOUND
-        return self.__field[y][x]
+        return MinePointView(self, y * self.width + x)
 
     def __setitem__(self, coords, value):
         """Set minepoint value if in bound."""
-        x, y = Point(coords)
-        if self.__isOutOfBounds(x, y):
-            raise ValueError(f"Coords {coords} are out of bounds")
-
-        if isinstance(value, Value):
-            if value == Value.bomb:
-                self.bombsPos.add(Point(x, y))
-            elif self[x, y] == Value.bomb:
-                self.bombsPos.remove(Point(x, y))
-        self.__field[y][x].set(value)
+        self.setAt(self.__checkedIndex(coords), value)
 
     def __randomizeBombs(self):
         """Randomize bomb position."""
-        for _ in range(self.bombs):
-            x, y = Point.random([self.width, self.height])
-            while self[x, y] == Value.bomb:
-                x, y = Point.random([self.width, self.height])
-            self[x, y] = Value.bomb
+        placeBombs(self.__cells, self.random, self.bombs)
 
     def __calcFieldBombs(self):
         """Calculate bombs for each point on the field."""
-        for point in self:
-            if self[point] == Value.bomb or self[point] == Value.barrier:
-                continue
-            bombsAround = 0
-            # for bias in Point.range(-1, 2):
-            for bias in self.pattern(point):
-                if bias != (0, 0):
-                    bombsAround += self[point + bias] == Value.bomb
-            self[point] = Value(bombsAround)
+        countBombs(self.__cells, self.width, self.height, patternBiases(self.kind))
 
     def __iter__(self):
         """Iterate over all cordinates of the field."""
@@ -116,74 +480,55 @@ class Field:
 
     def toggleFlag(self, x, y=None):
         """Toggle sure flag."""
-        x, y = Point(x, y)
-        self[x, y] = Flag.sure if self[x, y] == Flag.noflag else Flag.noflag
+        index = self.__checkedIndex(x, y)
+        self.setAt(index, Flag.sure if NOFLAGTABLE[self.__cells[index]] else Flag.noflag)
 
     def cycleFlag(self, x, y=None):
         """Change flag value on a point."""
-        x, y = Point(x, y)
-        if self[x, y] == Flag.noflag:
-            self[x, y] = Flag.sure
-        elif self[x, y] == Flag.sure:
-            self[x, y] = Flag.guess
-        elif self[x, y] == Flag.guess:
-            self[x, y] = Flag.noflag
+        index = self.__checkedIndex(x, y)
+        flag = (self.__cells[index] & MinePoint.FLAG) >> MinePoint.FSHIFT
+        if flag in NEXTFLAG:
+            self.setAt(index, NEXTFLAG[flag])
 
     def reveal(self, x, y=None):
         """
         Reveal all possible minepoints around coordinate.
 
-        Return freshly revealed list of coordinates or None if Bomb was opened
+        Return array of freshly revealed flat indices or None if Bomb was opened
         """
-        point = Point(x, y)
-        if self[point] == Value.bomb:
+        start = self.__checkedIndex(x, y)
+        if BOMBTABLE[self.__cells[start]]:
             return None
-        if self[point] == Mask.opened:
-            return []
-
-        revealed = []
-        stack = [point]
-
-        while len(stack):
-            point = stack.pop()
-            self[point] = Mask.opened
-            revealed.append(point)
-
-            for bias in self.pattern(point):
-                curPos = point + bias
-                if self[curPos] != Mask.closed or self[curPos] != Flag.noflag:
-                    continue
-
-                if self[curPos] == Value.empty:
-                    self[curPos] = Mask.pending
-                    stack.append(curPos)
-                elif self[curPos] != Value.bomb and self[curPos] != Value.barrier:
-                    self[curPos] = Mask.opened
-                    revealed.append(curPos)
+        if OPENEDTABLE[self.__cells[start]]:
+            return array("i")
+
+        self.setAt(start, Mask.opened)
+        if self.kind == "normal":
+            revealed = revealSquare(self.__cells, self.width, self.height, start)
+        else:
+            revealed = revealTable(
+                self.__cells, self.neighbors, neighborStride(self.kind), start
+            )
+        # all revealed cells except start were closed and not flagged
+        self.__opened += len(revealed)
+        self.__bits.clear()
+        dirty = self.__dirty
+        for index in revealed:
+            dirty[index] = 1
+        revealed.insert(0, start)
         return revealed
 
     def statistic(self):
         """Return current field statistic."""
+        if self.debug and self.__scanCounters() != (self.__opened, self.__marked, self.__guessed):
+            raise RuntimeError("Field statistic counters do not match field state")
         res = {
-            "cellsOpened": 0,
-            "bombsMarked": 0,
-            "bombsGuessed": 0,
-            "cellsRemaning": 0,
-            "cellsTotal": 0,
-            "bombsLeft": 0,
-            "allBombsCorrect": True,
+            "cellsOpened": self.__opened,
+            "bombsMarked": self.__marked,
+            "bombsGuessed": self.__guessed,
         }
-        for x, y in self:
-            cell = self[x, y]
-            if cell == Mask.opened:
-                res["cellsOpened"] += 1
-            else:
-                if cell == Flag.sure:
-                    res["bombsMarked"] += 1
-                if cell == Value.bomb and cell == Flag.sure:
-                    res["bombsGuessed"] += 1
-        res["cellsTotal"] = res["cellsOpened"] + res["bombsMarked"]
         res["cellsRemaning"] = self.size - res["cellsOpened"] - res["bombsGuessed"]
+        res["cellsTotal"] = res["cellsOpened"] + res["bombsMarked"]
         res["bombsLeft"] = self.bombs - res["bombsMarked"]
         res["allBombsCorrect"] = res["bombsGuessed"] == self.bombs
         return res
@@ -191,6 +536,52 @@ class Field:
     def recalculate(self):
         """Recalculate field values after manual changes."""
         self.__calcFieldBombs()
+        self.__markAllChanged()
+        self.__resetCounters()
+
+    def save(self, path):
+        """Save field snapshot to binary file."""
+        if not isinstance(self.seed, int) or not 0 <= self.seed < 1 << 64:
+            raise ValueError(f"Seed {self.seed!r} cannot be saved, 64 bit unsigned int expected")
+        header = SNAPSHOT.pack(
+            SNAPSHOTMAGIC, SNAPSHOTVERSION, SNAPSHOTKINDS.index(self.kind),
+            self.width, self.height, self.seed, self.bombs,
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(self.__cells)
+
+    @classmethod
+    def load(cls, path, *, readonly=False):
+        """
+        Load field snapshot from binary file.
+
+        In readonly mode the file is memory-mapped and cells are not copied,
+        any change of such field raises TypeError
+        """
+        with open(path, "rb") as f:
+            header = f.read(SNAPSHOT.size)
+            if len(header) < SNAPSHOT.size:
+                raise ValueError(f"{path} is not a field snapshot")
+            magic, version, kind, width, height, seed, bombs = SNAPSHOT.unpack(header)
+            if magic != SNAPSHOTMAGIC:
+                raise ValueError(f"{path} is not a field snapshot")
+            if version != SNAPSHOTVERSION:
+                raise ValueError(f"Unsupported field snapshot version {version}")
+            if kind >= len(SNAPSHOTKINDS):
+                raise ValueError(f"Unknown field kind {kind} in snapshot")
+            if readonly:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                cells = memoryview(mapped)[SNAPSHOT.size:]
+            else:
+                cells = bytearray(width * height)
+                if f.readinto(cells) != len(cells):
+                    cells = cells[:0]
+        if len(cells) != width * height:
+            raise ValueError(f"Field snapshot {path} is truncated")
+        field = cls.fromCells(width, height, cells, SNAPSHOTKINDS[kind], seed)
+        field.bombs = bombs
+        return field
 
     def dump(self):
         """Dump field data to console."""
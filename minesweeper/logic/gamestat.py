@@ -1,21 +1,179 @@
-"""Handle game statistics."""
+"""
+Handle game statistics.
 
-import pickle
+Statistic of every user is kept in append-only log of fixed-width records,
+log starts with header: magic and version.
+Legacy pickle files with [[gametime, win], ...] lists are converted to logs once.
+Running aggregates per (size, difficulty) bucket are kept in small file next
+to the log, so summaries do not depend on amount of games played.
+Every bucket also keeps quantile sketch and histogram of win times
+"""
+
+import mmap
 import os
+import pickle
+import struct
+import time
+from collections import namedtuple
 import minesweeper.resources as resources
+from minesweeper.logic.sketch import QuantileSketch, Histogram
+
+
+LOGHEADER = struct.Struct("<4sBxxx")
+LOGMAGIC = b"MSWS"
+LOGVERSION = 1
+# timestamp, gametime, win, size, difficulty, seed
+RECORD = struct.Struct("<dd?xHfQ")
+Record = namedtuple("Record", "timestamp gametime win size difficulty seed")
+# magic, version, amount of log records covered, amount of buckets
+AGGHEADER = struct.Struct("<4sBxxxQI")
+AGGMAGIC = b"MSWA"
+AGGVERSION = 2
+# size, difficulty, count, wins, best, total and squares of win times,
+# followed by serialized sketch and histogram of win times
+BUCKET = struct.Struct("<HfQQddd")
+
+
+def roundDifficulty(difficulty):
+    """Round difficulty to float32 as it is stored in records."""
+    return struct.unpack("<f", struct.pack("<f", difficulty))[0]
+
+
+class Aggregate:
+    """Running aggregate of games: count, wins, win times moments, sketch and histogram."""
+
+    __slots__ = ("count", "wins", "best", "total", "squares", "times", "histogram")
+
+    def __init__(self, count=0, wins=0, best=0.0, total=0.0, squares=0.0,
+                 times=None, histogram=None):
+        """Create aggregate, best is 0 while there are no wins."""
+        self.count, self.wins, self.best = count, wins, best
+        self.total, self.squares = total, squares
+        self.times = QuantileSketch() if times is None else times
+        self.histogram = Histogram() if histogram is None else histogram
+
+    def add(self, gametime, win):
+        """Add one game."""
+        self.count += 1
+        if win:
+            self.best = gametime if not self.wins else min(self.best, gametime)
+            self.wins += 1
+            self.total += gametime
+            self.squares += gametime * gametime
+            self.times.add(gametime)
+            self.histogram.add(gametime)
+
+    def merge(self, oth):
+        """Add all games of other aggregate."""
+        if oth.wins:
+            self.best = oth.best if not self.wins else min(self.best, oth.best)
+        self.count += oth.count
+        self.wins += oth.wins
+        self.total += oth.total
+        self.squares += oth.squares
+        self.times.merge(oth.times)
+        self.histogram.merge(oth.histogram)
+        return self
+
+    def quantile(self, q):
+        """Return q-quantile of win time, None if there are no wins."""
+        return self.times.quantile(q)
+
+    @property
+    def median(self):
+        """Median win time, None if there are no wins."""
+        return self.times.quantile(0.5)
+
+    @property
+    def mean(self):
+        """Mean win time, 0 if there are no wins."""
+        return self.total / self.wins if self.wins else 0
+
+    @property
+    def deviation(self):
+        """Standard deviation of win time."""
+        if not self.wins:
+            return 0.0
+        return max(0.0, self.squares / self.wins - self.mean ** 2) ** 0.5
+
+    def __repr__(self):
+        """Show aggregate values."""
+        return (
+            f"Aggregate(count={self.count}, wins={self.wins}, "
+            f"best={self.best}, mean={self.mean})"
+        )
+
+
+def migrate(folder=None):
+    """
+    Convert legacy pickle statistic files in folder to logs.
+
+    Files which already have a log are skipped, pickle files are kept as is.
+    Return list of created log paths
+    """
+    folder = resources.statFolder if folder is None else folder
+    created = []
+    if not os.path.isdir(folder):
+        return created
+    for name in sorted(os.listdir(folder)):
+        base, ext = os.path.splitext(name)
+        if ext == ".bin":
+            logpath = migrateUser(folder, base)
+            if logpath is not None:
+                created.append(logpath)
+    return created
+
+
+def migrateUser(folder, name):
+    """
+    Convert legacy pickle statistic file of user in folder to log.
+
+    Return created log path, None if there is no legacy file or it is converted
+    """
+    binpath = os.path.join(folder, name + ".bin")
+    logpath = os.path.join(folder, name + ".log")
+    if os.path.exists(logpath) or not os.path.exists(binpath):
+        return None
+    with open(binpath, "rb") as f:
+        history = pickle.load(f)
+    with open(logpath + ".tmp", "wb") as f:
+        f.write(LOGHEADER.pack(LOGMAGIC, LOGVERSION))
+        for gametime, win in history:
+            f.write(RECORD.pack(0, gametime, bool(win), 0, 0, 0))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(logpath + ".tmp", logpath)
+    return logpath
 
 
 class Stat:
     """Statistics class."""
 
-    def __init__(self):
-        """Create new statistic."""
+    def __init__(self, folder=None, *, syncEvery=8):
+        """
+        Create new statistic.
+
+        Statistic files are kept in folder, resources.statFolder by default
+        Log is flushed on every save and fsynced once per syncEvery saves
+        currentSaved tells if current game is saved, so it is not counted twice
+        """
         self.__data = {
             "gametime": 0,
             "win": 0,
+            "size": 0,
+            "difficulty": 0,
+            "seed": 0,
         }
-        self.__old = []
-        self.__file = None
+        self.__old = memoryview(b"")
+        self.__map = None
+        self.__buckets = {}
+        self.__saved = 0
+        self.__log = None
+        self.__unsynced = 0
+        self.folder = folder
+        self.syncEvery = syncEvery
+        self.filepath = None
+        self.currentSaved = False
 
     def __getitem__(self, attr):
         """Access statistic."""
@@ -27,52 +185,256 @@ class Stat:
         """Set statistic."""
         if attr in self.__data:
             self.__data[attr] = val
+            self.currentSaved = False
         else:
             raise ValueError(f"Unknown item {attr} to access statistic")
 
     def assignFile(self, name):
-        """Assign some file to statistic."""
-        self.filepath = resources.statFolder
-        if not os.path.exists(self.filepath):
-            os.mkdir(self.filepath)
-        self.filepath = os.path.join(self.filepath, name + '.bin')
+        """Assign some file to statistic, create it or convert legacy one if needed."""
+        self.close()
+        folder = resources.statFolder if self.folder is None else self.folder
+        if not os.path.exists(folder):
+            os.mkdir(folder)
+        # only legacy file of this user is converted, not whole folder
+        migrateUser(folder, name)
+        self.filepath = os.path.join(folder, name + '.log')
         if not os.path.exists(self.filepath):
             with open(self.filepath, "wb") as f:
-                pickle.dump([], f)
+                f.write(LOGHEADER.pack(LOGMAGIC, LOGVERSION))
+        with open(self.filepath, "r+b") as f:
+            magic, version = LOGHEADER.unpack(f.read(LOGHEADER.size))
+            if magic != LOGMAGIC:
+                raise ValueError(f"{self.filepath} is not a statistic log")
+            if version != LOGVERSION:
+                raise ValueError(f"Unsupported statistic log version {version}")
+            # drop record torn by crash during write
+            size = os.fstat(f.fileno()).st_size - LOGHEADER.size
+            f.truncate(LOGHEADER.size + size - size % RECORD.size)
+        self.__loadAggregates(size // RECORD.size)
         return self.filepath
 
+    @property
+    def aggpath(self):
+        """Path of aggregates file of assigned log."""
+        return os.path.splitext(self.filepath)[0] + ".agg"
+
+    def __loadAggregates(self, records):
+        """Load aggregates, rebuild them from log if they do not cover it."""
+        self.__buckets, self.__saved = {}, 0
+        loaded = readAggregates(self.aggpath)
+        if loaded is not None and loaded[0] == records:
+            self.__buckets, self.__saved = loaded[1], records
+            return
+        with open(self.filepath, "rb") as f:
+            f.seek(LOGHEADER.size)
+            for record in map(Record._make, RECORD.iter_unpack(f.read(records * RECORD.size))):
+                self.__addRecord(record)
+        self.__writeAggregates()
+
+    def __addRecord(self, record):
+        """Add record to its bucket."""
+        key = (record.size, record.difficulty)
+        if key not in self.__buckets:
+            self.__buckets[key] = Aggregate()
+        self.__buckets[key].add(record.gametime, record.win)
+        self.__saved += 1
+
+    def __writeAggregates(self):
+        """Replace aggregates file with current buckets."""
+        data = bytearray(AGGHEADER.pack(AGGMAGIC, AGGVERSION, self.__saved, len(self.__buckets)))
+        for (size, difficulty), agg in self.__buckets.items():
+            data += BUCKET.pack(
+                size, difficulty, agg.count, agg.wins, agg.best, agg.total, agg.squares
+            )
+            data += agg.times.toBytes() + agg.histogram.toBytes()
+        with open(self.aggpath + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(self.aggpath + ".tmp", self.aggpath)
+
+    def buckets(self):
+        """Return (size, difficulty) keys of saved games buckets."""
+        return list(self.__buckets)
+
+    def aggregate(self, size=None, difficulty=None):
+        """
+        Return aggregate of saved games.
+
+        Only games of given board size and difficulty are included if they are set
+        """
+        return mergeBuckets(self.__buckets, size, difficulty)
+
     def readStatistic(self):
-        """Read old statistic."""
+        """Read old statistic, log is memory-mapped instead of copied."""
+        self.__release()
         with open(self.filepath, "rb") as f:
-            self.__old = pickle.load(f)
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__old = memoryview(self.__map)[LOGHEADER.size:]
+
+    def records(self):
+        """Iterate over old records."""
+        return map(Record._make, RECORD.iter_unpack(self.__old))
+
+    def __len__(self):
+        """Return amount of old records."""
+        return len(self.__old) // RECORD.size
 
     def saveStatistic(self):
-        """Save current statistic."""
-        with open(self.filepath, "wb") as f:
-            pickle.dump([*self.__old, list(self.__data.values())], f)
+        """Append current statistic to log."""
+        if self.__log is None:
+            self.__log = open(self.filepath, "ab")
+        data = RECORD.pack(
+            time.time(), self["gametime"], bool(self["win"]),
+            self["size"], self["difficulty"], self["seed"],
+        )
+        self.__log.write(data)
+        self.__log.flush()
+        self.__addRecord(Record._make(RECORD.unpack(data)))
+        self.__writeAggregates()
+        self.currentSaved = True
+        self.__unsynced += 1
+        if self.__unsynced >= self.syncEvery:
+            self.sync()
+
+    def sync(self):
+        """Force saved records to disk."""
+        if self.__log is not None and self.__unsynced:
+            os.fsync(self.__log.fileno())
+        self.__unsynced = 0
+
+    def __release(self):
+        """Unmap old records."""
+        self.__old.release()
+        self.__old = memoryview(b"")
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+
+    def close(self):
+        """Sync and close log, unmap old records."""
+        self.sync()
+        if self.__log is not None:
+            self.__log.close()
+            self.__log = None
+        self.__release()
+
+    def quantiles(self, qs=(0.5, 0.9, 0.99), size=None, difficulty=None):
+        """Return dict of win time quantiles of saved games, see aggregate for filters."""
+        agg = self.aggregate(size, difficulty)
+        return {q: agg.quantile(q) for q in qs}
+
+    def histogram(self, size=None, difficulty=None):
+        """Return win time histogram of saved games, see aggregate for filters."""
+        return self.aggregate(size, difficulty).histogram
 
     def findBest(self):
-        """Return best statistic values at all time."""
-        bestWinTime = self["gametime"] if self["win"] else 0
-        meanWinTime = self["gametime"] if self["win"] else 0
-        gamesWon = int(self["win"])
-        for history in self.__old:
-            hTime, hWin = history
-            gamesWon += hWin
-            if hWin:
-                meanWinTime += hTime
-                if bestWinTime > hTime:
-                    bestWinTime = hTime
-        meanWinTime = 0 if gamesWon == 0 else meanWinTime / gamesWon
-        return bestWinTime, meanWinTime, gamesWon
+        """Return best win time, mean win time and games won, current game included."""
+        agg = self.__withCurrent()
+        return agg.best, agg.mean, agg.wins
+
+    def __withCurrent(self):
+        """Return aggregate of saved games and current game if it is not saved yet."""
+        agg = self.aggregate()
+        if not self.currentSaved:
+            agg.add(self["gametime"], self["win"])
+        return agg
 
     def print(self):
         """Print statistic and it's best."""
         bestWinTime, meanWinTime, gamesWon = self.findBest()
-        winPercent = gamesWon / (len(self.__old) + 1) * 100
+        played = self.__withCurrent().count
+        winPercent = gamesWon / played * 100
         print("│ Current game time:", self["gametime"], "seconds")
         print("│ Best win time:    ", bestWinTime, "seconds")
-        print("│ Games played:     ", len(self.__old) + 1)
+        print("│ Games played:     ", played)
         print("│ Games won:        ", gamesWon)
         print(f"│ Win percent:       {winPercent:.2f}")
         print("│ Mean win time:    ", meanWinTime, "seconds")
+
+
+def readAggregates(path):
+    """Return (covered records, buckets) of aggregates file, None if it is missing or invalid."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < AGGHEADER.size:
+        return None
+    magic, version, covered, count = AGGHEADER.unpack_from(data)
+    if magic != AGGMAGIC or version != AGGVERSION:
+        return None
+    buckets = {}
+    offset = AGGHEADER.size
+    for _ in range(count):
+        size, difficulty, *aggregate = BUCKET.unpack_from(data, offset)
+        times, offset = QuantileSketch.fromBytes(data, offset + BUCKET.size)
+        histogram, offset = Histogram.fromBytes(data, offset)
+        buckets[size, difficulty] = Aggregate(*aggregate, times, histogram)
+    return covered, buckets
+
+
+def mergeBuckets(buckets, size=None, difficulty=None):
+    """Return aggregate of buckets of given board size and difficulty, of all if None."""
+    result = Aggregate()
+    if difficulty is not None:
+        difficulty = roundDifficulty(difficulty)
+    for (bSize, bDifficulty), agg in buckets.items():
+        if size is not None and bSize != size:
+            continue
+        if difficulty is not None and bDifficulty != difficulty:
+            continue
+        result.merge(agg)
+    return result
+
+
+def userBuckets(folder, name):
+    """
+    Return buckets of user statistic without writing anything.
+
+    Aggregates file is used if it covers the log, else buckets are built
+    from log or legacy pickle file in memory
+    """
+    base = os.path.join(folder, name)
+    if not os.path.exists(base + ".log"):
+        if not os.path.exists(base + ".bin"):
+            return {}
+        with open(base + ".bin", "rb") as f:
+            history = pickle.load(f)
+        records = [Record(0, gametime, bool(win), 0, 0.0, 0) for gametime, win in history]
+    else:
+        with open(base + ".log", "rb") as f:
+            data = f.read()
+        if data[:LOGHEADER.size] != LOGHEADER.pack(LOGMAGIC, LOGVERSION):
+            return {}
+        records = (len(data) - LOGHEADER.size) // RECORD.size
+        loaded = readAggregates(base + ".agg")
+        if loaded is not None and loaded[0] == records:
+            return loaded[1]
+        body = memoryview(data)[LOGHEADER.size:LOGHEADER.size + records * RECORD.size]
+        records = map(Record._make, RECORD.iter_unpack(body))
+    buckets = {}
+    for record in records:
+        key = (record.size, record.difficulty)
+        if key not in buckets:
+            buckets[key] = Aggregate()
+        buckets[key].add(record.gametime, record.win)
+    return buckets
+
+
+def leaderboard(names=None, folder=None, size=None, difficulty=None):
+    """
+    Return list of (name, aggregate) of users sorted by median win time.
+
+    Statistic files are only read, all users in folder are taken if names are None.
+    Users without wins go last. Merge aggregates to get summary of all users
+    """
+    folder = resources.statFolder if folder is None else folder
+    if names is None:
+        names = sorted({
+            base for base, ext in map(os.path.splitext, os.listdir(folder))
+            if ext in (".log", ".bin")
+        })
+    rows = [
+        (name, mergeBuckets(userBuckets(folder, name), size, difficulty)) for name in names
+    ]
+    rows.sort(key=lambda row: (not row[1].wins, row[1].median or 0, row[0]))
+    return rows
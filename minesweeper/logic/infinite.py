@@ -0,0 +1,204 @@
+"""Module for the InfiniteField class."""
+
+import random
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from minesweeper.util.point import Point
+from minesweeper.util.minepoint import MinePoint, MinePointView, Value, Mask, Flag
+from minesweeper.logic.field import patternBiases
+from minesweeper.logic.engine import countBombs, placeBombs
+
+
+@lru_cache(maxsize=1024)
+def chunkBombs(seed, bombsPercent, chunkSize, cx, cy):
+    """Return packed cells of chunk with bombs only, same for same arguments."""
+    cells = bytearray(chunkSize * chunkSize)
+    rnd = random.Random(f"{seed}:{cx}:{cy}")
+    placeBombs(cells, rnd, round(len(cells) * bombsPercent))
+    return bytes(cells)
+
+
+class InfiniteField:
+    """
+    Endless minefield made of lazily generated square chunks.
+
+    Chunk is generated from seed and its coordinate only when some of its
+    cells is accessed. Only recently used chunks are kept in memory,
+    cold chunks are dropped if untouched or compressed if changed by player
+    """
+
+    def __init__(self, bombsPercent, kind="normal", seed=None, *,
+                 chunkSize=64, hotChunks=64, maxReveal=65536):
+        """
+        Initialize infinite field with bombs percent and pattern kind.
+
+        Same seed gives the same field, random one is used if seed is None
+        hotChunks - how many chunks are kept uncompressed, at least one
+        maxReveal - limit of cells opened by one reveal, as floods may be endless
+        """
+        if chunkSize <= 0 or chunkSize % 2:
+            raise ValueError("Chunk size should be positive and even")
+        if hotChunks < 1:
+            raise ValueError("At least one hot chunk is needed")
+        self.biases = patternBiases(kind)
+        self.kind = kind
+        self.bombsPercent = bombsPercent
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.chunkSize = chunkSize
+        self.hotChunks = hotChunks
+        self.maxReveal = maxReveal
+        self.__hot = OrderedDict()
+        self.__cold = {}
+        self.__dirty = set()
+
+    @property
+    def chunksHot(self):
+        """Amount of chunks kept uncompressed."""
+        return len(self.__hot)
+
+    @property
+    def chunksCold(self):
+        """Amount of changed chunks kept compressed."""
+        return len(self.__cold)
+
+    def __generate(self, cx, cy):
+        """Generate chunk cells with bombs around counted across chunk borders."""
+        size = self.chunkSize
+        padded = size + 2
+        region = bytearray(padded * padded)
+        # region row r is global row cy * size - 1 + r
+        for row in range(padded):
+            chunkY, localY = divmod(cy * size - 1 + row, size)
+            for chunkX in (cx - 1, cx, cx + 1):
+                bombs = chunkBombs(self.seed, self.bombsPercent, size, chunkX, chunkY)
+                lo = max(0, cx * size - 1 - chunkX * size)
+                hi = min(size, cx * size + size + 1 - chunkX * size)
+                start = row * padded + chunkX * size + lo - (cx * size - 1)
+                region[start:start + hi - lo] = bombs[localY * size + lo:localY * size + hi]
+        # region starts at odd global row, so parities are swapped
+        even, odd = self.biases
+        countBombs(region, padded, padded, (odd, even))
+        cells = bytearray(size * size)
+        for row in range(size):
+            start = (row + 1) * padded + 1
+            cells[row * size:(row + 1) * size] = region[start:start + size]
+        return cells
+
+    def __chunk(self, cx, cy):
+        """Return cells of chunk, materialize it if needed."""
+        key = (cx, cy)
+        cells = self.__hot.get(key)
+        if cells is not None:
+            self.__hot.move_to_end(key)
+            return cells
+        if key in self.__cold:
+            cells = bytearray(zlib.decompress(self.__cold.pop(key)))
+            self.__dirty.add(key)
+        else:
+            cells = self.__generate(cx, cy)
+        self.__hot[key] = cells
+        while len(self.__hot) > self.hotChunks:
+            oldKey, oldCells = self.__hot.popitem(last=False)
+            if oldKey in self.__dirty:
+                self.__dirty.remove(oldKey)
+                self.__cold[oldKey] = zlib.compress(oldCells)
+        return cells
+
+    def __locate(self, coords):
+        """Return chunk key and index inside chunk for coordinates."""
+        x, y = coords
+        cx, lx = divmod(x, self.chunkSize)
+        cy, ly = divmod(y, self.chunkSize)
+        return (cx, cy), ly * self.chunkSize + lx
+
+    def getRaw(self, coords):
+        """Return packed byte of cell by (x, y) tuple."""
+        (cx, cy), index = self.__locate(coords)
+        return self.__chunk(cx, cy)[index]
+
+    def setRaw(self, coords, data):
+        """Set packed byte of cell by (x, y) tuple."""
+        (cx, cy), index = self.__locate(coords)
+        self.__chunk(cx, cy)[index] = data
+        self.__dirty.add((cx, cy))
+
+    def inBounds(self, x, y=None):
+        """Return if point is in field bounds, always true."""
+        return True
+
+    def __getitem__(self, coords):
+        """Return field minepoint."""
+        x, y = Point(coords)
+        return MinePointView(self, (x, y))
+
+    def __setitem__(self, coords, value):
+        """Set minepoint value."""
+        x, y = Point(coords)
+        self.setRaw((x, y), MinePoint.apply(self.getRaw((x, y)), value))
+
+    def toggleFlag(self, x, y=None):
+        """Toggle sure flag."""
+        x, y = Point(x, y)
+        self[x, y] = Flag.sure if self[x, y] == Flag.noflag else Flag.noflag
+
+    def cycleFlag(self, x, y=None):
+        """Change flag value on a point."""
+        x, y = Point(x, y)
+        if self[x, y] == Flag.noflag:
+            self[x, y] = Flag.sure
+        elif self[x, y] == Flag.sure:
+            self[x, y] = Flag.guess
+        elif self[x, y] == Flag.guess:
+            self[x, y] = Flag.noflag
+
+    def __closedAround(self, cell):
+        """Return neighbors of cell which are closed, not flagged and not bombs or barriers."""
+        x, y = cell
+        result = []
+        for dx, dy in self.biases[y % 2]:
+            near = (x + dx, y + dy)
+            raw = self.getRaw(near)
+            # closed and not flagged cell has zero mask and flag bits
+            if raw & (MinePoint.MASK | MinePoint.FLAG):
+                continue
+            if raw != Value.bomb and raw != Value.barrier:
+                result.append(near)
+        return result
+
+    def reveal(self, x, y=None):
+        """
+        Reveal all possible minepoints around coordinate.
+
+        Flood goes across chunk borders and stops after maxReveal cells.
+        Only cells left on the flood border stay closed, so revealing an opened
+        empty cell again continues stopped flood.
+        Return list of freshly revealed points, start one first if it was closed,
+        or None if Bomb was opened. Unlike Field.reveal it holds points,
+        as endless field has no flat indices
+        """
+        point = Point(x, y)
+        start = (point.x, point.y)
+        raw = self.getRaw(start)
+        if raw & MinePoint.VALUE == Value.bomb:
+            return None
+
+        opened = Mask.opened << MinePoint.MSHIFT
+        revealed = []
+        if not raw & MinePoint.MASK:
+            self.setRaw(start, raw | opened)
+            revealed.append(point)
+        if raw & MinePoint.VALUE != Value.empty:
+            return revealed
+        stack = self.__closedAround(start)
+        while stack and len(revealed) < self.maxReveal:
+            cell = stack.pop()
+            raw = self.getRaw(cell)
+            # cell can be pushed by several neighbors
+            if raw & MinePoint.MASK:
+                continue
+            self.setRaw(cell, raw | opened)
+            revealed.append(Point(cell))
+            if raw == Value.empty:
+                stack.extend(self.__closedAround(cell))
+        return revealed
@@ -0,0 +1,171 @@
+"""
+Mergeable streaming summaries of game times.
+
+QuantileSketch keeps counts of values in logarithmic bins (DDSketch),
+so any quantile is known with bounded relative error and sketches of
+different players can be merged. Amount of bins is capped, lowest bins are
+collapsed when cap is reached. Histogram counts values in fixed buckets.
+Both have bounded size and serialize to bytes
+"""
+
+import math
+import struct
+from bisect import bisect_right
+
+
+SKETCHHEADER = struct.Struct("<dQI")
+SKETCHBIN = struct.Struct("<iQ")
+HISTHEADER = struct.Struct("<I")
+# game time buckets edges in seconds
+TIMEEDGES = (10, 20, 30, 45, 60, 90, 120, 180, 300, 600)
+
+
+class QuantileSketch:
+    """
+    Quantiles of positive values with relative error not greater than accuracy.
+
+    At most maxBins bins are kept, lowest ones are collapsed together,
+    so error bound holds for quantiles above collapsed bins only
+    """
+
+    __slots__ = (
+        "accuracy", "maxBins", "count", "__gamma", "__logGamma", "__bins", "__zeros", "__sorted",
+    )
+
+    def __init__(self, accuracy=0.01, maxBins=2048):
+        """Create empty sketch."""
+        if not 0 < accuracy < 1:
+            raise ValueError("Accuracy should be between 0 and 1")
+        if maxBins < 1:
+            raise ValueError("At least one bin is needed")
+        self.accuracy = accuracy
+        self.maxBins = maxBins
+        self.count = 0
+        self.__gamma = (1 + accuracy) / (1 - accuracy)
+        self.__logGamma = math.log(self.__gamma)
+        self.__bins = {}
+        self.__zeros = 0
+        self.__sorted = None
+
+    def add(self, value, weight=1):
+        """Add value to sketch, values not greater than 0 are counted as 0."""
+        if value > 0:
+            key = math.ceil(math.log(value) / self.__logGamma)
+            self.__bins[key] = self.__bins.get(key, 0) + weight
+            if len(self.__bins) > self.maxBins:
+                self.__collapse()
+        else:
+            self.__zeros += weight
+        self.count += weight
+        self.__sorted = None
+
+    def __collapse(self):
+        """Move counts of lowest bins to the lowest kept one."""
+        keys = sorted(self.__bins)
+        excess = len(keys) - self.maxBins
+        kept = keys[excess]
+        for key in keys[:excess]:
+            self.__bins[kept] += self.__bins.pop(key)
+
+    def merge(self, oth):
+        """Add all values of other sketch with the same accuracy."""
+        if oth.accuracy != self.accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, weight in oth.__bins.items():
+            self.__bins[key] = self.__bins.get(key, 0) + weight
+        if len(self.__bins) > self.maxBins:
+            self.__collapse()
+        self.__zeros += oth.__zeros
+        self.count += oth.count
+        self.__sorted = None
+        return self
+
+    def quantile(self, q):
+        """Return q-quantile of added values, None for empty sketch."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile should be between 0 and 1")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.__zeros:
+            return 0.0
+        if self.__sorted is None:
+            keys, cumulative, total = sorted(self.__bins), [], self.__zeros
+            for key in keys:
+                total += self.__bins[key]
+                cumulative.append(total)
+            self.__sorted = keys, cumulative
+        keys, cumulative = self.__sorted
+        key = keys[min(bisect_right(cumulative, rank), len(keys) - 1)]
+        # middle of the bin (gamma^(key-1), gamma^key] in relative terms
+        return 2 * self.__gamma ** key / (self.__gamma + 1)
+
+    def __len__(self):
+        """Return amount of bins."""
+        return len(self.__bins) + bool(self.__zeros)
+
+    def toBytes(self):
+        """Serialize sketch."""
+        data = bytearray(SKETCHHEADER.pack(self.accuracy, self.__zeros, len(self.__bins)))
+        for key, weight in self.__bins.items():
+            data += SKETCHBIN.pack(key, weight)
+        return bytes(data)
+
+    @classmethod
+    def fromBytes(cls, data, offset=0):
+        """Deserialize sketch, return it and offset after it."""
+        accuracy, zeros, bins = SKETCHHEADER.unpack_from(data, offset)
+        offset += SKETCHHEADER.size
+        sketch = cls(accuracy)
+        sketch.__zeros = sketch.count = zeros
+        for _ in range(bins):
+            key, weight = SKETCHBIN.unpack_from(data, offset)
+            offset += SKETCHBIN.size
+            sketch.__bins[key] = weight
+            sketch.count += weight
+        return sketch, offset
+
+
+class Histogram:
+    """Counts of values in buckets between fixed edges, last bucket is open."""
+
+    __slots__ = ("edges", "counts")
+
+    def __init__(self, edges=TIMEEDGES):
+        """Create empty histogram with increasing bucket edges."""
+        self.edges = tuple(edges)
+        self.counts = [0] * (len(self.edges) + 1)
+
+    def add(self, value, weight=1):
+        """Add value to its bucket."""
+        self.counts[bisect_right(self.edges, value)] += weight
+
+    def merge(self, oth):
+        """Add counts of other histogram with the same edges."""
+        if oth.edges != self.edges:
+            raise ValueError("Cannot merge histograms with different edges")
+        self.counts = [a + b for a, b in zip(self.counts, oth.counts)]
+        return self
+
+    def buckets(self):
+        """Return list of (low, high, count), low of first and high of last buckets are None."""
+        lows = (None, *self.edges)
+        highs = (*self.edges, None)
+        return list(zip(lows, highs, self.counts))
+
+    def toBytes(self):
+        """Serialize histogram."""
+        size = len(self.edges)
+        body = struct.pack(f"<{size}d{size + 1}Q", *self.edges, *self.counts)
+        return HISTHEADER.pack(size) + body
+
+    @classmethod
+    def fromBytes(cls, data, offset=0):
+        """Deserialize histogram, return it and offset after it."""
+        size, = HISTHEADER.unpack_from(data, offset)
+        offset += HISTHEADER.size
+        body = struct.Struct(f"<{size}d{size + 1}Q")
+        values = body.unpack_from(data, offset)
+        histogram = cls(values[:size])
+        histogram.counts = list(values[size:])
+        return histogram, offset + body.size
@@ -0,0 +1,230 @@
+"""
+Game statistics in shared SQLite database.
+
+SqlStat keeps games of all users in one table, so it suits machines with
+many players. It has the same interface as Stat and adds leaderboard queries
+"""
+
+import os
+import sqlite3
+import time
+from itertools import islice
+import minesweeper.resources as resources
+from minesweeper.logic.gamestat import Stat, Aggregate, Record, migrate, roundDifficulty
+from minesweeper.logic.sketch import Histogram
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    user TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    gametime REAL NOT NULL,
+    win INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    difficulty REAL NOT NULL,
+    seed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS gamesUser ON games (user, size, difficulty, gametime);
+CREATE INDEX IF NOT EXISTS gamesBoard ON games (size, difficulty, win, gametime);
+CREATE TABLE IF NOT EXISTS imported (
+    user TEXT PRIMARY KEY,
+    records INTEGER NOT NULL
+);
+"""
+INSERT = (
+    "INSERT INTO games (user, timestamp, gametime, win, size, difficulty, seed)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+AGGREGATE = (
+    "SELECT COUNT(*), TOTAL(win), MIN(CASE WHEN win THEN gametime END),"
+    " TOTAL(win * gametime), TOTAL(win * gametime * gametime) FROM games WHERE {}"
+)
+QUANTILE = "SELECT gametime FROM games WHERE {} AND win ORDER BY gametime LIMIT 1 OFFSET ?"
+LEADERBOARD = (
+    "SELECT user, MIN(gametime), COUNT(*), TOTAL(gametime) FROM games WHERE {} AND win"
+    " GROUP BY user ORDER BY MIN(gametime), user LIMIT ?"
+)
+
+
+def toSigned(seed):
+    """Convert 64 bit unsigned seed to SQLite signed integer."""
+    return seed - (1 << 64) if seed >= 1 << 63 else seed
+
+
+def fromSigned(seed):
+    """Convert SQLite signed integer back to 64 bit unsigned seed."""
+    return seed + (1 << 64) if seed < 0 else seed
+
+
+class SqlStat(Stat):
+    """
+    Statistic kept in SQLite database in WAL mode.
+
+    Every saved game is committed at once, so it survives exit without close.
+    WAL is checkpointed to disk once per syncEvery saves and on sync or close
+    """
+
+    def __init__(self, path=None, *, syncEvery=8):
+        """Create statistic over database at path, statistic.sqlite3 in statFolder by default."""
+        Stat.__init__(self, syncEvery=syncEvery)
+        self.path = path
+        self.user = None
+        self.__db = None
+        self.__unsynced = 0
+
+    def __connect(self):
+        """Open database and create schema if needed."""
+        if self.__db is not None:
+            return self.__db
+        if self.path is None:
+            if not os.path.exists(resources.statFolder):
+                os.mkdir(resources.statFolder)
+            self.path = os.path.join(resources.statFolder, "statistic.sqlite3")
+        self.__db = sqlite3.connect(self.path)
+        self.__db.execute("PRAGMA journal_mode=WAL")
+        self.__db.execute("PRAGMA synchronous=NORMAL")
+        with self.__db:
+            self.__db.executescript(SCHEMA)
+        return self.__db
+
+    def assignFile(self, name):
+        """Assign user to statistic, return database path."""
+        self.__connect()
+        self.user = name
+        self.filepath = self.path
+        return self.filepath
+
+    def readStatistic(self):
+        """Nothing to read, queries go to database."""
+
+    def saveStatistic(self):
+        """Insert current statistic and commit it."""
+        with self.__connect() as db:
+            db.execute(INSERT, (
+                self.user, time.time(), self["gametime"], int(bool(self["win"])),
+                self["size"], roundDifficulty(self["difficulty"]), toSigned(self["seed"]),
+            ))
+        self.currentSaved = True
+        self.__unsynced += 1
+        if self.__unsynced >= self.syncEvery:
+            self.sync()
+
+    def sync(self):
+        """Force committed games to disk with WAL checkpoint."""
+        if self.__db is not None and self.__unsynced:
+            self.__db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        self.__unsynced = 0
+
+    def close(self):
+        """Sync and close database."""
+        self.sync()
+        if self.__db is not None:
+            self.__db.close()
+            self.__db = None
+
+    @staticmethod
+    def __where(user, size, difficulty):
+        """Return where clause and its parameters for filters which are set."""
+        clauses, params = [], []
+        for column, value in (("user", user), ("size", size), ("difficulty", difficulty)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(roundDifficulty(value) if column == "difficulty" else value)
+        return " AND ".join(clauses) or "1", params
+
+    def __query(self, sql, params):
+        """Run query on database."""
+        return self.__connect().execute(sql, params)
+
+    def records(self):
+        """Iterate over games of user as records."""
+        rows = self.__query(
+            "SELECT timestamp, gametime, win, size, difficulty, seed FROM games"
+            " WHERE user = ? ORDER BY id", [self.user],
+        )
+        for timestamp, gametime, win, size, difficulty, seed in rows:
+            yield Record(timestamp, gametime, bool(win), size, difficulty, fromSigned(seed))
+
+    def __len__(self):
+        """Return amount of games of user."""
+        return self.__query("SELECT COUNT(*) FROM games WHERE user = ?", [self.user]).fetchone()[0]
+
+    def buckets(self):
+        """Return (size, difficulty) keys of user games."""
+        return self.__query(
+            "SELECT DISTINCT size, difficulty FROM games WHERE user = ?", [self.user]
+        ).fetchall()
+
+    def aggregate(self, size=None, difficulty=None):
+        """Return aggregate of user games, without sketch and histogram."""
+        where, params = self.__where(self.user, size, difficulty)
+        count, wins, best, total, squares = self.__query(AGGREGATE.format(where), params).fetchone()
+        return Aggregate(count, int(wins), best or 0.0, total, squares)
+
+    def quantiles(self, qs=(0.5, 0.9, 0.99), size=None, difficulty=None):
+        """Return dict of exact win time quantiles of user, found with index."""
+        where, params = self.__where(self.user, size, difficulty)
+        wins = self.aggregate(size, difficulty).wins
+        result = {}
+        for q in qs:
+            if not wins:
+                result[q] = None
+                continue
+            row = self.__query(QUANTILE.format(where), [*params, int(q * (wins - 1))]).fetchone()
+            result[q] = row[0]
+        return result
+
+    def histogram(self, size=None, difficulty=None):
+        """Return win time histogram of user."""
+        where, params = self.__where(self.user, size, difficulty)
+        histogram = Histogram()
+        below = ", ".join("TOTAL(gametime < ?)" for _ in histogram.edges)
+        *cumulative, total = self.__query(
+            f"SELECT {below}, COUNT(*) FROM games WHERE {where} AND win",
+            [*histogram.edges, *params],
+        ).fetchone()
+        bounds = [0, *cumulative, total]
+        histogram.counts = [int(high - low) for low, high in zip(bounds, bounds[1:])]
+        return histogram
+
+    def leaderboard(self, size=None, difficulty=None, limit=10):
+        """Return list of (user, best win time, wins, mean win time) of all users."""
+        where, params = self.__where(None, size, difficulty)
+        rows = self.__query(LEADERBOARD.format(where), [*params, limit])
+        return [(user, best, wins, total / wins) for user, best, wins, total in rows]
+
+    def importLegacy(self, folder=None):
+        """
+        Import statistic files of all users from folder, statFolder by default.
+
+        Legacy pickle files are converted first, only games added to files
+        since previous import are inserted. Return amount of inserted games
+        """
+        folder = resources.statFolder if folder is None else folder
+        if not os.path.isdir(folder):
+            return 0
+        migrate(folder)
+        db = self.__connect()
+        inserted = 0
+        for name in sorted(os.listdir(folder)):
+            user, ext = os.path.splitext(name)
+            if ext != ".log":
+                continue
+            stat = Stat(folder)
+            stat.assignFile(user)
+            stat.readStatistic()
+            row = db.execute("SELECT records FROM imported WHERE user = ?", [user]).fetchone()
+            done = row[0] if row else 0
+            rows = [
+                (user, record.timestamp, record.gametime, int(record.win), record.size,
+                 record.difficulty, toSigned(record.seed))
+                for record in islice(stat.records(), done, None)
+            ]
+            total = len(stat)
+            stat.close()
+            with db:
+                db.executemany(INSERT, rows)
+                db.execute("INSERT OR REPLACE INTO imported VALUES (?, ?)", [user, total])
+            inserted += len(rows)
+        return inserted
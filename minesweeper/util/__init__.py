@@ -1,8 +1,9 @@
 """Module with common used utils."""
 
 from PIL import ImageTk, Image
-from .coord import Coord
+from .coord import Coord  # noqa: F401
 from .point import Point  # noqa: F401
+from .vector import Vector
 from os.path import exists
 import configparser
 import minesweeper.resources as resources
@@ -34,7 +35,7 @@ def loadImage(path, size):
     """Load image for GUI app."""
     image = Image.open(path)
     ext = path.split('.')[-1]
-    size = Coord(size, size)
+    size = (int(size), int(size))
 
     if ext == 'gif':
         frames = []
@@ -44,7 +45,7 @@ def loadImage(path, size):
             ))
             image.seek(i)
         return {
-            'size': Coord(size),
+            'size': Vector(size),
             'count': image.n_frames,
             'delay': image.info['duration'],
             'frames': frames
@@ -55,60 +55,62 @@ class MinePoint:
     MASK = ((0x1 << MFACTOR) - 1) << MSHIFT
     FLAG = ((0x1 << FFACTOR) - 1) << FSHIFT
 
+    __slots__ = ("__data",)
+
+    @staticmethod
+    def apply(data, oth):
+        """Return packed data with value, mask or flag replaced by oth."""
+        if isinstance(oth, Value):
+            return (data & ~MinePoint.VALUE) | (oth & MinePoint.VALUE)
+        elif isinstance(oth, Mask):
+            return (data & ~MinePoint.MASK) | ((oth << MinePoint.MSHIFT) & MinePoint.MASK)
+        elif isinstance(oth, Flag):
+            return (data & ~MinePoint.FLAG) | ((oth << MinePoint.FSHIFT) & MinePoint.FLAG)
+        raise TypeError(f'Unexpected type {type(oth)} to set to')
+
     def __init__(self):
         """Create empty MinePoint."""
         self.__data = 0
 
-    def __rawFlag(self):
-        return self.__data & MinePoint.FLAG
-
-    def __rawMask(self):
-        return self.__data & MinePoint.MASK
-
-    def __rawValue(self):
-        return self.__data & MinePoint.VALUE
-
-    def __clearFlag(self):
-        self.__data ^= self.__rawFlag()
-
-    def __clearMask(self):
-        self.__data ^= self.__rawMask()
+    @property
+    def raw(self):
+        """Get packed value/mask/flag byte of the cell."""
+        return self.__data
 
-    def __clearValue(self):
-        self.__data ^= self.__rawValue()
+    @raw.setter
+    def raw(self, data):
+        """Set packed value/mask/flag byte of the cell."""
+        self.__data = data
 
     @property
     def flag(self):
         """Get flag value of the cell."""
-        return self.__rawFlag() >> MinePoint.FSHIFT
+        return (self.raw & MinePoint.FLAG) >> MinePoint.FSHIFT
 
     @flag.setter
     def flag(self, flag):
         """Set flag value of the cell."""
-        self.__clearFlag()
-        self.__data |= (flag << MinePoint.FSHIFT) & MinePoint.FLAG
+        self.raw = (self.raw & ~MinePoint.FLAG) | ((flag << MinePoint.FSHIFT) & MinePoint.FLAG)
 
     @property
     def mask(self):
         """Get mask value of the cell."""
-        return self.__rawMask() >> MinePoint.MSHIFT
+        return (self.raw & MinePoint.MASK) >> MinePoint.MSHIFT
 
     @mask.setter
     def mask(self, mask):
         """Set mask value of the cell."""
-        self.__clearMask()
-        self.__data |= (mask << MinePoint.MSHIFT) & MinePoint.MASK
+        self.raw = (self.raw & ~MinePoint.MASK) | ((mask << MinePoint.MSHIFT) & MinePoint.MASK)
 
     @property
     def value(self):
         """Get bombs value of the cell."""
-        return self.__rawValue()
+        return self.raw & MinePoint.VALUE
 
     @value.setter
     def value(self, value):
         """Set bombs value of the cell."""
-        self.__clearValue()
-        self.__data |= value & MinePoint.VALUE
+        self.raw = (self.raw & ~MinePoint.VALUE) | (value & MinePoint.VALUE)
 
     def __eq__(self, oth):
         """Compare cell to Value, Mask or Flag."""
@@ -122,19 +124,80 @@ class MinePoint:
 
     def set(self, oth):
         """Set cell value, mask or flag."""
-        if isinstance(oth, Value):
-            self.value = oth
-        elif isinstance(oth, Mask):
-            self.mask = oth
-        elif isinstance(oth, Flag):
-            self.flag = oth
-        else:
-            raise TypeError(f'Unexpected type {type(oth)} to set to')
+        self.raw = MinePoint.apply(self.raw, oth)
 
     def __repr__(self):
         """Show binary value of cell."""
-        return bin(self.__data)
+        return bin(self.raw)
 
     def __str__(self):
         """Convert to value to string."""
         return str(self.value)
+
+
+class MinePointView(MinePoint):
+    """
+    MinePoint that lives inside packed storage of its owner.
+
+    Owner must provide getRaw(index) and setRaw(index, data),
+    so all reads and writes go straight to the owner's storage.
+    """
+
+    __slots__ = ("__owner", "__index")
+
+    def __init__(self, owner, index):
+        """Create view on owner's cell with given index."""
+        self.__owner = owner
+        self.__index = index
+
+    @property
+    def index(self):
+        """Get index of the cell in owner's storage."""
+        return self.__index
+
+    @property
+    def raw(self):
+        """Get packed byte from owner's storage."""
+        return self.__owner.getRaw(self.__index)
+
+    @raw.setter
+    def raw(self, data):
+        """Write packed byte to owner's storage."""
+        self.__owner.setRaw(self.__index, data)
+
+
+def equalTable(oth):
+    """Return 256 entries table with 1 for packed bytes which cell is equal to oth."""
+    cell = MinePoint()
+    table = bytearray(256)
+    for raw in range(256):
+        cell.raw = raw
+        table[raw] = cell == oth
+    return bytes(table)
+
+
+def displayChar(raw):
+    """Return character that shows packed cell byte to player."""
+    cell = MinePoint()
+    cell.raw = raw
+    if cell == Mask.closed:
+        return {Flag.guess: "G", Flag.sure: "F"}.get(cell.flag, " ")
+    if cell == Value.bomb:
+        return "*"
+    if cell == Value.empty or cell == Value.barrier:
+        return " "
+    return str(cell)
+
+
+# predicate tables: 1 if packed byte matches, 0 otherwise
+CLOSEDTABLE = equalTable(Mask.closed)
+OPENEDTABLE = equalTable(Mask.opened)
+EMPTYTABLE = equalTable(Value.empty)
+BOMBTABLE = equalTable(Value.bomb)
+BARRIERTABLE = equalTable(Value.barrier)
+NUMBERTABLE = bytes(int(Value.one <= raw & MinePoint.VALUE <= Value.eight) for raw in range(256))
+NOFLAGTABLE = equalTable(Flag.noflag)
+GUESSTABLE = equalTable(Flag.guess)
+SURETABLE = equalTable(Flag.sure)
+# character shown for packed byte
+CHARTABLE = tuple(displayChar(raw) for raw in range(256))
@@ -1,15 +1,28 @@
 """Simple Point class module to handle int coordinates only."""
+from array import array
+from collections import OrderedDict
+from itertools import chain, repeat
 from random import randint
 
 
 class Point:
     """Class that represents integer coordinates."""
 
+    __slots__ = ("x", "y")
+
     @staticmethod
     def __convert(val):
         """Convert value to Point class if needed."""
         return val if isinstance(val, Point) else Point(val)
 
+    @staticmethod
+    def __make(x, y, new=object.__new__):
+        """Create Point from two ints skipping __init__ dispatch, new is bound for speed."""
+        point = new(Point)
+        point.x = x
+        point.y = y
+        return point
+
     @staticmethod
     def random(start, end=None):
         """
@@ -31,14 +44,8 @@ class Point:
         return Point(x, y)
 
     @staticmethod
-    def range(start, end=None, step=None):
-        """
-        Return range for coordinates.
-
-        Provided values convert to Point if needed
-        By default start = Point(0, 0), end = value as Point, step = Point(1, 1)
-        Result - all coordinates of a square with certain step
-        """
+    def __ranges(start, end, step):
+        """Return x and y ranges for Point.range arguments."""
         if end is None:
             start, end = 0, start
         if step is None:
@@ -48,9 +55,35 @@ class Point:
             raise ValueError('Start x cannot be greater than end x')
         if start.y > end.y:
             raise ValueError('Start y cannot be greater than end y')
-        for x in range(start.x, end.x, step.x):
-            for y in range(start.y, end.y, step.y):
-                yield Point(x, y)
+        return range(start.x, end.x, step.x), range(start.y, end.y, step.y)
+
+    @staticmethod
+    def range(start, end=None, step=None):
+        """
+        Return range for coordinates.
+
+        Provided values convert to Point if needed
+        By default start = Point(0, 0), end = value as Point, step = Point(1, 1)
+        Result - all coordinates of a square with certain step
+        """
+        xs, ys = Point.__ranges(start, end, step)
+        for x in xs:
+            for y in ys:
+                yield Point.__make(x, y)
+
+    @staticmethod
+    def rangeArrays(start, end=None, step=None):
+        """
+        Return coordinates of Point.range as two int arrays.
+
+        Result - (xs, ys) arrays in the same order as Point.range yields points,
+        no Point is created, arrays may be wrapped with numpy.frombuffer
+        """
+        xs, ys = Point.__ranges(start, end, step)
+        return (
+            array("i", chain.from_iterable(repeat(x, len(ys)) for x in xs)),
+            array("i", ys) * len(xs),
+        )
 
     def __init__(self, val, y=None):
         """
@@ -66,25 +99,25 @@ class Point:
         If both arguments are given, assuming they are numbers:
         Point(val, y), both converted to int
         """
-        if y is None:
-            if isinstance(val, Point):
-                self.x, self.y = val.x, val.y
+        if y is not None:
+            self.x, self.y = int(val), int(y)
 
-            elif isinstance(val, tuple) or isinstance(val, list):
-                if len(val) != 2:
-                    raise ValueError('Cannot convert list/tuple to Point with length != 2')
-                self.x, self.y = int(val[0]), int(val[1])
+        elif isinstance(val, Point):
+            self.x, self.y = val.x, val.y
 
-            elif isinstance(val, dict) and 'x' in val and 'y' in val:
-                self.x, self.y = int(val['x']), int(val['y'])
+        elif isinstance(val, tuple) or isinstance(val, list):
+            if len(val) != 2:
+                raise ValueError('Cannot convert list/tuple to Point with length != 2')
+            self.x, self.y = int(val[0]), int(val[1])
 
-            elif isinstance(val, int) or isinstance(val, float):
-                self.x, self.y = int(val), int(val)
+        elif isinstance(val, dict) and 'x' in val and 'y' in val:
+            self.x, self.y = int(val['x']), int(val['y'])
+
+        elif isinstance(val, int) or isinstance(val, float):
+            self.x, self.y = int(val), int(val)
 
-            else:
-                raise ValueError(f'Cannot convert type {type(val)} to Point')
         else:
-            self.x, self.y = int(val), int(y)
+            raise ValueError(f'Cannot convert type {type(val)} to Point')
 
     def __getitem__(self, idx):
         """Access x/y by 0/1 or a string."""
@@ -102,27 +135,31 @@ class Point:
 
     def __radd__(self, oth):
         """Addition of two Point, given value converted if needed."""
-        val = Point.__convert(oth)
-        return Point(val.x + self.x, val.y + self.y)
+        val = oth if isinstance(oth, Point) else Point(oth)
+        return Point.__make(val.x + self.x, val.y + self.y)
 
     def __rsub__(self, oth):
         """Addition of two Point, given value converted if needed."""
-        val = Point.__convert(oth)
-        return Point(val.x - self.x, val.y - self.y)
+        val = oth if isinstance(oth, Point) else Point(oth)
+        return Point.__make(val.x - self.x, val.y - self.y)
 
     def __sub__(self, oth):
         """Addition of two Point, given value converted if needed."""
-        val = Point.__convert(oth)
-        return Point(self.x - val.x, self.y - val.y)
+        val = oth if isinstance(oth, Point) else Point(oth)
+        return Point.__make(self.x - val.x, self.y - val.y)
 
     def __add__(self, oth):
         """Addition of two Point, given value converted if needed."""
-        val = Point.__convert(oth)
-        return Point(self.x + val.x, self.y + val.y)
+        val = oth if isinstance(oth, Point) else Point(oth)
+        return Point.__make(self.x + val.x, self.y + val.y)
 
     def __eq__(self, oth):
         """Addition of two Point, given value converted if needed."""
-        val = Point.__convert(oth)
+        if oth is self:
+            return True
+        if isinstance(oth, Point):
+            return self.x == oth.x and self.y == oth.y
+        val = Point(oth)
         return self.x == val.x and self.y == val.y
 
     def __iter__(self):
@@ -131,11 +168,11 @@ class Point:
 
     def __neg__(self):
         """Return negative of coords."""
-        return Point(-self.x, -self.y)
+        return Point.__make(-self.x, -self.y)
 
     def __invert__(self):
         """Flip x and y places."""
-        return Point(self.y, self.x)
+        return Point.__make(self.y, self.x)
 
     def __repr__(self):
         """Represent Point in console."""
@@ -147,4 +184,96 @@ class Point:
 
     def __hash__(self):
         """Hash Point."""
-        return hash(f'({self.x},{self.y})')
+        return hash((self.x, self.y))
+
+
+class FrozenPoint(Point):
+    """
+    Immutable Point with cached hash.
+
+    Arithmetic on it gives usual mutable Points
+    """
+
+    __slots__ = ("__hash",)
+
+    def __init__(self, val, y=None):
+        """Create FrozenPoint, takes same values as Point."""
+        point = Point(val, y)
+        object.__setattr__(self, "x", point.x)
+        object.__setattr__(self, "y", point.y)
+        object.__setattr__(self, "_FrozenPoint__hash", hash((point.x, point.y)))
+
+    def __setattr__(self, name, val):
+        """Forbid changes."""
+        raise AttributeError("FrozenPoint cannot be changed")
+
+    def __setitem__(self, idx, val):
+        """Forbid changes."""
+        raise TypeError("FrozenPoint cannot be changed")
+
+    def __hash__(self):
+        """Hash Point."""
+        return self.__hash
+
+    def __reduce__(self):
+        """Pickle as constructor call."""
+        return FrozenPoint, (self.x, self.y)
+
+
+class PointPool:
+    """
+    Bounded pool of canonical FrozenPoint instances.
+
+    Same coordinates give the same instance while it is in the pool,
+    so comparisons and dict lookups stop on identity check.
+    Least recently used points are evicted when pool is full,
+    maxsize None means unbounded pool without eviction bookkeeping
+    """
+
+    def __init__(self, maxsize=4096):
+        """Create empty pool."""
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self.__points = OrderedDict() if maxsize is not None else {}
+
+    def get(self, x, y=None):
+        """Return canonical point, takes same values as Point."""
+        if y is not None:
+            key = (int(x), int(y))
+        elif isinstance(x, Point):
+            key = (x.x, x.y)
+        else:
+            key = tuple(Point(x))
+        point = self.__points.get(key)
+        if point is not None:
+            self.hits += 1
+            if self.maxsize is not None:
+                self.__points.move_to_end(key)
+            return point
+        self.misses += 1
+        point = self.__points[key] = FrozenPoint(*key)
+        if self.maxsize is not None and len(self.__points) > self.maxsize:
+            self.__points.popitem(last=False)
+            self.evictions += 1
+        return point
+
+    __call__ = get
+
+    @property
+    def hitRate(self):
+        """Part of get calls that returned pooled point."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Drop all points and reset counters."""
+        self.__points.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        """Return amount of pooled points."""
+        return len(self.__points)
+
+    def __contains__(self, coords):
+        """Return if point with coordinates is pooled, does not count as hit."""
+        return tuple(Point(coords)) in self.__points
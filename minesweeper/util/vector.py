@@ -0,0 +1,80 @@
+"""Immutable float Vector class module for GUI geometry."""
+from math import hypot
+from operator import itemgetter
+
+
+class Vector(tuple):
+    """
+    Class that represents immutable float 2D vector.
+
+    Unlike Coord it never converts types back and forth,
+    so it is cheap enough for per-hexagon layout math
+    """
+
+    __slots__ = ()
+
+    x = property(itemgetter(0), doc="Get x value.")
+    y = property(itemgetter(1), doc="Get y value.")
+
+    def __new__(cls, x, y=None):
+        """
+        Create Vector instance.
+
+        Takes two numbers or one pair of numbers, like tuple, Coord or Point
+        """
+        if y is None:
+            x, y = x
+        return tuple.__new__(cls, (float(x), float(y)))
+
+    @staticmethod
+    def scaleTranslate(flat, scale, dx, dy):
+        """
+        Scale and move flat list of coordinates [x0, y0, x1, y1, ...] at once.
+
+        Return new list of (x * scale + dx, y * scale + dy) pairs flattened back
+        """
+        return [
+            value * scale + (dy if i % 2 else dx) for i, value in enumerate(flat)
+        ]
+
+    def __add__(self, oth):
+        """Addition of two vectors."""
+        return tuple.__new__(Vector, (self[0] + oth[0], self[1] + oth[1]))
+
+    def __radd__(self, oth):
+        """Addition of two vectors."""
+        return tuple.__new__(Vector, (oth[0] + self[0], oth[1] + self[1]))
+
+    def __sub__(self, oth):
+        """Subtraction of two vectors."""
+        return tuple.__new__(Vector, (self[0] - oth[0], self[1] - oth[1]))
+
+    def __rsub__(self, oth):
+        """Subtraction of two vectors."""
+        return tuple.__new__(Vector, (oth[0] - self[0], oth[1] - self[1]))
+
+    def __mul__(self, scale):
+        """Multiply vector by number."""
+        return tuple.__new__(Vector, (self[0] * scale, self[1] * scale))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scale):
+        """Divide vector by number."""
+        return tuple.__new__(Vector, (self[0] / scale, self[1] / scale))
+
+    def __neg__(self):
+        """Return negative of vector."""
+        return tuple.__new__(Vector, (-self[0], -self[1]))
+
+    def length(self):
+        """Return length of vector."""
+        return hypot(self[0], self[1])
+
+    def distance(self, oth):
+        """Return distance to other vector."""
+        return hypot(self[0] - oth[0], self[1] - oth[1])
+
+    def __repr__(self):
+        """Represent Vector in console."""
+        return f'Vector <{self[0]}, {self[1]}>'
@@ -0,0 +1,52 @@
+"""Batch board generation tests."""
+
+import unittest
+
+from minesweeper.logic import engine
+from minesweeper.logic.field import Field
+
+
+class TestGenerateMany(unittest.TestCase):
+    """Boards generated in batches match single fields."""
+
+    def check(self, **kwargs):
+        for kind in ("normal", "hexagon"):
+            width, height = 13, 8
+            size = width * height
+            batches = list(Field.generateMany(10, width, height, 0.3, kind, seed=5, batchSize=4, **kwargs))
+            self.assertEqual([len(seeds) for seeds, _ in batches], [4, 4, 2])
+            for seeds, cells in batches:
+                self.assertEqual(len(cells), len(seeds) * size)
+                for board, seed in enumerate(seeds):
+                    field = Field(width, height, 0.3, kind, seed=seed)
+                    self.assertEqual(cells[board * size:(board + 1) * size], field.cells)
+
+    def test1(self):
+        """Generated in place."""
+        self.check()
+
+    def test2(self):
+        """Generated without NumPy."""
+        numpy, engine.numpy = engine.numpy, None
+        try:
+            self.check()
+        finally:
+            engine.numpy = numpy
+
+    def test3(self):
+        """Generated in worker processes."""
+        self.check(workers=2)
+
+    def test4(self):
+        """Same seed gives same boards, boards can be played."""
+        first = next(Field.generateMany(3, 10, 10, 0.2, seed=1))
+        second = next(Field.generateMany(3, 10, 10, 0.2, seed=1))
+        self.assertEqual(first, second)
+        seeds, cells = first
+        field = Field.fromCells(10, 10, cells[100:200], seed=seeds[1], debug=True)
+        self.assertEqual(field.bombs, 20)
+        self.assertEqual(field.statistic()["cellsRemaning"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Field bitboards tests."""
+
+import unittest
+from unittest import mock
+
+from minesweeper.logic.engine import MARKEDTABLE, bitboard, bitCount, bitIndices
+from minesweeper.logic.field import Field
+from minesweeper.util.minepoint import BOMBTABLE, OPENEDTABLE, SURETABLE, Mask, Flag, Value
+
+
+class TestFieldBitboard(unittest.TestCase):
+    """Bitboards agree with cells."""
+
+    def test1(self):
+        """Bitboards of bombs, opened and flagged cells."""
+        field = Field(13, 9, 0.2, seed=4)
+        self.assertEqual(list(bitIndices(field.bombsBits)), list(field.bombIndices()))
+        self.assertEqual(bitCount(field.bombsBits), field.bombs)
+        self.assertEqual(field.openedBits, 0)
+        field.toggleFlag(field.point(next(field.bombIndices())))
+        self.assertEqual(bitCount(field.flaggedBits), 1)
+        self.assertEqual(field.statistic()["bombsGuessed"], 1)
+
+    def test2(self):
+        """Cached bitboards follow changes."""
+        field = Field(10, 10, 0, seed=5)
+        self.assertEqual(field.openedBits, 0)
+        field[3, 2] = Mask.opened
+        self.assertEqual(field.openedBits, 1 << 23)
+        field.setMany(field.indices(), Flag.sure)
+        self.assertEqual(field.flaggedBits, field.allBits & ~(1 << 23))
+        field.setMany(field.indices(), Flag.noflag)
+        field.reveal(0, 0)
+        self.assertEqual(field.openedBits, field.allBits)
+
+    def test3(self):
+        """Adjacent cells and frontier match neighbor table."""
+        for kind in ("normal", "hexagon"):
+            field = Field(11, 8, 0.2, kind, seed=6)
+            for index in (0, 12, 45, 87):
+                near = sorted(bitIndices(field.adjacent(1 << index)))
+                expected = sorted(i for i in range(field.size) if index in field.neighborsOf(i))
+                self.assertEqual(near, expected, (kind, index))
+            field.setMany(field.indices()[:44], Mask.opened)
+            frontier = set(bitIndices(field.frontier()))
+            expected = {
+                index for index in range(44)
+                if any(near >= 44 for near in field.neighborsOf(index))
+            }
+            self.assertEqual(frontier, expected)
+
+    def test4(self):
+        """Cached bitboards are updated, not rebuilt, on single cell changes."""
+        field = Field(12, 9, 0.2, seed=7)
+        tables = (BOMBTABLE, OPENEDTABLE, MARKEDTABLE, SURETABLE)
+        flagged = field.flaggedBits
+        for table in tables:
+            field.bits(table)
+        bomb = next(field.bombIndices())
+        with mock.patch("minesweeper.logic.field.bitboard", wraps=bitboard) as build:
+            field.toggleFlag(field.point(bomb))
+            field.setAt(bomb + 1, Mask.opened)
+            field.setAt(bomb + 2, Value.barrier)
+            for table in tables:
+                self.assertEqual(field.bits(table), bitboard(field.cells, table))
+        self.assertEqual(build.call_count, 0)
+        self.assertEqual(field.flaggedBits, flagged | 1 << bomb)
+
+
+if __name__ == "__main__":
+    unittest.main()
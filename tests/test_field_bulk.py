@@ -0,0 +1,55 @@
+"""Field bulk access tests."""
+
+import unittest
+
+from minesweeper.logic.engine import BOMBTABLE, OPENEDTABLE
+from minesweeper.logic.field import Field
+from minesweeper.util.minepoint import Value, Mask, Flag
+from minesweeper.util.point import Point
+
+
+class TestFieldBulk(unittest.TestCase):
+    """Whole field passes work with index arrays instead of points."""
+
+    def test1(self):
+        """Point.rangeArrays matches Point.range."""
+        xs, ys = Point.rangeArrays([1, 2], [7, 5], [2, 1])
+        self.assertEqual(list(zip(xs, ys)), [tuple(p) for p in Point.range([1, 2], [7, 5], [2, 1])])
+        with self.assertRaises(ValueError):
+            Point.rangeArrays([3, 3], [1, 1])
+
+    def test2(self):
+        """Indices and coords round trip."""
+        field = Field(7, 4, 0.3, seed=1)
+        self.assertEqual(list(field.indices()), list(range(28)))
+        xs, ys = field.coords()
+        self.assertEqual(list(zip(xs, ys)), [(i % 7, i // 7) for i in range(28)])
+        self.assertEqual(field.indicesOf(xs, ys), field.indices())
+        self.assertEqual(list(zip(*field.coords([8, 27]))), [(1, 1), (6, 3)])
+        with self.assertRaises(ValueError):
+            field.indicesOf([7], [0])
+
+    def test3(self):
+        """Indices by table match per cell checks."""
+        field = Field(9, 9, 0.3, seed=2)
+        self.assertEqual(list(field.indices(BOMBTABLE)), list(field.bombIndices()))
+        self.assertEqual(len(field.indices(OPENEDTABLE)), 0)
+
+    def test4(self):
+        """Bulk getters and setters keep statistic."""
+        field = Field(9, 9, 0.3, seed=3)
+        bombs = field.indices(BOMBTABLE)
+        field.setMany(bombs, Flag.sure)
+        self.assertEqual(field.statistic()["bombsGuessed"], field.bombs)
+        self.assertTrue(all(field.cellAt(index) == Flag.sure for index in bombs))
+        self.assertEqual(field.getMany([0, 5]), bytes([field.getRaw(0), field.getRaw(5)]))
+        field.setMany([0] * field.size, Mask.opened)
+        self.assertEqual(field.statistic()["cellsOpened"], 1)
+        field.setMany(None, Mask.opened)
+        self.assertEqual(field.statistic()["cellsOpened"], field.size)
+        self.assertTrue(all(field[pos] == Mask.opened for pos in field))
+        self.assertEqual(field[field.point(bombs[0])], Value.bomb)
+
+
+if __name__ == "__main__":
+    unittest.main()
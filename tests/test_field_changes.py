@@ -0,0 +1,52 @@
+"""Field change journal tests."""
+
+import tracemalloc
+import unittest
+
+from minesweeper.logic.field import Field
+from minesweeper.util.minepoint import Flag, Mask, Value, BOMBTABLE
+
+
+class TestFieldChanges(unittest.TestCase):
+    """Field reports changed cells once."""
+
+    def test1(self):
+        """Flags and item assignment."""
+        field = Field(5, 4, 0.2, seed=1)
+        self.assertEqual(list(field.drainChanges()), [])
+        field.cycleFlag(1, 2)
+        field.toggleFlag(3, 0)
+        field[4, 3] = Flag.noflag
+        self.assertEqual(list(field.drainChanges()), [3, 11])
+        self.assertEqual(list(field.drainChanges()), [])
+
+    def test2(self):
+        """Reveal, bulk set and recalculate."""
+        field = Field(8, 8, 0.1, seed=4)
+        start = next(i for i in field.indices() if not BOMBTABLE[field.getRaw(i)])
+        revealed = field.reveal(field.point(start))
+        self.assertEqual(list(field.drainChanges()), sorted(revealed))
+        field.setMany([5, 2], Mask.opened)
+        self.assertEqual(set(field.drainChanges()), {2, 5})
+        field.setAt(0, Value.barrier)
+        field.recalculate()
+        self.assertEqual(len(field.drainChanges()), field.size)
+
+    def test3(self):
+        """Journal memory does not grow with amount of changed cells."""
+        # first reveal of a size fills shared caches
+        Field(500, 500, 0, seed=1).reveal(0, 0)
+        field = Field(500, 500, 0, seed=1)
+        tracemalloc.start()
+        try:
+            revealed = field.reveal(0, 0)
+            used = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(revealed), field.size)
+        self.assertLess(used - len(revealed) * revealed.itemsize, field.size)
+        self.assertEqual(field.drainChanges(), field.indices())
+
+
+if __name__ == "__main__":
+    unittest.main()
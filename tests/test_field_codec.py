@@ -0,0 +1,67 @@
+"""Field cells codec tests."""
+
+import random
+import unittest
+
+from minesweeper.logic import codec
+from minesweeper.logic.field import Field
+
+
+class TestCodec(unittest.TestCase):
+    """Encoded cells are decoded back the same."""
+
+    def test1(self):
+        """Run-length round trip."""
+        rnd = random.Random(1)
+        samples = [b"", b"\x00", b"\x01\x02\x03", bytes(1000), bytes(range(256)) * 3]
+        samples += [bytes(rnd.choice(b"\x00\x00\x00\x10\x11\x1f") for _ in range(500))]
+        for cells in samples:
+            self.assertEqual(codec.decode(codec.encode(cells)), cells)
+
+    def test2(self):
+        """Big boards are compressed."""
+        field = Field(200, 200, 0.1, seed=3)
+        field.reveal(next(p for p in field if field[p].value == 0))
+        data = codec.encode(field.cells)
+        self.assertLess(len(data), len(field.cells))
+        self.assertEqual(codec.decode(data), field.cells)
+
+    def test3(self):
+        """Delta of one move is small."""
+        field = Field(100, 100, 0.15, seed=5)
+        old = bytes(field.cells)
+        field.toggleFlag(50, 50)
+        delta = codec.encodeDelta(old, field.cells)
+        self.assertLessEqual(len(delta), 4)
+        self.assertEqual(codec.applyDelta(bytearray(old), delta), field.cells)
+
+    def test4(self):
+        """Stream of moves is restored frame by frame."""
+        field = Field(60, 40, 0.15, seed=9)
+        encoder, decoder = codec.StreamEncoder(keyEvery=5), codec.StreamDecoder()
+        rnd = random.Random(9)
+        for _ in range(20):
+            point = (rnd.randrange(60), rnd.randrange(40))
+            if rnd.random() < 0.5:
+                field.cycleFlag(point)
+            elif point not in field.bombsPos:
+                field.reveal(point)
+            self.assertEqual(decoder.decode(encoder.encode(field.cells)), field.cells)
+
+    def test5(self):
+        """Delta before key frame."""
+        with self.assertRaises(ValueError):
+            codec.StreamDecoder().decode(codec.DELTAFRAME)
+
+    def test6(self):
+        """Field snapshot without bombs around values."""
+        for kind in ("normal", "hexagon"):
+            field = Field(50, 30, 0.2, kind, seed=2)
+            field.reveal(next(p for p in field if field[p].value == 0))
+            data = codec.encodeField(field)
+            self.assertLess(len(data), len(codec.encode(field.cells)))
+            self.assertEqual(codec.decodeField(data, 50, 30, kind), field.cells)
+
+
+if __name__ == "__main__":
+    unittest.main()
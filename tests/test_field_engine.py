@@ -0,0 +1,94 @@
+"""Field bombs counting engine tests."""
+
+import random
+import unittest
+from array import array
+
+from minesweeper.logic import engine
+from minesweeper.logic.field import neighborStride, neighborTable, patternBiases
+from minesweeper.util.minepoint import MinePoint, Value
+
+
+def randomCells(size, seed):
+    """Generate cells with bombs, barriers and some mask/flag bits."""
+    rnd = random.Random(seed)
+    cells = bytearray(rnd.choice([0, 0, 0, 0x10, 0x80]) for _ in range(size))
+    for index in range(size):
+        roll = rnd.random()
+        if roll < 0.2:
+            cells[index] |= Value.bomb
+        elif roll < 0.3:
+            cells[index] |= Value.barrier
+        else:
+            cells[index] |= rnd.randrange(9)
+    return cells
+
+
+def bruteCountBombs(cells, kind, width, height):
+    """Count bombs around using neighbor table."""
+    result = bytearray(cells)
+    table, stride = neighborTable(kind, width, height), neighborStride(kind)
+    for index in range(width * height):
+        if cells[index] & MinePoint.VALUE in (Value.bomb, Value.barrier):
+            continue
+        around = [near for near in table[index * stride:(index + 1) * stride] if near >= 0]
+        count = sum(cells[near] & MinePoint.VALUE == Value.bomb for near in around)
+        result[index] = (cells[index] & ~MinePoint.VALUE) | count
+    return result
+
+
+class TestCountBombs(unittest.TestCase):
+    """Counting engines give the same values as direct neighbor walk."""
+
+    sizes = [(1, 1), (1, 7), (7, 1), (10, 10), (13, 8), (8, 13)]
+
+    def check(self, count):
+        for kind in ("normal", "hexagon"):
+            for seed, (width, height) in enumerate(self.sizes):
+                cells = randomCells(width * height, seed)
+                expected = bruteCountBombs(cells, kind, width, height)
+                count(cells, width, height, patternBiases(kind))
+                self.assertEqual(cells, expected, (kind, width, height))
+
+    def test1(self):
+        """Pure python engine."""
+        self.check(engine.pythonCountBombs)
+
+    @unittest.skipIf(engine.numpy is None, "NumPy is not installed")
+    def test2(self):
+        """NumPy engine."""
+        self.check(engine.numpyCountBombs)
+
+
+class TestReveal(unittest.TestCase):
+    """Scanline reveal opens the same cells as reveal by neighbor table."""
+
+    def test1(self):
+        """Random fields with flags and opened cells."""
+        for seed in range(40):
+            rnd = random.Random(seed)
+            width, height = rnd.randrange(1, 30), rnd.randrange(1, 30)
+            cells = bytearray(width * height)
+            engine.placeBombs(cells, rnd, int(width * height * rnd.random() * 0.3))
+            engine.countBombs(cells, width, height, patternBiases("normal"))
+            for _ in range(rnd.randrange(10)):
+                cells[rnd.randrange(len(cells))] |= rnd.choice([0x10, 0x40, 0x80])
+            start = rnd.randrange(len(cells))
+            if cells[start] & MinePoint.VALUE == Value.bomb:
+                continue
+            cells[start] |= engine.OPENED
+            expected = bytearray(cells)
+            table = neighborTable("normal", width, height)
+            expectedRevealed = engine.revealTable(expected, table, 8, start)
+            revealed = engine.revealSquare(cells, width, height, start)
+            self.assertEqual(cells, expected)
+            self.assertEqual(list(revealed), sorted(expectedRevealed))
+
+    def test2(self):
+        """Index ranges built from big integer lanes."""
+        for first, last in [(0, 0), (5, 3), (0, 1), (7, 300), (123456, 200001)]:
+            self.assertEqual(engine.indexRange(first, last), array("i", range(first, last)))
+
+
+if __name__ == "__main__":
+    unittest.main()
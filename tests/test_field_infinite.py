@@ -0,0 +1,79 @@
+"""Infinite field tests."""
+
+import unittest
+
+from minesweeper.logic.field import Field, patternBiases
+from minesweeper.logic.infinite import InfiniteField
+from minesweeper.util.minepoint import Value, Mask, Flag, EMPTYTABLE
+from minesweeper.util.point import Point
+
+
+class TestInfiniteField(unittest.TestCase):
+    """Chunked lazily generated field."""
+
+    def test1(self):
+        """Values are counted across chunk borders."""
+        for kind in ("normal", "hexagon"):
+            field = InfiniteField(0.3, kind, seed=7, chunkSize=8, hotChunks=4)
+            biases = patternBiases(kind)
+            for x in range(-12, 12):
+                for y in range(-12, 12):
+                    if field[x, y] == Value.bomb:
+                        continue
+                    around = sum(
+                        field[x + dx, y + dy] == Value.bomb for dx, dy in biases[y % 2]
+                    )
+                    self.assertEqual(field[x, y].value, around, (kind, x, y))
+
+    def test2(self):
+        """Same seed gives same field."""
+        first = InfiniteField(0.2, seed=3, chunkSize=16)
+        second = InfiniteField(0.2, seed=3, chunkSize=16)
+        for x, y in [(0, 0), (-100, 40), (1000, -1000), (15, 16)]:
+            self.assertEqual(first.getRaw((x, y)), second.getRaw((x, y)))
+
+    def test3(self):
+        """Only visited chunks are materialized, changes survive eviction."""
+        field = InfiniteField(0.2, seed=1, chunkSize=8, hotChunks=2)
+        field[1000, 1000] = Flag.sure
+        self.assertEqual(field.chunksHot, 1)
+        for x in range(0, 80, 8):
+            field.getRaw((x, 0))
+        self.assertEqual(field.chunksHot, 2)
+        self.assertEqual(field.chunksCold, 1)
+        self.assertEqual(field[1000, 1000], Flag.sure)
+
+    def test4(self):
+        """Reveal floods across chunks and stays bounded."""
+        field = InfiniteField(0, seed=1, chunkSize=8, hotChunks=1000, maxReveal=500)
+        revealed = field.reveal(3, 3)
+        self.assertEqual(len(revealed), 500)
+        self.assertEqual(revealed[0], Point(3, 3))
+        self.assertTrue(all(field[point] == Mask.opened for point in revealed))
+        self.assertGreater(field.chunksHot, 1)
+        resumed = field.reveal(3, 3)
+        self.assertEqual(len(resumed), 500)
+        self.assertFalse(set(revealed) & set(resumed))
+        with self.assertRaises(ValueError):
+            InfiniteField(0.1, hotChunks=0)
+
+    def test5(self):
+        """Reveal opens the same cells as finite field."""
+        field = Field(40, 30, 0.1, seed=9)
+        infinite = InfiniteField(0, seed=1, chunkSize=8)
+        for point in field:
+            infinite.setRaw(tuple(point), field.getRaw(field.index(point)))
+        # fence field with barriers, so flood stays inside
+        for x in range(-1, 41):
+            infinite[x, -1] = infinite[x, 30] = Value.barrier
+        for y in range(-1, 31):
+            infinite[-1, y] = infinite[40, y] = Value.barrier
+        start = next(i for i in field.indices(EMPTYTABLE))
+        expected = field.reveal(field.point(start))
+        revealed = infinite.reveal(field.point(start))
+        self.assertEqual(revealed[0], field.point(expected[0]))
+        self.assertEqual(set(revealed), {field.point(index) for index in expected})
+
+
+if __name__ == "__main__":
+    unittest.main()
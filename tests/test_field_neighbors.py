@@ -0,0 +1,92 @@
+"""Field neighbor table tests."""
+
+import unittest
+
+from minesweeper.logic.field import (
+    Field, neighborStride, neighborTable, NoramlPattern, HexagonPatter,
+)
+from minesweeper.util.point import Point
+
+
+class TestNeighborTable(unittest.TestCase):
+    """Neighbor tables match field patterns."""
+
+    def check(self, kind, pattern, width, height):
+        table = neighborTable(kind, width, height)
+        stride = neighborStride(kind)
+        self.assertEqual(len(table), width * height * stride)
+        for x, y in Point.range([width, height]):
+            expected = set()
+            for bias in pattern(Point(x, y)):
+                near = Point(x, y) + bias
+                if 0 <= near.x < width and 0 <= near.y < height:
+                    expected.add(near.y * width + near.x)
+            around = table[(y * width + x) * stride:(y * width + x + 1) * stride]
+            self.assertEqual(set(around) - {-1}, expected)
+            self.assertEqual(len(expected) + list(around).count(-1), stride)
+
+    def test1(self):
+        """Rectangular pattern."""
+        self.check("normal", NoramlPattern, 7, 5)
+
+    def test2(self):
+        """Hexagonal pattern with row parity."""
+        self.check("hexagon", HexagonPatter, 6, 7)
+
+    def test3(self):
+        """Tables are shared between fields of one size."""
+        self.assertIs(Field(9, 9, 0.1).neighbors, Field(9, 9, 0.2).neighbors)
+        self.assertIsNot(Field(9, 9, 0.1).neighbors, Field(9, 9, 0.1, kind="hexagon").neighbors)
+
+    def test5(self):
+        """Big tables are not cached, but built once for each field."""
+        first, second = (Field(300, 301, 0.1, kind="hexagon") for _ in range(2))
+        self.assertIs(first.neighbors, first.neighbors)
+        self.assertIsNot(first.neighbors, second.neighbors)
+        self.assertEqual(first.neighbors, second.neighbors)
+        self.assertEqual(first.neighborsOf(0), [1, 300, 301])
+        self.assertEqual(first.neighborsOf(301), [0, 1, 300, 302, 600, 601])
+
+    def test4(self):
+        """Unknown kind."""
+        with self.assertRaises(ValueError):
+            neighborTable("triangle", 3, 3)
+
+
+class TestReveal(unittest.TestCase):
+    """Reveal floods through empty cells."""
+
+    def test1(self):
+        """Empty field opens at once."""
+        field = Field(12, 8, 0)
+        self.assertEqual(len(field.reveal(3, 3)), 12 * 8)
+        self.assertEqual(len(field.reveal(0, 0)), 0)
+
+    def test2(self):
+        """Bomb is reported."""
+        field = Field(12, 8, 0.5)
+        bomb = next(iter(field.bombsPos))
+        self.assertIsNone(field.reveal(bomb))
+
+    def test3(self):
+        """Revealed cells are exactly the flood of empty cells and their border."""
+        for kind in ("normal", "hexagon"):
+            field = Field(30, 20, 0.1, kind=kind)
+            start = next(p for p in field if field[p].value == 0)
+            revealed = list(field.reveal(start))
+            self.assertEqual(len(revealed), len(set(revealed)))
+            revealed = set(revealed)
+
+            expected, stack = set(), [field.index(start)]
+            while stack:
+                index = stack.pop()
+                if index in expected:
+                    continue
+                expected.add(index)
+                if field.cellAt(index).value == 0:
+                    stack.extend(field.neighborsOf(index))
+            self.assertEqual(revealed, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Field binary snapshot tests."""
+
+import os
+import tempfile
+import unittest
+
+from minesweeper.logic.field import Field
+from minesweeper.util.minepoint import Flag
+
+
+class TestSnapshot(unittest.TestCase):
+    """Field save/load round trip."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "field.bin")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test1(self):
+        """Saved field is loaded back the same."""
+        for kind in ("normal", "hexagon"):
+            field = Field(40, 30, 0.2, kind, seed=11)
+            field.reveal(next(p for p in field if field[p].value == 0))
+            field.toggleFlag(next(iter(field.bombsPos)))
+            field.save(self.path)
+            loaded = Field.load(self.path)
+            self.assertEqual(loaded.cells, field.cells)
+            self.assertEqual((loaded.width, loaded.height, loaded.kind), (40, 30, kind))
+            self.assertEqual((loaded.seed, loaded.bombs), (11, field.bombs))
+            self.assertEqual(loaded.statistic(), field.statistic())
+
+    def test2(self):
+        """Memory-mapped field is read-only."""
+        field = Field(20, 10, 0.2, seed=1)
+        field.save(self.path)
+        loaded = Field.load(self.path, readonly=True)
+        self.assertEqual(bytes(loaded.cells), bytes(field.cells))
+        self.assertEqual(loaded.bombsPos, field.bombsPos)
+        with self.assertRaises(TypeError):
+            loaded[0, 0] = Flag.sure
+
+    def test3(self):
+        """Broken files are rejected."""
+        with open(self.path, "wb") as f:
+            f.write(b"not a snapshot at all, definitely")
+        with self.assertRaises(ValueError):
+            Field.load(self.path)
+        for data in (b"", b"MSWF\x01"):
+            with open(self.path, "wb") as f:
+                f.write(data)
+            with self.assertRaisesRegex(ValueError, "is not a field snapshot"):
+                Field.load(self.path)
+        Field(20, 10, 0.2, seed=1).save(self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(100)
+        with self.assertRaises(ValueError):
+            Field.load(self.path)
+
+    def test4(self):
+        """Seeds which do not fit the format."""
+        with self.assertRaises(ValueError):
+            Field(5, 5, 0.2, seed="text").save(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
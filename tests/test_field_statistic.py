@@ -0,0 +1,62 @@
+"""Field statistic counters tests."""
+
+import random
+import unittest
+
+from minesweeper.logic.field import Field
+from minesweeper.util.minepoint import Value, Mask, Flag
+
+
+class TestStatistic(unittest.TestCase):
+    """Running counters always match full field scan."""
+
+    def play(self, field, moves, seed):
+        rnd = random.Random(seed)
+        for _ in range(moves):
+            point = (rnd.randrange(field.width), rnd.randrange(field.height))
+            action = rnd.randrange(5)
+            if action == 0:
+                field.toggleFlag(point)
+            elif action == 1:
+                field.cycleFlag(point)
+            elif action == 2:
+                field[point].flag = Flag.sure
+            elif action == 3:
+                field[point] = Mask.opened
+            elif field[point] != Value.bomb:
+                field.reveal(point)
+            field.statistic()
+
+    def test1(self):
+        """Random play on both kinds of fields."""
+        for seed, kind in enumerate(("normal", "hexagon")):
+            field = Field(25, 15, 0.2, kind=kind, seed=seed, debug=True)
+            self.play(field, 300, seed)
+
+    def test2(self):
+        """Statistic values of the fresh and won field."""
+        field = Field(10, 10, 0.1, debug=True)
+        stat = field.statistic()
+        self.assertEqual(stat["cellsRemaning"], 100)
+        self.assertEqual(stat["bombsLeft"], 10)
+        for index in range(field.size):
+            cell = field.cellAt(index)
+            if cell == Value.bomb:
+                cell.flag = Flag.sure
+            else:
+                cell.mask = Mask.opened
+        stat = field.statistic()
+        self.assertEqual(stat["cellsRemaning"], 0)
+        self.assertTrue(stat["allBombsCorrect"])
+        self.assertEqual(stat["cellsTotal"], 100)
+
+    def test3(self):
+        """Counters mismatch is detected in debug mode."""
+        field = Field(10, 10, 0.1, debug=True)
+        field.cells[0] |= Mask.opened << 4
+        with self.assertRaises(RuntimeError):
+            field.statistic()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Field packed storage tests."""
+
+import unittest
+
+from minesweeper.logic.field import Field
+from minesweeper.util.minepoint import MinePoint, Value, Mask, Flag
+
+
+class TestFieldStorage(unittest.TestCase):
+    """Field cells are kept in one packed bytearray."""
+
+    def test1(self):
+        """Storage is one byte per cell."""
+        field = Field(40, 25, 0.2)
+        self.assertIsInstance(field.cells, bytearray)
+        self.assertEqual(len(field.cells), 40 * 25)
+
+    def test2(self):
+        """Bombs count matches requested percent."""
+        field = Field(40, 25, 0.2)
+        self.assertEqual(len(field.bombsPos), field.bombs)
+        self.assertEqual(len(list(field.bombIndices())), 200)
+
+    def test3(self):
+        """Cell view writes through to the field storage."""
+        field = Field(10, 10, 0)
+        cell = field[3, 4]
+        cell.flag = Flag.sure
+        self.assertEqual(field[3, 4], Flag.sure)
+        self.assertEqual(field.cells[field.index(3, 4)] >> MinePoint.FSHIFT, Flag.sure)
+
+    def test4(self):
+        """Setting values by coordinates keeps other bits."""
+        field = Field(10, 10, 0)
+        field[1, 1] = Flag.guess
+        field[1, 1] = Mask.opened
+        field[1, 1] = Value.bomb
+        self.assertEqual(field[1, 1], Flag.guess)
+        self.assertEqual(field[1, 1], Mask.opened)
+        self.assertEqual(field[1, 1], Value.bomb)
+        self.assertEqual(field.bombsPos, {field.point(11)})
+
+    def test5(self):
+        """Values around bombs are counted."""
+        field = Field(20, 20, 0.3)
+        for x, y in field:
+            if field[x, y] == Value.bomb:
+                continue
+            around = sum(
+                field.inBounds(x + dx, y + dy) and field[x + dx, y + dy] == Value.bomb
+                for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+            )
+            self.assertEqual(field[x, y].value, around)
+
+    def test6(self):
+        """Out of bound access."""
+        field = Field(5, 5, 0)
+        self.assertEqual(field[5, 0], Field.OUTOFBOUND)
+        with self.assertRaises(ValueError):
+            field[-1, 0] = Flag.sure
+
+    def test7(self):
+        """Same seed gives same field."""
+        for kind in ("normal", "hexagon"):
+            field = Field(30, 20, 0.4, kind=kind, seed=42)
+            self.assertEqual(field.seed, 42)
+            self.assertEqual(field.cells, Field(30, 20, 0.4, kind=kind, seed=42).cells)
+            self.assertEqual(Field(30, 20, 0.4, seed=field.seed).bombsPos, field.bombsPos)
+
+    def test8(self):
+        """Dense and full fields get exact amount of bombs."""
+        for percent in (0.05, 0.4, 0.9, 1):
+            field = Field(25, 16, percent)
+            self.assertEqual(len(list(field.bombIndices())), field.bombs)
+
+
+if __name__ == "__main__":
+    unittest.main()
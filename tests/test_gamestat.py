@@ -0,0 +1,151 @@
+"""Game statistic tests."""
+
+import contextlib
+import io
+import os
+import pickle
+import tempfile
+import unittest
+
+from minesweeper.logic.gamestat import Stat, RECORD, LOGHEADER, migrate, migrateUser
+
+
+class TestGameStat(unittest.TestCase):
+    """Statistic is kept in append-only log."""
+
+    def setUp(self):
+        """Create temporary statistic folder."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = self.tmp.name
+
+    def tearDown(self):
+        """Remove temporary statistic folder."""
+        self.tmp.cleanup()
+
+    def play(self, stat, games):
+        """Save games given as (gametime, win) pairs."""
+        for gametime, win in games:
+            stat["gametime"], stat["win"] = gametime, win
+            stat.saveStatistic()
+
+    def test1(self):
+        """Saved records are read back."""
+        stat = Stat(self.folder)
+        path = stat.assignFile("user")
+        stat["size"], stat["difficulty"], stat["seed"] = 8, 0.25, 2 ** 63
+        self.play(stat, [(10, True), (4, False), (7, True)])
+        stat.close()
+        self.assertEqual(os.path.getsize(path), LOGHEADER.size + 3 * RECORD.size)
+
+        stat = Stat(self.folder)
+        stat.assignFile("user")
+        stat.readStatistic()
+        records = list(stat.records())
+        self.assertEqual(len(stat), 3)
+        self.assertEqual([(r.gametime, r.win) for r in records], [(10, True), (4, False), (7, True)])
+        self.assertEqual((records[0].size, records[0].difficulty, records[0].seed), (8, 0.25, 2 ** 63))
+        self.assertGreater(records[0].timestamp, 0)
+        stat.close()
+
+    def test2(self):
+        """Torn last record is dropped."""
+        stat = Stat(self.folder)
+        path = stat.assignFile("user")
+        self.play(stat, [(10, True), (4, False)])
+        stat.close()
+        with open(path, "r+b") as f:
+            f.truncate(LOGHEADER.size + RECORD.size + 5)
+        stat.assignFile("user")
+        stat.readStatistic()
+        self.assertEqual(len(stat), 1)
+        self.play(stat, [(3, True)])
+        stat.close()
+        stat.readStatistic()
+        self.assertEqual([r.gametime for r in stat.records()], [10, 3])
+        stat.close()
+
+    def test3(self):
+        """Legacy pickle files are converted once."""
+        with open(os.path.join(self.folder, "old.bin"), "wb") as f:
+            pickle.dump([[5.0, True], [9.0, False]], f)
+        self.assertEqual(len(migrate(self.folder)), 1)
+        self.assertEqual(migrate(self.folder), [])
+        stat = Stat(self.folder)
+        stat.assignFile("old")
+        stat.readStatistic()
+        self.assertEqual([(r.gametime, r.win) for r in stat.records()], [(5.0, True), (9.0, False)])
+        stat["gametime"], stat["win"] = 7, True
+        self.assertEqual(stat.findBest()[2], 2)
+        stat.close()
+        self.assertTrue(os.path.exists(os.path.join(self.folder, "old.bin")))
+
+    def test4(self):
+        """Aggregates per size and difficulty."""
+        stat = Stat(self.folder)
+        stat.assignFile("user")
+        stat["size"], stat["difficulty"] = 8, 0.2
+        self.play(stat, [(10, True), (4, False), (6, True)])
+        stat["size"], stat["difficulty"] = 12, 0.2
+        self.play(stat, [(30, True)])
+        self.assertEqual([size for size, _ in sorted(stat.buckets())], [8, 12])
+        small = stat.aggregate(8, 0.2)
+        self.assertEqual((small.count, small.wins, small.best, small.mean), (3, 2, 6, 8))
+        self.assertEqual(small.deviation, 2)
+        total = stat.aggregate(difficulty=0.2)
+        self.assertEqual((total.count, total.wins, total.best), (4, 3, 6))
+        stat["gametime"], stat["win"] = 2, True
+        self.assertEqual(stat.findBest(), (2, 12, 4))
+        stat.close()
+
+    def test5(self):
+        """Aggregates are persisted and rebuilt when stale."""
+        stat = Stat(self.folder)
+        stat.assignFile("user")
+        self.play(stat, [(10, True), (4, False)])
+        stat.close()
+        stat = Stat(self.folder)
+        stat.assignFile("user")
+        self.assertEqual(stat.aggregate().count, 2)
+        os.remove(stat.aggpath)
+        self.play(stat, [(3, True)])
+        stat.close()
+        with open(stat.filepath, "ab") as f:
+            f.write(RECORD.pack(0, 1, True, 0, 0, 0))
+        stat = Stat(self.folder)
+        stat.assignFile("user")
+        agg = stat.aggregate()
+        self.assertEqual((agg.count, agg.wins, agg.best), (4, 3, 1))
+        stat.close()
+
+    def test6(self):
+        """Saved current game is counted once."""
+        stat = Stat(self.folder)
+        stat.assignFile("user")
+        self.play(stat, [(12, True)])
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            stat.print()
+        lines = output.getvalue().splitlines()
+        self.assertIn("│ Games played:      1", lines)
+        self.assertIn("│ Games won:         1", lines)
+        self.assertEqual(stat.findBest(), (12, 12, 1))
+        stat["gametime"], stat["win"] = 5, True
+        self.assertEqual(stat.findBest(), (5, 8.5, 2))
+        stat.close()
+
+    def test7(self):
+        """Assign converts only legacy file of assigned user."""
+        for name in ("first", "second"):
+            with open(os.path.join(self.folder, name + ".bin"), "wb") as f:
+                pickle.dump([[5.0, True]], f)
+        stat = Stat(self.folder)
+        stat.assignFile("first")
+        self.assertEqual(stat.aggregate().wins, 1)
+        stat.close()
+        self.assertFalse(os.path.exists(os.path.join(self.folder, "second.log")))
+        self.assertEqual(migrateUser(self.folder, "first"), None)
+        self.assertEqual(len(migrate(self.folder)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
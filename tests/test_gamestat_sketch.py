@@ -0,0 +1,102 @@
+"""Win time sketches tests."""
+
+import os
+import pickle
+import random
+import tempfile
+import unittest
+
+from minesweeper.logic.gamestat import Stat, leaderboard
+from minesweeper.logic.sketch import QuantileSketch, Histogram
+
+
+class TestGameStatSketch(unittest.TestCase):
+    """Quantiles and histograms of win times."""
+
+    def test1(self):
+        """Quantiles are within relative accuracy."""
+        rnd = random.Random(7)
+        values = sorted(rnd.lognormvariate(4, 1) for _ in range(5000))
+        sketch = QuantileSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        for q in (0, 0.1, 0.5, 0.9, 0.99, 1):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q) / exact, 1, delta=0.0101)
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+    def test2(self):
+        """Merged and deserialized sketches are the same."""
+        first, second, both = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 200):
+            (first if value % 3 else second).add(value)
+            both.add(value)
+        first.merge(second)
+        restored, offset = QuantileSketch.fromBytes(first.toBytes())
+        self.assertEqual(offset, len(first.toBytes()))
+        for q in (0.25, 0.5, 0.75):
+            self.assertEqual(first.quantile(q), both.quantile(q))
+            self.assertEqual(restored.quantile(q), both.quantile(q))
+        with self.assertRaises(ValueError):
+            first.merge(QuantileSketch(0.05))
+
+    def test3(self):
+        """Histogram buckets."""
+        histogram = Histogram((10, 60))
+        for value in (1, 10, 30, 59, 600):
+            histogram.add(value)
+        self.assertEqual(histogram.buckets(), [(None, 10, 1), (10, 60, 3), (60, None, 1)])
+        restored, _ = Histogram.fromBytes(histogram.merge(histogram).toBytes())
+        self.assertEqual(restored.counts, [2, 6, 2])
+
+    def test4(self):
+        """Statistic keeps sketches per bucket and builds leaderboard."""
+        with tempfile.TemporaryDirectory() as folder:
+            for name, times in [("slow", [50, 70, 90]), ("fast", [5, 7, 9]), ("none", [])]:
+                stat = Stat(folder)
+                stat.assignFile(name)
+                stat["size"], stat["difficulty"] = 8, 0.2
+                for gametime in times:
+                    stat["gametime"], stat["win"] = gametime, True
+                    stat.saveStatistic()
+                stat["win"] = False
+                stat.saveStatistic()
+                stat.close()
+
+            stat = Stat(folder)
+            stat.assignFile("slow")
+            self.assertAlmostEqual(stat.quantiles((0.5,), 8, 0.2)[0.5], 70, delta=0.7)
+            self.assertEqual(sum(stat.histogram(difficulty=0.2).counts), 3)
+            stat.close()
+
+            with open(os.path.join(folder, "legacy.bin"), "wb") as f:
+                pickle.dump([[20.0, True]], f)
+            os.remove(os.path.join(folder, "slow.agg"))
+            before = {name: os.stat(os.path.join(folder, name)).st_mtime_ns
+                      for name in os.listdir(folder)}
+            rows = leaderboard(folder=folder)
+            after = {name: os.stat(os.path.join(folder, name)).st_mtime_ns
+                     for name in os.listdir(folder)}
+            self.assertEqual(after, before)
+            self.assertEqual([name for name, _ in rows], ["fast", "legacy", "slow", "none"])
+            rows = [row for row in rows if row[0] != "legacy"]
+            total = rows[0][1].merge(rows[1][1])
+            self.assertEqual((total.wins, total.best), (6, 5))
+            self.assertAlmostEqual(total.median, 9, delta=0.1)
+
+    def test5(self):
+        """Sketch keeps at most maxBins bins, high quantiles stay accurate."""
+        sketch = QuantileSketch(0.01, maxBins=100)
+        for value in range(1, 100001):
+            sketch.add(value)
+        self.assertEqual(len(sketch), 100)
+        self.assertEqual(sketch.count, 100000)
+        self.assertAlmostEqual(sketch.quantile(0.99) / 99000, 1, delta=0.0101)
+        capped = QuantileSketch(0.01, maxBins=10).merge(sketch)
+        self.assertEqual(len(capped), 10)
+        with self.assertRaises(ValueError):
+            QuantileSketch(maxBins=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""SQLite statistic tests."""
+
+import os
+import pickle
+import tempfile
+import unittest
+
+from minesweeper.logic.gamestat import Stat
+from minesweeper.logic.sketch import Histogram
+from minesweeper.logic.sqlstat import SqlStat
+
+
+class TestGameStatSql(unittest.TestCase):
+    """SqlStat keeps Stat interface over shared database."""
+
+    def setUp(self):
+        """Create temporary database."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "stat.sqlite3")
+
+    def tearDown(self):
+        """Remove temporary database."""
+        self.tmp.cleanup()
+
+    def play(self, stat, user, games, size=8, difficulty=0.2):
+        """Save games given as (gametime, win) pairs of user."""
+        stat.assignFile(user)
+        stat["size"], stat["difficulty"], stat["seed"] = size, difficulty, 2 ** 64 - 1
+        for gametime, win in games:
+            stat["gametime"], stat["win"] = gametime, win
+            stat.saveStatistic()
+
+    def test1(self):
+        """Same surface as Stat."""
+        stat = SqlStat(self.path, syncEvery=2)
+        self.play(stat, "alice", [(10, True), (4, False), (6, True)])
+        stat.readStatistic()
+        self.assertEqual(len(stat), 3)
+        records = list(stat.records())
+        self.assertEqual([(r.gametime, r.win) for r in records], [(10, True), (4, False), (6, True)])
+        self.assertEqual(records[0].seed, 2 ** 64 - 1)
+        stat["gametime"], stat["win"] = 2, True
+        self.assertEqual(stat.findBest(), (2, 6, 3))
+        self.assertEqual(stat.aggregate(8, 0.2).count, 3)
+        self.assertEqual(stat.aggregate(9).count, 0)
+        stat["gametime"], stat["win"] = 3, True
+        stat.saveStatistic()
+        self.assertEqual(stat.findBest(), (3, 19 / 3, 3))
+        stat.close()
+
+    def test2(self):
+        """Quantiles, histogram and leaderboard."""
+        stat = SqlStat(self.path)
+        self.play(stat, "alice", [(t, True) for t in range(10, 110, 10)])
+        self.play(stat, "bob", [(5, True), (500, True), (1, False)])
+        self.play(stat, "carol", [(3, True)], size=12)
+        stat.assignFile("alice")
+        self.assertEqual(stat.quantiles((0, 0.5, 1)), {0: 10, 0.5: 50, 1: 100})
+        expected = Histogram()
+        for gametime in range(10, 110, 10):
+            expected.add(gametime)
+        self.assertEqual(stat.histogram().counts, expected.counts)
+        board = stat.leaderboard(8, 0.2)
+        self.assertEqual([row[:3] for row in board], [("bob", 5, 2), ("alice", 10, 10)])
+        self.assertEqual(stat.leaderboard()[0][0], "carol")
+        stat.close()
+
+    def test3(self):
+        """Legacy files are imported once."""
+        folder = os.path.join(self.tmp.name, "stat")
+        os.mkdir(folder)
+        with open(os.path.join(folder, "old.bin"), "wb") as f:
+            pickle.dump([[5.0, True], [9.0, False]], f)
+        stat = SqlStat(self.path)
+        self.assertEqual(stat.importLegacy(folder), 2)
+        self.assertEqual(stat.importLegacy(folder), 0)
+        log = Stat(folder)
+        self.play(log, "old", [(4, True)])
+        log.close()
+        self.assertEqual(stat.importLegacy(folder), 1)
+        stat.assignFile("old")
+        self.assertEqual(stat.findBest()[:1] + (len(stat),), (4, 3))
+        stat.close()
+
+    def test4(self):
+        """Saved games are kept without close."""
+        stat = SqlStat(self.path)
+        self.play(stat, "alice", [(t, True) for t in range(1, 6)])
+        other = SqlStat(self.path)
+        other.assignFile("alice")
+        self.assertEqual(len(other), 5)
+        other.close()
+        stat.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+"""MinePoint predicate tables tests."""
+
+import unittest
+
+from minesweeper.util.minepoint import (
+    MinePoint, Value, Mask, Flag, BOMBTABLE, CHARTABLE, CLOSEDTABLE, GUESSTABLE, NUMBERTABLE,
+    equalTable,
+)
+
+
+class TestMinePointTables(unittest.TestCase):
+    """Tables over packed byte agree with MinePoint comparisons."""
+
+    def test1(self):
+        """Equal tables match comparison for every byte and member."""
+        cell = MinePoint()
+        for member in [*Value, *Mask, *Flag]:
+            table = equalTable(member)
+            for raw in range(256):
+                cell.raw = raw
+                self.assertEqual(table[raw], cell == member, (member, raw))
+
+    def test2(self):
+        """Named tables."""
+        cell = MinePoint()
+        cell.set(Value.bomb)
+        self.assertEqual(BOMBTABLE[cell.raw], 1)
+        self.assertEqual(CLOSEDTABLE[cell.raw], 1)
+        cell.set(Flag.guess)
+        self.assertEqual(GUESSTABLE[cell.raw], 1)
+        cell.set(Value.three)
+        self.assertEqual(NUMBERTABLE[cell.raw], 1)
+        self.assertEqual(NUMBERTABLE[Value.barrier], 0)
+
+    def test3(self):
+        """Display characters."""
+        cell = MinePoint()
+        self.assertEqual(CHARTABLE[cell.raw], " ")
+        cell.set(Flag.sure)
+        self.assertEqual(CHARTABLE[cell.raw], "F")
+        cell.set(Mask.opened)
+        cell.set(Value.five)
+        self.assertEqual(CHARTABLE[cell.raw], "5")
+        cell.set(Value.bomb)
+        self.assertEqual(CHARTABLE[cell.raw], "*")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Point tests."""
+
+import pickle
+import unittest
+
+from minesweeper.logic.field import Field
+from minesweeper.util.point import Point, FrozenPoint, PointPool
+
+
+class TestPoint(unittest.TestCase):
+    """Point keeps its API with fast paths."""
+
+    def test1(self):
+        """Creation from different values."""
+        self.assertEqual(Point(1.7, 2), Point((1, 2)))
+        self.assertEqual(Point([3, 4]), Point({'x': 3, 'y': 4}))
+        self.assertEqual(Point(Point(5)), Point(5, 5))
+        with self.assertRaises(ValueError):
+            Point((1, 2, 3))
+        with self.assertRaises(ValueError):
+            Point("1, 2")
+
+    def test2(self):
+        """Arithmetic with points and convertible values."""
+        self.assertEqual(Point(1, 2) + Point(3, 4), Point(4, 6))
+        self.assertEqual(Point(1, 2) + [3, 4], Point(4, 6))
+        self.assertEqual([3, 4] + Point(1, 2), Point(4, 6))
+        self.assertEqual(Point(1, 2) - 1, Point(0, 1))
+        self.assertEqual(5 - Point(1, 2), Point(4, 3))
+        self.assertEqual(-Point(1, 2), Point(-1, -2))
+        self.assertEqual(~Point(1, 2), Point(2, 1))
+        self.assertIs(type(Point(1, 2) + Point(1, 1)), Point)
+
+    def test3(self):
+        """Hashing and set membership."""
+        points = {Point(x, y) for x, y in Point.range([3, 4])}
+        self.assertEqual(len(points), 12)
+        self.assertIn(Point(2, 3), points)
+        self.assertNotIn(Point(3, 2), points)
+        self.assertEqual(hash(Point(1, 2)), hash((1, 2)))
+
+    def test4(self):
+        """Points are mutable and have no dict."""
+        point = Point(1, 2)
+        point.x = 7
+        point[1] = 8.5
+        self.assertEqual(point, Point(7, 8))
+        with self.assertRaises(AttributeError):
+            point.z = 1
+        self.assertEqual(pickle.loads(pickle.dumps(point)), point)
+
+    def test5(self):
+        """Frozen points are immutable but behave like points."""
+        point = FrozenPoint(1, 2)
+        self.assertEqual(point, Point(1, 2))
+        self.assertEqual(hash(point), hash(Point(1, 2)))
+        self.assertIs(type(point + Point(1, 1)), Point)
+        with self.assertRaises(AttributeError):
+            point.x = 3
+        with self.assertRaises(TypeError):
+            point[0] = 3
+        self.assertEqual(pickle.loads(pickle.dumps(point)), point)
+
+    def test6(self):
+        """Pool returns canonical points and counts hits."""
+        pool = PointPool(2)
+        first = pool.get(1, 2)
+        self.assertIs(pool.get((1, 2)), first)
+        self.assertIs(pool.get(Point(1, 2)), first)
+        self.assertEqual((pool.hits, pool.misses), (2, 1))
+        pool.get(3, 4)
+        pool.get(5, 6)
+        self.assertEqual((len(pool), pool.evictions), (2, 1))
+        self.assertNotIn((1, 2), pool)
+        self.assertIsNot(pool.get(1, 2), first)
+        self.assertAlmostEqual(pool.hitRate, 2 / 6)
+
+    def test7(self):
+        """Field gives canonical points with pool."""
+        field = Field(5, 5, 0.2)
+        field.pool = PointPool(None)
+        self.assertIs(field.point(7), field.point(7))
+        self.assertEqual(field.point(7), Point(2, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
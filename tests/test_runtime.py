@@ -0,0 +1,97 @@
+"""Cli asyncio runtime tests."""
+
+import asyncio
+import unittest
+
+from minesweeper.cli.runtime import Runtime
+
+
+class TestRuntime(unittest.TestCase):
+    """Runtime handles keys, frames and background tasks."""
+
+    def test1(self):
+        """Burst of keys gives one redraw."""
+        handled, frames = [], []
+
+        async def main():
+            runtime = Runtime(fps=1000)
+            for key in "dddddddddd":
+                runtime.feed(key)
+            runtime.feed("q")
+
+            def onKey(key):
+                handled.append(key)
+                if key == "q":
+                    runtime.stop()
+
+            await runtime.run(onKey, frames.append)
+
+        asyncio.run(main())
+        self.assertEqual(handled, list("ddddddddddq"))
+        self.assertLessEqual(len(frames), 2)
+        self.assertTrue(frames[0])
+
+    def test2(self):
+        """Awaitable key result runs nested screen and redraws fully after it."""
+        frames, nested = [], []
+
+        async def child(runtime):
+            inner = Runtime()
+            inner.feed("x")
+            inner.feed("q")
+            await inner.run(lambda key: nested.append(key) or key == "q" and inner.stop(),
+                            lambda full: None)
+            runtime.feed("q")
+
+        async def main():
+            runtime = Runtime(fps=1000)
+
+            def onKey(key):
+                if key == "q":
+                    runtime.stop()
+                elif key == "n":
+                    return child(runtime)
+
+            asyncio.get_running_loop().call_later(0.02, runtime.feed, "n")
+            await runtime.run(onKey, frames.append)
+
+        asyncio.run(main())
+        self.assertEqual(nested, ["x", "q"])
+        self.assertEqual(frames.count(True), 2)
+
+    def test3(self):
+        """Background tasks run concurrently and are cancelled on stop."""
+        ticks = []
+
+        async def main():
+            runtime = Runtime(fps=1000)
+            task = runtime.every(0.001, lambda: ticks.append(1))
+            asyncio.get_running_loop().call_later(0.05, runtime.feed, "q")
+            await runtime.run(lambda key: runtime.stop(), lambda full: None)
+            return task
+
+        task = asyncio.run(main())
+        self.assertTrue(task.cancelled())
+        self.assertGreater(len(ticks), 2)
+
+    def test4(self):
+        """Keys pressed between frames come as one batch."""
+        batches = []
+
+        async def main():
+            runtime = Runtime(fps=1000)
+            for key in "wasdq":
+                runtime.feed(key)
+
+            def onKeys(keys):
+                batches.append(keys)
+                runtime.stop()
+
+            await runtime.run(onKeys, lambda full: None, batch=True)
+
+        asyncio.run(main())
+        self.assertEqual(batches, [list("wasdq")])
+
+
+if __name__ == "__main__":
+    unittest.main()
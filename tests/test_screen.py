@@ -0,0 +1,99 @@
+"""Frame buffer renderer tests."""
+
+import contextlib
+import io
+import unittest
+
+from minesweeper.cli.color import Color
+from minesweeper.cli.game import CELLSTYLES, RENDERTABLE, Game
+from minesweeper.cli.screen import FrameBuffer, Screen
+from minesweeper.logic.field import Field
+from minesweeper.util.minepoint import Mask, MinePoint, Value
+
+
+class TestScreen(unittest.TestCase):
+    """Frame buffer writes only changed cells."""
+
+    def tearDown(self):
+        """Draw directly to terminal again."""
+        Screen.frame = None
+
+    def test1(self):
+        """Changed runs are coalesced, unchanged frame writes nothing."""
+        frame = FrameBuffer(5, 2)
+        frame.put(1, 0, "abc", str(Color.red))
+        frame.put(3, 1, "xyz", str(Color.red))
+        stream = io.StringIO()
+        frame.present(stream)
+        red = str(Color.red)
+        self.assertEqual(
+            stream.getvalue(),
+            f"\x1b[1;2H{Color.reset}{red}abc\x1b[2;4Hxy{Color.reset}",
+        )
+        self.assertEqual(frame.present(stream), 0)
+        self.assertEqual(frame[4, 1], ("y", red))
+
+    def test2(self):
+        """Color changes within run, cursor is moved after last column."""
+        frame = FrameBuffer(2, 2)
+        frame.put(0, 0, "ab")
+        frame.put(1, 0, "c", str(Color.blue))
+        frame.put(0, 1, "d")
+        self.assertEqual(
+            frame.render(),
+            f"\x1b[1;1H{Color.reset}a{Color.reset}{Color.blue}c"
+            f"\x1b[2;1H{Color.reset}d",
+        )
+        frame.invalidate()
+        self.assertEqual(frame.render().count("\x1b[1;1H"), 1)
+
+    def test3(self):
+        """Screen draws into shared frame buffer."""
+        screen = Screen().buffer(10, 3)
+        Screen().drawPixel(2, 1, "*", Color.red)
+        screen[0, 2, Color.lime].print("ok")
+        self.assertEqual(Screen.frame[2, 1], ("*", str(Color.red)))
+        self.assertEqual(Screen.frame[1, 2], ("k", str(Color.lime)))
+        self.assertEqual(Screen.frame[3, 1], FrameBuffer.BLANK)
+
+    def test4(self):
+        """Colors are interned and cells render with one lookup."""
+        self.assertIs(Color("red"), Color.red)
+        self.assertIs(Color(244, bg=True), Color.bg.grey)
+        self.assertIs(Color.red + Color.bg.grey, Color("red", "grey"))
+        self.assertEqual(str(Color()), "")
+        raw = MinePoint.apply(MinePoint.apply(0, Value.bomb), Mask.opened)
+        self.assertEqual(RENDERTABLE[raw], (CELLSTYLES[raw][0], str(Color.red)))
+        with self.assertRaises(ValueError):
+            Color("nope")
+        with self.assertRaises(TypeError):
+            Color([1])
+
+    def test5(self):
+        """Cursor is drawn once after several moves between frames."""
+        Screen().buffer(40, 30)
+        game = Game(Field(30, 20, 0.15, seed=1))
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.draw()
+            for key in "aaassd":
+                game.keyAction(key)
+            game.draw()
+        cursor = str(game.cursor)[2:-1]
+        self.assertEqual(sum(cursor in color for _, color in Screen.frame.back), 1)
+
+    def test6(self):
+        """Batched keys give the same game as keys one by one."""
+        keys = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaawwwffxsdd dddddddddddddddddddddddddddddddddsss f"
+        single, batched = (Game(Field(30, 20, 0.15, seed=2)) for _ in range(2))
+        single.pos = batched.pos = single.points.get(15, 10)
+        for key in keys:
+            if single.status == "active":
+                single.keyAction(key)
+        batched.keyActions(keys)
+        self.assertEqual(batched.pos, single.pos)
+        self.assertEqual(batched.field.cells, single.field.cells)
+        self.assertEqual((batched.status, batched.cheats), (single.status, single.cheats))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Vector tests."""
+
+import unittest
+
+from minesweeper.util.coord import Coord
+from minesweeper.util.vector import Vector
+
+
+class TestVector(unittest.TestCase):
+    """Vector is immutable float pair."""
+
+    def test1(self):
+        """Creation from numbers and pairs."""
+        self.assertEqual(Vector(1, 2), (1.0, 2.0))
+        self.assertEqual(Vector((1, 2)), Vector(1, 2))
+        self.assertEqual(Vector(Coord(3, 4)), Vector(3, 4))
+        self.assertIsInstance(Vector(1, 2).x, float)
+        with self.assertRaises(AttributeError):
+            Vector(1, 2).x = 3
+
+    def test2(self):
+        """Arithmetic keeps Vector type."""
+        self.assertEqual(Vector(1, 2) + Vector(3, 4), Vector(4, 6))
+        self.assertEqual((3, 4) + Vector(1, 2), Vector(4, 6))
+        self.assertEqual(Vector(1, 2) - (1, 1), Vector(0, 1))
+        self.assertEqual((5, 5) - Vector(1, 2), Vector(4, 3))
+        self.assertEqual(Vector(1, 2) * 2, Vector(2, 4))
+        self.assertEqual(2 * Vector(1, 2), Vector(2, 4))
+        self.assertEqual(Vector(2, 4) / 2, Vector(1, 2))
+        self.assertEqual(-Vector(1, 2), Vector(-1, -2))
+        self.assertIsInstance((3, 4) + Vector(1, 2), Vector)
+
+    def test3(self):
+        """Distances and batch transform."""
+        self.assertEqual(Vector(3, 4).length(), 5)
+        self.assertEqual(Vector(1, 1).distance(Vector(4, 5)), 5)
+        self.assertEqual(Vector.scaleTranslate([0, 0, 1, 2], 2, 10, 20), [10, 20, 12, 24])
+
+
+if __name__ == "__main__":
+    unittest.main()